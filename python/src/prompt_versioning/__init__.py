@@ -8,15 +8,19 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-from .core import (
-    ExperimentTag,
-    Prompt,
-    PromptCommit,
-    PromptRepository,
-    PromptVersion,
-    StorageBackend,
-)
-from .utils import DiffResult, PromptDiff
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core import (
+        ExperimentTag,
+        Prompt,
+        PromptCommit,
+        PromptRepository,
+        PromptVersion,
+        StorageBackend,
+    )
+    from .utils import DiffResult, PromptDiff
 
 __version__ = "1.0.0"
 __all__ = [
@@ -29,3 +33,30 @@ __all__ = [
     "PromptDiff",
     "DiffResult",
 ]
+
+# Public names are imported on first access (PEP 562) so that entry points
+# such as the CLI do not pay for pydantic and the storage layer up front
+_LAZY_IMPORTS = {
+    "PromptRepository": ".core",
+    "Prompt": ".core",
+    "PromptCommit": ".core",
+    "PromptVersion": ".core",
+    "ExperimentTag": ".core",
+    "StorageBackend": ".core",
+    "PromptDiff": ".utils",
+    "DiffResult": ".utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
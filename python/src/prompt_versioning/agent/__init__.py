@@ -5,24 +5,60 @@ This module provides:
 - PromptVCAgent: Main agent class for conversational interaction
 - AgentResponse: Response object from agent interactions
 - ConversationMessage: Message history tracking
+- ResponseCache: Optional cache of LLM replies for repeated questions
 - LLM backends: OpenAI, Anthropic, Ollama
 
 Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-from .agent import PromptVCAgent, get_default_backend
-from .backends.anthropic_backend import AnthropicBackend
-from .backends.base import LLMBackend
-from .backends.ollama_backend import OllamaBackend
-from .backends.openai_backend import OpenAIBackend
-from .models import AgentResponse, ConversationMessage
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent import PromptVCAgent, get_default_backend
+    from .backends.anthropic_backend import AnthropicBackend
+    from .backends.base import LLMBackend
+    from .backends.ollama_backend import OllamaBackend
+    from .backends.openai_backend import OpenAIBackend
+    from .cache import ResponseCache
+    from .models import AgentResponse, ConversationMessage
+
+# Public names are imported on first access (PEP 562) so that importing the
+# package does not load the agent and backend modules until they are used
+_LAZY_IMPORTS = {
+    "PromptVCAgent": ".agent",
+    "get_default_backend": ".agent",
+    "AgentResponse": ".models",
+    "ConversationMessage": ".models",
+    "ResponseCache": ".cache",
+    "LLMBackend": ".backends.base",
+    "OpenAIBackend": ".backends.openai_backend",
+    "AnthropicBackend": ".backends.anthropic_backend",
+    "OllamaBackend": ".backends.ollama_backend",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     "PromptVCAgent",
     "get_default_backend",
     "AgentResponse",
     "ConversationMessage",
+    "ResponseCache",
     "LLMBackend",
     "OpenAIBackend",
     "AnthropicBackend",
@@ -5,16 +5,41 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-import json
+import os
 import re
+import shlex
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from ..core import PromptRepository
+from ..core.serialization import dumps, loads
 from .backends import AnthropicBackend, LLMBackend, OllamaBackend, OpenAIBackend
+from .cache import CacheKey, ResponseCache
 from .models import AgentResponse, ConversationMessage
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+# Matches promptvc commands inside fenced code blocks in LLM responses
+_COMMAND_RE = re.compile(r"```(?:command|bash|shell)?\s*(promptvc\s+[^`]+)```", re.IGNORECASE)
+
+
+@lru_cache(maxsize=8)
+def _split_system_template(template: str) -> Optional[tuple[str, str, str]]:
+    """
+    Split a system prompt template around its {cwd} and {repo_status} fields.
+
+    Returns None if the template does not contain each field exactly once, in
+    that order, with no other format fields; callers then fall back to str.format.
+    """
+    head, sep, rest = template.partition("{cwd}")
+    middle, sep2, tail = rest.partition("{repo_status}")
+    if not sep or not sep2 or any("{" in part or "}" in part for part in (head, middle, tail)):
+        return None
+    return head, middle, tail
+
 
 class PromptVCAgent:
     """
@@ -24,6 +49,8 @@ class PromptVCAgent:
     Maintains conversation context for multi-turn interactions.
     """
 
+    # Volatile context stays at the end so the leading instructions form a
+    # byte-identical prefix across turns for provider-side prompt caching
     SYSTEM_PROMPT = """You are an expert assistant for a Git-like prompt version control system called promptvc.
 
 Your job is to help users manage their LLM prompts through natural language commands. You can:
@@ -41,17 +68,22 @@ When a user asks you to do something, respond with:
 
 For destructive operations (checkout, etc.), ask for confirmation first.
 
+Be concise, helpful, and precise. Format commands clearly so they can be extracted and executed.
+
 Current working directory: {cwd}
 Repository status: {repo_status}
-
-Be concise, helpful, and precise. Format commands clearly so they can be extracted and executed.
 """
 
+    # Number of recent messages sent to the LLM as context
+    HISTORY_WINDOW = 10
+
     def __init__(
         self,
         backend: Optional[LLMBackend] = None,
         repo_path: str = ".",
         conversation_history: Optional[list[ConversationMessage]] = None,
+        archive_history: bool = True,
+        response_cache: Optional[ResponseCache] = None,
     ):
         """
         Initialize the agent.
@@ -60,10 +92,30 @@ Be concise, helpful, and precise. Format commands clearly so they can be extract
             backend: LLM backend to use (auto-detects if None)
             repo_path: Path to the prompt repository
             conversation_history: Optional existing conversation to resume
+            archive_history: Keep the full conversation (needed for
+                save_conversation). When False, only the last HISTORY_WINDOW
+                messages are retained.
+            response_cache: Optional cache for reusing replies to repeated
+                questions asked in the same context
         """
         self.backend = backend or self._auto_detect_backend()
         self.repo_path = Path(repo_path)
-        self.conversation_history = conversation_history or []
+
+        self.archive_history = archive_history
+        history = conversation_history or []
+        self.conversation_history: list[ConversationMessage] = (
+            history if archive_history else history[-self.HISTORY_WINDOW :]
+        )
+
+        self.response_cache = response_cache
+
+        # Single background worker for save_conversation_async (created on demand)
+        self._save_pool: Optional[ThreadPoolExecutor] = None
+
+        # (cwd, HEAD) -> system message, reused until HEAD moves
+        self._system_message_cache: Optional[tuple[tuple[Path, Optional[str]], dict[str, str]]] = (
+            None
+        )
 
         # Try to load repository
         self.repo: Optional[PromptRepository]
@@ -76,7 +128,8 @@ Be concise, helpful, and precise. Format commands clearly so they can be extract
 
     def _auto_detect_backend(self) -> LLMBackend:
         """Auto-detect available LLM backend."""
-        # Try in order of preference
+        # Try in order of preference. The cloud checks are local (API key and
+        # package lookup), so the Ollama network probe only runs as a last resort.
         backends = [
             ("OpenAI", lambda: OpenAIBackend()),
             ("Anthropic", lambda: AnthropicBackend()),
@@ -113,11 +166,34 @@ Be concise, helpful, and precise. Format commands clearly so they can be extract
         except Exception:
             return "Initialized"
 
+    def _get_head(self) -> Optional[str]:
+        """Read the current HEAD hash, or None if unavailable."""
+        if not self.repo_exists or not self.repo:
+            return None
+
+        try:
+            return self.repo.storage.get_head()
+        except Exception:
+            return None
+
+    def _system_message(self) -> dict[str, str]:
+        """Return the system message for the LLM, rebuilt only when HEAD moves."""
+        key = (Path(os.path.abspath(self.repo_path)), self._get_head())
+        if self._system_message_cache is not None and self._system_message_cache[0] == key:
+            return self._system_message_cache[1]
+
+        parts = _split_system_template(self.SYSTEM_PROMPT)
+        if parts is None:
+            content = self.SYSTEM_PROMPT.format(cwd=key[0], repo_status=self._get_repo_status())
+        else:
+            content = f"{parts[0]}{key[0]}{parts[1]}{self._get_repo_status()}{parts[2]}"
+        message = {"role": "system", "content": content}
+        self._system_message_cache = (key, message)
+        return message
+
     def _build_system_prompt(self) -> str:
         """Build system prompt with current context."""
-        return self.SYSTEM_PROMPT.format(
-            cwd=self.repo_path.resolve(), repo_status=self._get_repo_status()
-        )
+        return self._system_message()["content"]
 
     def _extract_command(self, response: str) -> Optional[tuple[str, dict[str, Any]]]:
         """
@@ -130,9 +206,12 @@ Be concise, helpful, and precise. Format commands clearly so they can be extract
         Returns:
             Tuple of (command_string, parsed_args) or None
         """
+        # Most replies have no code block at all; skip the regex for those
+        if "```" not in response:
+            return None
+
         # Look for code blocks with commands
-        pattern = r"```(?:command|bash|shell)?\s*(promptvc\s+[^`]+)```"
-        match = re.search(pattern, response, re.IGNORECASE)
+        match = _COMMAND_RE.search(response)
 
         if match:
             cmd = match.group(1).strip()
@@ -146,105 +225,222 @@ Be concise, helpful, and precise. Format commands clearly so they can be extract
         """
         Parse promptvc command string into structured arguments.
 
-        Example: "promptvc commit -m 'message' -f file.yaml"
-        Returns: {"action": "commit", "message": "message", "file": "file.yaml"}
+        Example: "promptvc commit -m 'fix typo' -f file.yaml"
+        Returns: {"action": "commit", "m": "fix typo", "f": "file.yaml"}
         """
-        parts = cmd.split()
+        try:
+            parts = shlex.split(cmd)
+        except ValueError:
+            # Unbalanced quotes; fall back to plain whitespace splitting
+            parts = cmd.split()
+
         if not parts or parts[0] != "promptvc":
             return {}
 
         result = {"action": parts[1] if len(parts) > 1 else None}
 
-        # Simple argument parsing
-        i = 2
-        while i < len(parts):
-            if parts[i].startswith("-"):
-                flag = parts[i].lstrip("-")
-                if i + 1 < len(parts) and not parts[i + 1].startswith("-"):
-                    result[flag] = parts[i + 1].strip("'\"")
-                    i += 2
-                else:
+        # Single pass: a flag takes the next token as its value unless that
+        # token is itself a flag, in which case the flag is boolean
+        flag = None
+        for token in parts[2:]:
+            if token.startswith("-"):
+                if flag is not None:
                     result[flag] = "true"
-                    i += 1
-            else:
-                i += 1
+                flag = token.lstrip("-")
+            elif flag is not None:
+                result[flag] = token
+                flag = None
+
+        if flag is not None:
+            result[flag] = "true"
 
         return result
 
-    def process_message(self, user_input: str) -> AgentResponse:
+    def _record(self, message: ConversationMessage) -> None:
+        """Append a message to the history, dropping old ones when not archiving."""
+        self.conversation_history.append(message)
+        if not self.archive_history:
+            del self.conversation_history[: -self.HISTORY_WINDOW]
+
+    def _build_messages(self, user_input: str) -> list[dict[str, str]]:
+        """Record the user message and build the message list for the LLM."""
+        # Add user message to history
+        self._record(ConversationMessage(role="user", content=user_input))
+
+        # System message plus recent conversation history (bounded to avoid token limits)
+        return [self._system_message()] + [
+            msg.llm_dict
+            for msg in self.conversation_history[-self.HISTORY_WINDOW :]
+            if msg.role in ("user", "assistant")
+        ]
+
+    @staticmethod
+    def _cache_key(messages: list[dict[str, str]]) -> CacheKey:
+        """Key a request on the system prompt, previous reply and user input."""
+        previous = messages[-2] if len(messages) > 2 else None
+        previous_reply = previous["content"] if previous and previous["role"] == "assistant" else ""
+        return (messages[0]["content"], previous_reply, messages[-1]["content"])
+
+    def _handle_llm_response(self, llm_response: str) -> AgentResponse:
+        """Record the assistant reply and extract any command from it."""
+        # Store assistant response
+        self._record(ConversationMessage(role="assistant", content=llm_response))
+
+        # Extract command if present
+        command_data = self._extract_command(llm_response)
+
+        if command_data:
+            cmd, args = command_data
+            # Check if destructive operation needs confirmation
+            needs_confirmation = args.get("action") in ["checkout", "init"]
+
+            return AgentResponse(
+                message=llm_response,
+                command=cmd,
+                command_args=args,
+                needs_confirmation=needs_confirmation,
+            )
+        else:
+            return AgentResponse(message=llm_response)
+
+    def _generate(
+        self, messages: list[dict[str, str]], on_token: Optional[Callable[[str], None]]
+    ) -> str:
+        """Call the backend, streaming chunks to on_token when given."""
+        if on_token is None:
+            return self.backend.generate(messages, temperature=0.3)
+
+        chunks = []
+        for chunk in self.backend.stream_generate(messages, temperature=0.3):
+            on_token(chunk)
+            chunks.append(chunk)
+        return "".join(chunks)
+
+    def process_message(
+        self, user_input: str, on_token: Optional[Callable[[str], None]] = None
+    ) -> AgentResponse:
         """
         Process a user message and generate response.
 
         Args:
             user_input: Natural language command from user
+            on_token: Optional callback invoked with each text chunk as it is
+                streamed from the backend
 
         Returns:
             AgentResponse with message and optional command to execute
         """
-        # Add user message to history
-        self.conversation_history.append(ConversationMessage(role="user", content=user_input))
-
-        # Build messages for LLM
-        messages = [{"role": "system", "content": self._build_system_prompt()}]
-
-        # Add conversation history (last 10 messages to avoid token limits)
-        for msg in self.conversation_history[-10:]:
-            if msg.role in ["user", "assistant"]:
-                messages.append({"role": msg.role, "content": msg.content})
+        messages = self._build_messages(user_input)
+        cache = self.response_cache
+        cache_key = self._cache_key(messages)
 
         try:
-            # Generate response
-            llm_response = self.backend.generate(messages, temperature=0.3)
+            # Reuse a cached reply for the same question in the same context
+            llm_response = cache.get(cache_key) if cache is not None else None
+            if llm_response is None:
+                llm_response = self._generate(messages, on_token)
+                if cache is not None:
+                    cache.put(cache_key, llm_response)
+            elif on_token is not None:
+                on_token(llm_response)
 
-            # Store assistant response
-            self.conversation_history.append(
-                ConversationMessage(role="assistant", content=llm_response)
+            return self._handle_llm_response(llm_response)
+
+        except Exception as e:
+            return AgentResponse(
+                message="I encountered an error processing your request.", error=str(e)
             )
 
-            # Extract command if present
-            command_data = self._extract_command(llm_response)
+    async def aprocess_message(self, user_input: str) -> AgentResponse:
+        """
+        Asynchronously process a user message and generate response.
+
+        Args:
+            user_input: Natural language command from user
+
+        Returns:
+            AgentResponse with message and optional command to execute
+        """
+        messages = self._build_messages(user_input)
+        cache = self.response_cache
+        cache_key = self._cache_key(messages)
 
-            if command_data:
-                cmd, args = command_data
-                # Check if destructive operation needs confirmation
-                needs_confirmation = args.get("action") in ["checkout", "init"]
+        try:
+            # Reuse a cached reply for the same question in the same context
+            llm_response = cache.get(cache_key) if cache is not None else None
+            if llm_response is None:
+                llm_response = await self.backend.agenerate(messages, temperature=0.3)
+                if cache is not None:
+                    cache.put(cache_key, llm_response)
 
-                return AgentResponse(
-                    message=llm_response,
-                    command=cmd,
-                    command_args=args,
-                    needs_confirmation=needs_confirmation,
-                )
-            else:
-                return AgentResponse(message=llm_response)
+            return self._handle_llm_response(llm_response)
 
         except Exception as e:
             return AgentResponse(
                 message="I encountered an error processing your request.", error=str(e)
             )
 
-    def save_conversation(self, filepath: Path) -> None:
-        """Save conversation history to JSON file."""
-        data = [
+    def _conversation_records(self) -> list[dict[str, Any]]:
+        """Snapshot conversation history as JSON-serializable records."""
+        return [
             {
                 "role": msg.role,
                 "content": msg.content,
-                "timestamp": msg.timestamp.isoformat(),
+                "timestamp": msg.timestamp,
                 "metadata": msg.metadata,
             }
             for msg in self.conversation_history
         ]
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+    @staticmethod
+    def _write_conversation(filepath: Path, records: list[dict[str, Any]]) -> None:
+        """Write conversation records to a JSON file."""
+        with open(filepath, "wb") as f:
+            f.write(dumps(records, indent=True))
+
+    def save_conversation(self, filepath: Path) -> None:
+        """Save conversation history to JSON file."""
+        self._write_conversation(filepath, self._conversation_records())
+
+    def save_conversation_async(self, filepath: Path) -> "Future[None]":
+        """
+        Save conversation history in a background thread.
+
+        History is snapshotted before returning; serialization and disk I/O run
+        on a single worker, so successive saves are written in order.
+
+        Args:
+            filepath: Destination JSON file
+
+        Returns:
+            Future that completes when the file has been written
+        """
+        if self._save_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._save_pool = ThreadPoolExecutor(max_workers=1)
+
+        return self._save_pool.submit(
+            self._write_conversation, filepath, self._conversation_records()
+        )
+
+    def close(self) -> None:
+        """Wait for pending background saves to finish."""
+        if self._save_pool is not None:
+            self._save_pool.shutdown(wait=True)
+            self._save_pool = None
 
     @classmethod
     def load_conversation(
-        cls, filepath: Path, backend: Optional[LLMBackend] = None, repo_path: str = "."
+        cls,
+        filepath: Path,
+        backend: Optional[LLMBackend] = None,
+        repo_path: str = ".",
+        archive_history: bool = True,
     ) -> "PromptVCAgent":
         """Load conversation history from JSON file."""
-        with open(filepath) as f:
-            data = json.load(f)
+        with open(filepath, "rb") as f:
+            data = loads(f.read())
 
         history = [
             ConversationMessage(
@@ -256,7 +452,12 @@ Be concise, helpful, and precise. Format commands clearly so they can be extract
             for msg in data
         ]
 
-        return cls(backend=backend, repo_path=repo_path, conversation_history=history)
+        return cls(
+            backend=backend,
+            repo_path=repo_path,
+            conversation_history=history,
+            archive_history=archive_history,
+        )
 
 
 def get_default_backend() -> LLMBackend:
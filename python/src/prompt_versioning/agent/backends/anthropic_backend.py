@@ -5,11 +5,24 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import importlib.util
 import os
+from collections.abc import AsyncIterator, Iterator
 from typing import Any, Optional
 
 from .base import LLMBackend
 
+# Cached result of looking up the anthropic SDK (None until first checked)
+_HAS_ANTHROPIC: Optional[bool] = None
+
+
+def _sdk_installed() -> bool:
+    """Check once whether the anthropic package is installed, without importing it."""
+    global _HAS_ANTHROPIC
+    if _HAS_ANTHROPIC is None:
+        _HAS_ANTHROPIC = importlib.util.find_spec("anthropic") is not None
+    return _HAS_ANTHROPIC
+
 
 class AnthropicBackend(LLMBackend):
     """Anthropic API backend (Claude)."""
@@ -25,6 +38,8 @@ class AnthropicBackend(LLMBackend):
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model = model
         self._client: Optional[Any] = None
+        # (event loop, client): async clients are tied to the loop they run on
+        self._async_client: Optional[tuple[Any, Any]] = None
 
     def _get_client(self) -> Any:
         """Lazy-load Anthropic client."""
@@ -39,13 +54,37 @@ class AnthropicBackend(LLMBackend):
                 ) from err
         return self._client
 
-    def generate(
-        self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
-    ) -> str:
-        """Generate completion using Anthropic API."""
-        client = self._get_client()
+    def _get_async_client(self) -> Any:
+        """
+        Lazy-load an async Anthropic client for the running event loop.
+
+        generate_many runs each call on a new loop, and a client reused after
+        its loop has closed fails, so a client is only reused on its own loop.
+        """
+        import asyncio
 
-        # Anthropic uses system parameter separately
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client[0] is not loop:
+            try:
+                import anthropic
+
+                self._async_client = (loop, anthropic.AsyncAnthropic(api_key=self.api_key))
+            except ImportError as err:
+                raise ImportError(
+                    "Anthropic package not installed. Install with: pip install anthropic"
+                ) from err
+        return self._async_client[1]
+
+    @staticmethod
+    def _split_system(
+        messages: list[dict[str, str]],
+    ) -> tuple[Optional[list[dict[str, Any]]], list[dict[str, str]]]:
+        """
+        Separate the system prompt from chat messages (Anthropic takes it separately).
+
+        The system prompt is marked with cache_control so that it can be served
+        from Anthropic's prompt cache on subsequent turns.
+        """
         system_msg = None
         chat_messages = []
 
@@ -55,24 +94,83 @@ class AnthropicBackend(LLMBackend):
             else:
                 chat_messages.append(msg)
 
+        if system_msg is None:
+            return None, chat_messages
+
+        system_blocks = [
+            {"type": "text", "text": system_msg, "cache_control": {"type": "ephemeral"}}
+        ]
+        return system_blocks, chat_messages
+
+    def generate(
+        self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
+    ) -> str:
+        """Generate completion using Anthropic API."""
+        client = self._get_client()
+        system, chat_messages = self._split_system(messages)
+
         response = client.messages.create(
             model=self.model,
             max_tokens=max_tokens,
             temperature=temperature,
-            system=system_msg,
+            system=system,
+            messages=chat_messages,
+        )
+
+        result = response.content[0].text
+        return str(result)
+
+    async def agenerate(
+        self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
+    ) -> str:
+        """Generate completion using the async Anthropic client."""
+        client = self._get_async_client()
+        system, chat_messages = self._split_system(messages)
+
+        response = await client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
             messages=chat_messages,
         )
 
         result = response.content[0].text
         return str(result)
 
+    def stream_generate(
+        self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
+    ) -> Iterator[str]:
+        """Stream completion chunks using Anthropic API."""
+        client = self._get_client()
+        system, chat_messages = self._split_system(messages)
+
+        with client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            messages=chat_messages,
+        ) as stream:
+            yield from stream.text_stream
+
+    async def astream_generate(
+        self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
+    ) -> AsyncIterator[str]:
+        """Stream completion chunks using the async Anthropic client."""
+        client = self._get_async_client()
+        system, chat_messages = self._split_system(messages)
+
+        async with client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            messages=chat_messages,
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
     def is_available(self) -> bool:
         """Check if Anthropic backend is available."""
-        if not self.api_key:
-            return False
-        try:
-            import anthropic  # noqa: F401
-
-            return True
-        except ImportError:
-            return False
+        return self._cached_availability(lambda: bool(self.api_key) and _sdk_installed())
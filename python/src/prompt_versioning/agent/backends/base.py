@@ -5,12 +5,21 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
+from typing import Callable, Optional
+
+# Seconds an is_available() result stays valid before re-probing
+AVAILABILITY_TTL = 60.0
 
 
 class LLMBackend(ABC):
     """Abstract base class for LLM backends."""
 
+    # (monotonic timestamp, result) of the last availability probe
+    _availability: Optional[tuple[float, bool]] = None
+
     @abstractmethod
     def generate(
         self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
@@ -28,7 +37,129 @@ class LLMBackend(ABC):
         """
         pass
 
+    async def agenerate(
+        self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
+    ) -> str:
+        """
+        Asynchronously generate a completion from the LLM.
+
+        The default implementation runs the blocking ``generate`` in a worker
+        thread. Backends with a native async client should override this.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Generated text response
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.generate, messages, temperature, max_tokens)
+
+    async def agenerate_many(
+        self,
+        batches: list[list[dict[str, str]]],
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        max_concurrency: int = 8,
+    ) -> list[str]:
+        """
+        Generate completions for several conversations concurrently.
+
+        Args:
+            batches: One message list per completion
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per completion
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Generated text responses, in the same order as batches
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(messages: list[dict[str, str]]) -> str:
+            async with semaphore:
+                return await self.agenerate(messages, temperature, max_tokens)
+
+        return list(await asyncio.gather(*(run(messages) for messages in batches)))
+
+    def generate_many(
+        self,
+        batches: list[list[dict[str, str]]],
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        max_concurrency: int = 8,
+    ) -> list[str]:
+        """
+        Synchronous wrapper around agenerate_many.
+
+        Must not be called from a running event loop; await agenerate_many instead.
+        """
+        import asyncio
+
+        return asyncio.run(self.agenerate_many(batches, temperature, max_tokens, max_concurrency))
+
+    def stream_generate(
+        self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
+    ) -> Iterator[str]:
+        """
+        Generate a completion, yielding text chunks as they arrive.
+
+        The default implementation yields the full ``generate`` result as a
+        single chunk. Backends that support streaming should override this.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Text chunks of the generated response
+        """
+        yield self.generate(messages, temperature, max_tokens)
+
+    async def astream_generate(
+        self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously generate a completion, yielding text chunks as they arrive.
+
+        The default implementation yields the full ``agenerate`` result as a
+        single chunk.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Text chunks of the generated response
+        """
+        yield await self.agenerate(messages, temperature, max_tokens)
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if this backend is properly configured and available."""
         pass
+
+    def _cached_availability(self, probe: Callable[[], bool]) -> bool:
+        """
+        Return the cached result of ``probe`` if it is younger than AVAILABILITY_TTL.
+
+        Args:
+            probe: Callable performing the actual availability check
+
+        Returns:
+            Whether the backend is available
+        """
+        now = time.monotonic()
+        if self._availability is not None and now - self._availability[0] < AVAILABILITY_TTL:
+            return self._availability[1]
+
+        available = probe()
+        self._availability = (now, available)
+        return available
@@ -5,10 +5,16 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-from typing import Any
+import json
+import threading
+from collections.abc import Iterator
+from typing import Any, Optional
 
 from .base import LLMBackend
 
+# Prompt labels for the standard chat roles
+_ROLE_LABELS = {"system": "System", "user": "User", "assistant": "Assistant"}
+
 
 class OllamaBackend(LLMBackend):
     """Local Ollama backend for privacy-focused deployments."""
@@ -23,50 +29,83 @@ class OllamaBackend(LLMBackend):
         """
         self.model = model
         self.host = host
+        # One session per thread: agenerate_many runs generate on several worker
+        # threads and requests.Session is not thread-safe
+        self._sessions = threading.local()
+
+    def _get_session(self) -> Any:
+        """Lazy-load this thread's requests session (keeps the connection to the server alive)."""
+        session: Optional[Any] = getattr(self._sessions, "session", None)
+        if session is None:
+            try:
+                import requests
+            except ImportError as err:
+                raise ImportError(
+                    "Requests package not installed. Install with: pip install requests"
+                ) from err
+
+            session = self._sessions.session = requests.Session()
+        return session
+
+    def _build_payload(
+        self, messages: list[dict[str, str]], temperature: float, max_tokens: int, stream: bool
+    ) -> dict[str, Any]:
+        """Build the /api/generate request body."""
+        return {
+            "model": self.model,
+            "prompt": self._format_messages(messages),
+            "stream": stream,
+            "options": {"temperature": temperature, "num_predict": max_tokens},
+        }
 
     def generate(
         self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
     ) -> str:
         """Generate completion using Ollama."""
-        try:
-            import requests
-        except ImportError as err:
-            raise ImportError(
-                "Requests package not installed. Install with: pip install requests"
-            ) from err
-
-        # Convert messages to Ollama format
-        prompt = self._format_messages(messages)
-
-        response = requests.post(
+        response = self._get_session().post(
             f"{self.host}/api/generate",
-            json={
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {"temperature": temperature, "num_predict": max_tokens},
-            },
+            json=self._build_payload(messages, temperature, max_tokens, stream=False),
         )
 
         response.raise_for_status()
         result: dict[str, Any] = response.json()
         return str(result["response"])
 
+    def stream_generate(
+        self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
+    ) -> Iterator[str]:
+        """Stream completion chunks using Ollama."""
+        with self._get_session().post(
+            f"{self.host}/api/generate",
+            json=self._build_payload(messages, temperature, max_tokens, stream=True),
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            # Ollama streams one JSON object per line
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk: dict[str, Any] = json.loads(line)
+                yield str(chunk.get("response", ""))
+                if chunk.get("done"):
+                    break
+
     def _format_messages(self, messages: list[dict[str, str]]) -> str:
         """Convert chat messages to a single prompt string."""
-        parts = []
-        for msg in messages:
-            role = msg["role"].capitalize()
-            content = msg["content"]
-            parts.append(f"{role}: {content}")
-        return "\n\n".join(parts) + "\n\nAssistant:"
+        body = "\n\n".join(
+            f"{_ROLE_LABELS.get(msg['role']) or msg['role'].capitalize()}: {msg['content']}"
+            for msg in messages
+        )
+        return body + "\n\nAssistant:"
 
     def is_available(self) -> bool:
         """Check if Ollama server is running."""
-        try:
-            import requests
+        return self._cached_availability(self._probe_server)
 
-            response = requests.get(f"{self.host}/api/tags", timeout=2)
+    def _probe_server(self) -> bool:
+        """Ping the Ollama server."""
+        try:
+            response = self._get_session().get(f"{self.host}/api/tags", timeout=2)
             is_available: bool = response.status_code == 200
             return is_available
         except Exception:
@@ -5,11 +5,24 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import importlib.util
 import os
+from collections.abc import AsyncIterator, Iterator
 from typing import Any, Optional
 
 from .base import LLMBackend
 
+# Cached result of looking up the openai SDK (None until first checked)
+_HAS_OPENAI: Optional[bool] = None
+
+
+def _sdk_installed() -> bool:
+    """Check once whether the openai package is installed, without importing it."""
+    global _HAS_OPENAI
+    if _HAS_OPENAI is None:
+        _HAS_OPENAI = importlib.util.find_spec("openai") is not None
+    return _HAS_OPENAI
+
 
 class OpenAIBackend(LLMBackend):
     """OpenAI API backend (GPT-4, GPT-3.5, etc.)."""
@@ -25,6 +38,8 @@ class OpenAIBackend(LLMBackend):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model
         self._client: Optional[Any] = None
+        # (event loop, client): async clients are tied to the loop they run on
+        self._async_client: Optional[tuple[Any, Any]] = None
 
     def _get_client(self) -> Any:
         """Lazy-load OpenAI client."""
@@ -39,6 +54,27 @@ class OpenAIBackend(LLMBackend):
                 ) from err
         return self._client
 
+    def _get_async_client(self) -> Any:
+        """
+        Lazy-load an async OpenAI client for the running event loop.
+
+        generate_many runs each call on a new loop, and a client reused after
+        its loop has closed fails, so a client is only reused on its own loop.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client[0] is not loop:
+            try:
+                import openai
+
+                self._async_client = (loop, openai.AsyncOpenAI(api_key=self.api_key))
+            except ImportError as err:
+                raise ImportError(
+                    "OpenAI package not installed. Install with: pip install openai"
+                ) from err
+        return self._async_client[1]
+
     def generate(
         self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
     ) -> str:
@@ -52,13 +88,55 @@ class OpenAIBackend(LLMBackend):
         result = response.choices[0].message.content
         return str(result) if result else ""
 
+    async def agenerate(
+        self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
+    ) -> str:
+        """Generate completion using the async OpenAI client."""
+        client = self._get_async_client()
+
+        response = await client.chat.completions.create(
+            model=self.model, messages=messages, temperature=temperature, max_tokens=max_tokens
+        )
+
+        result = response.choices[0].message.content
+        return str(result) if result else ""
+
+    def stream_generate(
+        self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
+    ) -> Iterator[str]:
+        """Stream completion chunks using OpenAI API."""
+        client = self._get_client()
+
+        stream = client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+
+        for chunk in stream:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+
+    async def astream_generate(
+        self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 500
+    ) -> AsyncIterator[str]:
+        """Stream completion chunks using the async OpenAI client."""
+        client = self._get_async_client()
+
+        stream = await client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+
+        async for chunk in stream:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+
     def is_available(self) -> bool:
         """Check if OpenAI backend is available."""
-        if not self.api_key:
-            return False
-        try:
-            import openai  # noqa: F401
-
-            return True
-        except ImportError:
-            return False
+        return self._cached_availability(lambda: bool(self.api_key) and _sdk_installed())
@@ -0,0 +1,63 @@
+"""
+Response cache for the LLM agent.
+
+Copyright (c) 2025 Prompt Versioning Contributors
+Licensed under MIT License
+"""
+
+import time
+from collections import OrderedDict
+from typing import Optional
+
+CacheKey = tuple[str, ...]
+
+
+class ResponseCache:
+    """
+    LRU cache of LLM replies keyed on the conversation prefix.
+
+    The agent keys entries on the system prompt (which embeds the repository
+    HEAD), the previous assistant reply and the user input, so a repeated
+    question in the same context skips the LLM round-trip, while follow-ups
+    such as "yes" are only reused after the same preceding reply.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached replies (least recently used evicted)
+            ttl: Seconds a cached reply stays valid
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[CacheKey, tuple[float, str]] = OrderedDict()
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        """Return the cached reply for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, response = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: CacheKey, response: str) -> None:
+        """Store a reply, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached replies."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -7,6 +7,7 @@ Licensed under MIT License
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Optional
 
 
@@ -19,6 +20,11 @@ class ConversationMessage:
     timestamp: datetime = field(default_factory=datetime.now)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    @cached_property
+    def llm_dict(self) -> dict[str, str]:
+        """Message in the role/content form expected by LLM backends (built once)."""
+        return {"role": self.role, "content": self.content}
+
 
 @dataclass
 class AgentResponse:
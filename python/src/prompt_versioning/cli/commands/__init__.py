@@ -1,23 +1,30 @@
 """
 CLI commands module.
 
+Each command lives in its own submodule; they are imported on first access so
+that running one command does not load the dependencies of all the others.
+
 Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-from .agent import agent
-from .audit import audit
-from .checkout import checkout
-from .commit import commit
-from .create_prompt import create_prompt
-from .diff import diff
-from .init import init
-from .log import log
-from .mcp import mcp_server
-from .mcp_setup import mcp_setup
-from .status import status
-from .tag import tag
-from .tags import tags
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent import agent
+    from .audit import audit
+    from .checkout import checkout
+    from .commit import commit
+    from .create_prompt import create_prompt
+    from .diff import diff
+    from .init import init
+    from .log import log
+    from .mcp import mcp_server
+    from .mcp_setup import mcp_setup
+    from .status import status
+    from .tag import tag
+    from .tags import tags
 
 __all__ = [
     "init",
@@ -34,3 +41,34 @@ __all__ = [
     "mcp_server",
     "mcp_setup",
 ]
+
+# Command object name -> submodule defining it
+_COMMAND_MODULES = {
+    "init": ".init",
+    "commit": ".commit",
+    "log": ".log",
+    "diff": ".diff",
+    "checkout": ".checkout",
+    "tag": ".tag",
+    "tags": ".tags",
+    "status": ".status",
+    "audit": ".audit",
+    "agent": ".agent",
+    "create_prompt": ".create_prompt",
+    "mcp_server": ".mcp",
+    "mcp_setup": ".mcp_setup",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _COMMAND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_COMMAND_MODULES))
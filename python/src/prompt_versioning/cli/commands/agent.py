@@ -10,7 +10,7 @@ from typing import Any, Optional
 
 import click
 
-from ..utils import error, execute_shell_command
+from ..utils import error, execute_command
 
 
 @click.command()
@@ -98,14 +98,20 @@ def agent(
             elif backend == "ollama":
                 llm_backend = OllamaBackend(model=model or "llama3.2")
 
-        # Load or create agent
+        # Load or create agent (full history is only kept when it will be saved)
+        archive_history = bool(save_conversation)
         if load_conversation and Path(load_conversation).exists():
             agent_obj = PromptVCAgent.load_conversation(
-                Path(load_conversation), backend=llm_backend, repo_path=path
+                Path(load_conversation),
+                backend=llm_backend,
+                repo_path=path,
+                archive_history=archive_history,
             )
             click.echo(f"✓ Resumed conversation from {load_conversation}")
         else:
-            agent_obj = PromptVCAgent(backend=llm_backend, repo_path=path)
+            agent_obj = PromptVCAgent(
+                backend=llm_backend, repo_path=path, archive_history=archive_history
+            )
 
         # Show backend info
         backend_name = type(agent_obj.backend).__name__.replace("Backend", "")
@@ -128,25 +134,34 @@ def agent(
                         return
 
                 click.echo(f"\n▶ Executing: {response.command}")
-                execute_shell_command(response.command)
+                execute_command(response.command)
 
             return
 
         # Interactive REPL mode
         if interactive or not query:
-            _run_interactive_agent(agent_obj, path)
+            checkpoint = Path(save_conversation) if save_conversation else None
+            _run_interactive_agent(agent_obj, path, checkpoint)
 
             # Save conversation on exit
-            if save_conversation:
-                agent_obj.save_conversation(Path(save_conversation))
+            if checkpoint:
+                agent_obj.close()
+                agent_obj.save_conversation(checkpoint)
                 click.echo(f"\n✓ Saved conversation to {save_conversation}")
 
     except RuntimeError as e:
         error(str(e))
 
 
-def _run_interactive_agent(agent_obj: Any, repo_path: str) -> None:
-    """Run interactive REPL mode for the agent."""
+def _run_interactive_agent(
+    agent_obj: Any, repo_path: str, checkpoint: Optional[Path] = None
+) -> None:
+    """
+    Run interactive REPL mode for the agent.
+
+    If checkpoint is given, the conversation is saved there in the background
+    after every turn so it survives a crash.
+    """
     click.echo("Interactive mode (type 'exit', 'quit', or press Ctrl+C to exit)\n")
 
     while True:
@@ -160,11 +175,17 @@ def _run_interactive_agent(agent_obj: Any, repo_path: str) -> None:
             if not user_input:
                 continue
 
-            # Process message
-            response = agent_obj.process_message(user_input)
+            # Process message, printing the reply as it streams in
+            click.echo("\n🤖 Assistant:")
+            response = agent_obj.process_message(
+                user_input, on_token=lambda chunk: click.echo(chunk, nl=False)
+            )
+            if response.error:
+                click.echo(response.message, nl=False)
+            click.echo("\n")
 
-            # Display response
-            click.echo(f"\n🤖 Assistant:\n{response.message}\n")
+            if checkpoint:
+                agent_obj.save_conversation_async(checkpoint)
 
             # Handle command execution
             if response.command:
@@ -174,7 +195,7 @@ def _run_interactive_agent(agent_obj: Any, repo_path: str) -> None:
                         continue
 
                 click.echo(f"▶ Executing: {response.command}\n")
-                execute_shell_command(response.command)
+                execute_command(response.command)
                 click.echo()
 
             if response.error:
@@ -216,7 +237,7 @@ def _run_create_prompt_mode(agent_obj: Any, repo_path: str) -> None:
 
                     if click.confirm("Execute this command to create the prompt?", default=True):
                         click.echo()
-                        execute_shell_command(response.command)
+                        execute_command(response.command)
                         click.echo("\n✨ Prompt file created successfully!")
                         break
                     else:
@@ -230,7 +251,7 @@ def _run_create_prompt_mode(agent_obj: Any, repo_path: str) -> None:
                             continue
 
                     click.echo(f"▶ Executing: {response.command}\n")
-                    execute_shell_command(response.command)
+                    execute_command(response.command)
                     click.echo()
 
             if response.error:
@@ -5,7 +5,6 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
@@ -18,22 +17,36 @@ from ..utils import ensure_repository, success
 @click.option(
     "--format",
     "format_type",
-    type=click.Choice(["json", "csv"], case_sensitive=False),
+    type=click.Choice(["json", "jsonl", "csv"], case_sensitive=False),
     default="json",
     help="Output format",
 )
 @click.option("--output", "-o", help="Output file path")
 @click.option("--path", default=".", help="Repository path")
 def audit(format_type: str, output: Optional[str], path: str) -> None:
-    """Generate compliance audit log."""
+    """Generate compliance audit log.
+
+    Use --format jsonl for large logs: entries are streamed one per line
+    instead of being collected into a single JSON array.
+    """
     repo = ensure_repository(path)
-    audit_data = repo.audit_log(format=format_type.lower())
+    format_type = format_type.lower()
+
+    if format_type == "jsonl":
+        if output:
+            with Path(output).open("wb") as f:
+                f.writelines(repo.iter_audit_log())
+            success(f"Exported audit log to {output}")
+        else:
+            for line in repo.iter_audit_log():
+                click.echo(line, nl=False)
+        return
 
-    # Convert to string if necessary
-    audit_str = audit_data if isinstance(audit_data, str) else json.dumps(audit_data, indent=2)
+    data = str(repo.audit_log(format=format_type)).encode()
 
     if output:
-        Path(output).write_text(audit_str)
+        Path(output).write_bytes(data)
         success(f"Exported audit log to {output}")
     else:
-        click.echo(audit_str)
+        # Bytes go straight to the binary stdout stream, skipping re-encoding
+        click.echo(data)
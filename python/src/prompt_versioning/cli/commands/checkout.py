@@ -10,8 +10,8 @@ from pathlib import Path
 from typing import Optional
 
 import click
-import yaml
 
+from ...core.serialization import dump_yaml
 from ..utils import ensure_repository, error
 
 
@@ -59,7 +59,7 @@ def checkout(
             if output_file.endswith(".json"):
                 output_path.write_text(json.dumps(prompt_data, indent=2))
             else:
-                output_path.write_text(yaml.dump(prompt_data, sort_keys=False))
+                output_path.write_text(dump_yaml(prompt_data, sort_keys=False))
 
             click.echo(f"✓ Wrote prompt to {output_file}")
 
@@ -9,8 +9,8 @@ from pathlib import Path
 from typing import Any, Optional
 
 import click
-import yaml
 
+from ...core.serialization import dump_yaml, load_yaml
 from ..utils import error, success
 from ..utils.constants import DEFAULT_PROMPTS_DIR
 
@@ -74,7 +74,7 @@ def create_prompt(
         if file_path_obj.exists():
             if append:
                 with open(file_path_obj) as f:
-                    existing_data = yaml.safe_load(f) or {}
+                    existing_data = load_yaml(f) or {}
                 click.echo(f"📝 Appending to existing file: {file_path_obj}")
             else:
                 if not click.confirm(
@@ -234,17 +234,16 @@ def create_prompt(
         # Create directory if it doesn't exist
         file_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to file
-        with open(file_path_obj, "w") as f:
-            yaml.dump(prompt_data, f, default_flow_style=False, sort_keys=False)
+        # Serialize once and reuse the text for both the file and the preview
+        serialized = dump_yaml(prompt_data, sort_keys=False)
+        file_path_obj.write_text(serialized)
 
         success(f"Prompt file {'updated' if append else 'created'}: {file_path_obj}")
 
         # Show preview
         click.echo("\n📄 File contents:")
         click.echo("-" * 50)
-        with open(file_path_obj) as f:
-            click.echo(f.read())
+        click.echo(serialized)
         click.echo("-" * 50)
 
     except KeyboardInterrupt:
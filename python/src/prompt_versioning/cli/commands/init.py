@@ -5,7 +5,7 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-from pathlib import Path
+import os
 
 import click
 
@@ -19,6 +19,6 @@ def init(path: str) -> None:
     """Initialize a new prompt repository."""
     try:
         init_repository(path)
-        success(f"Initialized prompt repository in {Path(path).resolve()}/.promptvc/")
+        success(f"Initialized prompt repository in {os.path.abspath(path)}/.prompt-vc/")
     except FileExistsError as e:
         error(str(e))
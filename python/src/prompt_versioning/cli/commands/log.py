@@ -25,19 +25,24 @@ def log(max_count: Optional[int], oneline: bool, path: str) -> None:
         click.echo("No commits yet")
         return
 
+    # Build the whole listing and write it once rather than echoing per line
+    lines = []
     for version in versions:
+        commit = version.commit
         if oneline:
-            file_info = f" ({version.commit.file_path})" if version.commit.file_path else ""
-            click.echo(f"{version.commit.short_hash()} {version.commit.message}{file_info}")
+            file_info = f" ({commit.file_path})" if commit.file_path else ""
+            lines.append(f"{commit.short_hash()} {commit.message}{file_info}")
         else:
-            click.echo(f"commit {version.commit.hash}")
-            click.echo(f"Author: {version.commit.author}")
-            click.echo(f"Date: {version.commit.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append(f"commit {commit.hash}")
+            lines.append(f"Author: {commit.author}")
+            lines.append(f"Date: {commit.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
 
-            if version.commit.file_path:
-                click.echo(f"File: {version.commit.file_path}")
+            if commit.file_path:
+                lines.append(f"File: {commit.file_path}")
 
-            if version.commit.tags:
-                click.echo(f"Tags: {', '.join(version.commit.tags)}")
+            if commit.tags:
+                lines.append(f"Tags: {', '.join(commit.tags)}")
 
-            click.echo(f"\n    {version.commit.message}\n")
+            lines.append(f"\n    {commit.message}\n")
+
+    click.echo("\n".join(lines))
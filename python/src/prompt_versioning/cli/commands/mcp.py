@@ -5,7 +5,7 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-from pathlib import Path
+import os
 from typing import Optional
 
 import click
@@ -49,14 +49,15 @@ def mcp_server(path: str, transport: str, host: str, port: int, auth_token: Opti
         from ...mcp import PromptVCMCPServer
 
         click.echo("🚀 Starting Prompt Version Control MCP Server...")
-        click.echo(f"   Repository: {Path(path).resolve()}")
+        repo_path = os.path.abspath(path)
+        click.echo(f"   Repository: {repo_path}")
         click.echo(f"   Transport: {transport}")
 
         if auth_token:
             click.echo("   Authentication: Enabled")
 
         # Create server
-        server = PromptVCMCPServer(repo_path=str(Path(path).resolve()), auth_token=auth_token)
+        server = PromptVCMCPServer(repo_path=repo_path, auth_token=auth_token)
 
         # Run server based on transport
         if transport == "stdio":
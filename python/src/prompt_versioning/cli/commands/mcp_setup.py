@@ -6,12 +6,15 @@ Licensed under MIT License
 """
 
 import json
+import os
 import sys
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
 import click
 
+from ...core.storage.filesystem import atomic_write
 from ..utils import error, info, success
 
 
@@ -52,62 +55,44 @@ def mcp_setup(ide: str, path: str, output: Optional[str], init: bool) -> None:
         promptvc mcp-setup --ide vscode -o ./my-config.json
     """
     try:
-        # Resolve repository path
-        repo_path = Path(path).resolve()
+        # Absolute repository path (symlinks need not be resolved for the config)
+        repo_path = Path(os.path.abspath(path))
 
-        # Check if repository exists
-        from ...core import PromptRepository
-
-        repo_exists = (repo_path / ".promptvc").exists()
+        # Check if repository exists (single stat)
+        repo_exists = os.path.isdir(repo_path / ".prompt-vc")
 
         if not repo_exists:
             if init:
+                from ...core import PromptRepository
+
                 # Auto-initialize the repository
                 try:
                     PromptRepository.init(repo_path)
-                    success(f"Initialized repository at {repo_path}/.promptvc/")
+                    success(f"Initialized repository at {repo_path}/.prompt-vc/")
                     repo_exists = True
                 except Exception as e:
                     error(f"Failed to initialize repository: {e}")
                     return
             else:
                 # Warn but continue - MCP server can initialize later
-                click.echo(f"⚠️  Repository not found at {repo_path}/.promptvc/")
+                click.echo(f"⚠️  Repository not found at {repo_path}/.prompt-vc/")
                 click.echo(f"   You can initialize it later with: promptvc init --path {repo_path}")
                 click.echo("   Or ask Copilot: @workspace /prompt-version initialize repository")
                 click.echo()
 
         # Generate configuration based on IDE
-        if ide == "vscode":
-            config = _generate_vscode_config(repo_path)
-            default_output = Path(".vscode/mcp-config.json")
-            config_type = "VSCode MCP"
-
-        elif ide == "claude":
-            config = _generate_claude_config(repo_path)
-            if sys.platform == "darwin":  # macOS
-                default_output = (
-                    Path.home() / "Library/Application Support/Claude/claude_desktop_config.json"
-                )
-            elif sys.platform == "win32":  # Windows
-                default_output = Path.home() / "AppData/Roaming/Claude/claude_desktop_config.json"
-            else:  # Linux
-                default_output = Path.home() / ".config/claude/claude_desktop_config.json"
-            config_type = "Claude Desktop MCP"
-
-        elif ide == "zed":
-            config = _generate_zed_config(repo_path)
-            default_output = Path.home() / ".config/zed/settings.json"
-            config_type = "Zed MCP"
+        config = _render_config(ide, repo_path)
+        config_type = _CONFIG_TYPES[ide]
 
-        # Determine output path
-        output_path = Path(output) if output else default_output
+        # Determine output path (only look up the home directory when needed)
+        output_path = Path(output) if output else _default_config_path(ide)
 
         # Create directory if needed
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write configuration
-        output_path.write_text(json.dumps(config, indent=2))
+        # Write configuration atomically so an interrupted run never leaves
+        # a truncated IDE config behind
+        atomic_write(output_path, config)
 
         success(f"Generated {config_type} configuration")
         info(f"  Location: {output_path}")
@@ -140,41 +125,87 @@ def mcp_setup(ide: str, path: str, output: Optional[str], init: bool) -> None:
         error(f"Failed to generate configuration: {e}")
 
 
-def _generate_vscode_config(repo_path: Path) -> dict:
+@cache
+def _default_config_path(ide: str) -> Path:
+    """Return the default configuration file location for an IDE."""
+    if ide == "vscode":
+        return Path(".vscode/mcp-config.json")
+
+    # Prefer the environment over Path.home(), which may query the user database
+    home_env = os.environ.get("USERPROFILE" if sys.platform == "win32" else "HOME")
+    home = Path(home_env) if home_env else Path.home()
+
+    if ide == "claude":
+        if sys.platform == "darwin":  # macOS
+            return home / "Library/Application Support/Claude/claude_desktop_config.json"
+        if sys.platform == "win32":  # Windows
+            return home / "AppData/Roaming/Claude/claude_desktop_config.json"
+        return home / ".config/claude/claude_desktop_config.json"  # Linux
+
+    return home / ".config/zed/settings.json"
+
+
+def _generate_vscode_config(repo_path: str) -> dict:
     """Generate VSCode MCP configuration."""
     return {
         "mcpServers": {
             "promptvc": {
                 "command": "python",
-                "args": ["-m", "prompt_versioning.cli", "mcp-server", "--path", str(repo_path)],
+                "args": ["-m", "prompt_versioning.cli", "mcp-server", "--path", repo_path],
                 "env": {"PROMPTVC_MCP_TOKEN": "${env:PROMPTVC_MCP_TOKEN}"},
             }
         }
     }
 
 
-def _generate_claude_config(repo_path: Path) -> dict:
+def _generate_claude_config(repo_path: str) -> dict:
     """Generate Claude Desktop MCP configuration."""
     return {
         "mcpServers": {
             "promptvc": {
                 "command": "python",
-                "args": ["-m", "prompt_versioning.cli", "mcp-server", "--path", str(repo_path)],
+                "args": ["-m", "prompt_versioning.cli", "mcp-server", "--path", repo_path],
                 "env": {"PROMPTVC_MCP_TOKEN": ""},
             }
         }
     }
 
 
-def _generate_zed_config(repo_path: Path) -> dict:
+def _generate_zed_config(repo_path: str) -> dict:
     """Generate Zed MCP configuration."""
     return {
         "context_servers": {
             "promptvc": {
                 "command": {
                     "path": "python",
-                    "args": ["-m", "prompt_versioning.cli", "mcp-server", "--path", str(repo_path)],
+                    "args": ["-m", "prompt_versioning.cli", "mcp-server", "--path", repo_path],
                 }
             }
         }
     }
+
+
+_CONFIG_TYPES = {
+    "vscode": "VSCode MCP",
+    "claude": "Claude Desktop MCP",
+    "zed": "Zed MCP",
+}
+
+# Configs are serialized once at import with a placeholder for the repository
+# path; rendering is then a single bytes substitution
+_REPO_PATH_PLACEHOLDER = "__PROMPTVC_REPO_PATH__"
+_CONFIG_TEMPLATES = {
+    ide: json.dumps(generate(_REPO_PATH_PLACEHOLDER), indent=2).encode()
+    for ide, generate in (
+        ("vscode", _generate_vscode_config),
+        ("claude", _generate_claude_config),
+        ("zed", _generate_zed_config),
+    )
+}
+
+
+def _render_config(ide: str, repo_path: Path) -> bytes:
+    """Return the serialized MCP configuration for an IDE and repository."""
+    # JSON-escape the path (backslashes, quotes) and drop the surrounding quotes
+    escaped_path = json.dumps(str(repo_path))[1:-1].encode()
+    return _CONFIG_TEMPLATES[ide].replace(_REPO_PATH_PLACEHOLDER.encode(), escaped_path)
@@ -27,14 +27,19 @@ def status(path: str) -> None:
         click.echo("No commits yet")
         return
 
-    click.echo("Current version:")
-    click.echo(f"  Commit: {current.commit.short_hash()}")
-    click.echo(f"  Message: {current.commit.message}")
-    click.echo(f"  Author: {current.commit.author}")
-    click.echo(f"  Date: {current.commit.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-
-    if current.commit.file_path:
-        click.echo(f"  File: {current.commit.file_path}")
-
-    if current.commit.tags:
-        click.echo(f"  Tags: {', '.join(current.commit.tags)}")
+    commit = current.commit
+    lines = [
+        "Current version:",
+        f"  Commit: {commit.short_hash()}",
+        f"  Message: {commit.message}",
+        f"  Author: {commit.author}",
+        f"  Date: {commit.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
+    ]
+
+    if commit.file_path:
+        lines.append(f"  File: {commit.file_path}")
+
+    if commit.tags:
+        lines.append(f"  Tags: {', '.join(commit.tags)}")
+
+    click.echo("\n".join(lines))
@@ -5,7 +5,10 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import heapq
 import json
+from operator import attrgetter
+from typing import Optional
 
 import click
 
@@ -13,8 +16,11 @@ from ..utils import ensure_repository
 
 
 @click.command()
+@click.option(
+    "--max-count", "-n", type=click.IntRange(min=1), help="Limit number of tags (newest first)"
+)
 @click.option("--path", default=".", help="Repository path")
-def tags(path: str) -> None:
+def tags(max_count: Optional[int], path: str) -> None:
     """List all tags."""
     repo = ensure_repository(path)
     tag_list = repo.list_tags()
@@ -23,8 +29,18 @@ def tags(path: str) -> None:
         click.echo("No tags yet")
         return
 
-    for tag_obj in sorted(tag_list, key=lambda t: t.created_at, reverse=True):
-        click.echo(f"{tag_obj.name} -> {tag_obj.commit_hash[:7]}")
+    by_created = attrgetter("created_at")
+    if max_count:
+        newest = heapq.nlargest(max_count, tag_list, key=by_created)
+    else:
+        newest = sorted(tag_list, key=by_created, reverse=True)
+
+    # Build the whole listing and write it once rather than echoing per line
+    lines = []
+    for tag_obj in newest:
+        lines.append(f"{tag_obj.name} -> {tag_obj.commit_hash[:7]}")
 
         if tag_obj.metadata:
-            click.echo(f"  Metadata: {json.dumps(tag_obj.metadata, indent=2)}")
+            lines.append(f"  Metadata: {json.dumps(tag_obj.metadata, indent=2)}")
+
+    click.echo("\n".join(lines))
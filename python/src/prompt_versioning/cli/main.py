@@ -5,26 +5,61 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+from importlib import import_module
+from typing import Any, Optional
+
 import click
 
-from .commands import (
-    agent,
-    audit,
-    checkout,
-    commit,
-    create_prompt,
-    diff,
-    init,
-    log,
-    mcp_server,
-    mcp_setup,
-    status,
-    tag,
-    tags,
-)
-
-
-@click.group()
+# Command name -> command object exported by cli.commands
+COMMANDS = {
+    "init": "init",
+    "commit": "commit",
+    "log": "log",
+    "diff": "diff",
+    "checkout": "checkout",
+    "tag": "tag",
+    "tags": "tags",
+    "status": "status",
+    "audit": "audit",
+    "agent": "agent",
+    "create-prompt": "create_prompt",
+    "mcp-server": "mcp_server",
+    "mcp-setup": "mcp_setup",
+}
+
+
+class LazyGroup(click.Group):
+    """
+    Click group that imports a subcommand's module only when it is invoked.
+
+    Keeps startup cheap: running `promptvc status` does not load the agent,
+    MCP or yaml dependencies of the other commands.
+    """
+
+    def __init__(
+        self, *args: Any, lazy_commands: Optional[dict[str, str]] = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+
+        # Resolve through the package's lazy exports, which import the defining
+        # submodule and rebind the name to the command rather than the module
+        commands = import_module(".commands", __package__)
+        command: click.Command = getattr(commands, self.lazy_commands[cmd_name])
+        self.add_command(command, cmd_name)
+        # pop, not del: the MCP server may resolve the same command from two threads
+        self.lazy_commands.pop(cmd_name, None)
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_commands=dict(COMMANDS))
 @click.version_option(version="1.0.0", prog_name="promptvc")
 def cli() -> None:
     """
@@ -35,22 +70,6 @@ def cli() -> None:
     pass
 
 
-# Register all commands
-cli.add_command(init)
-cli.add_command(commit)
-cli.add_command(log)
-cli.add_command(diff)
-cli.add_command(checkout)
-cli.add_command(tag)
-cli.add_command(tags)
-cli.add_command(status)
-cli.add_command(audit)
-cli.add_command(agent)
-cli.add_command(create_prompt)
-cli.add_command(mcp_server)
-cli.add_command(mcp_setup)
-
-
 def main() -> None:
     """Entry point for the CLI."""
     cli()
@@ -5,14 +5,19 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-from .execution import execute_shell_command
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .output import error, info, section, success, warning
-from .validation import (
-    ensure_repository,
-    parse_json_string,
-    parse_prompt_file,
-    validate_file_exists,
-)
+
+if TYPE_CHECKING:
+    from .execution import execute_command, execute_shell_command
+    from .validation import (
+        ensure_repository,
+        parse_json_string,
+        parse_prompt_file,
+        validate_file_exists,
+    )
 
 __all__ = [
     "success",
@@ -25,4 +30,30 @@ __all__ = [
     "parse_prompt_file",
     "parse_json_string",
     "execute_shell_command",
+    "execute_command",
 ]
+
+# Helpers that pull in the repository layer, yaml or subprocess are imported
+# on first access (PEP 562); output helpers are cheap and imported eagerly
+_LAZY_IMPORTS = {
+    "ensure_repository": ".validation",
+    "validate_file_exists": ".validation",
+    "parse_prompt_file": ".validation",
+    "parse_json_string": ".validation",
+    "execute_shell_command": ".execution",
+    "execute_command": ".execution",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -5,20 +5,45 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import shlex
 import subprocess
+from typing import Optional
 
 import click
 
+# Characters that need a real shell (pipes, redirection, chaining, expansion)
+_SHELL_CHARS = frozenset("|&;<>`$")
+
+# Additionally treat globbing, grouping and home expansion as shell syntax
+_SHELL_SYNTAX_CHARS = _SHELL_CHARS | frozenset("*?()[]{}~\n")
+
 
 def execute_shell_command(command: str) -> None:
     """
     Execute a shell command and display output.
 
+    Simple commands are run directly from their argv; only commands using
+    shell syntax are passed through /bin/sh.
+
     Args:
         command: Shell command to execute
     """
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+        args: Optional[list[str]] = None
+        if not _SHELL_SYNTAX_CHARS.intersection(command):
+            try:
+                args = shlex.split(command)
+            except ValueError:
+                args = None
+
+        if args and "=" not in args[0]:
+            try:
+                result = subprocess.run(args, capture_output=True)
+            except FileNotFoundError:
+                # Shell builtins and functions have no executable to run
+                result = subprocess.run(command, shell=True, capture_output=True)
+        else:
+            result = subprocess.run(command, shell=True, capture_output=True)
 
         if result.stdout:
             click.echo(result.stdout)
@@ -31,3 +56,47 @@ def execute_shell_command(command: str) -> None:
 
     except Exception as e:
         click.echo(f"✗ Execution failed: {e}", err=True)
+
+
+def execute_command(command: str) -> None:
+    """
+    Execute a command, running promptvc commands in the current process.
+
+    A plain `promptvc ...` command is dispatched through the CLI group
+    directly, which avoids starting a new interpreter and reuses any
+    repository already opened in the current Click invocation. Anything
+    else (other programs, pipes, redirection) goes through the shell.
+
+    Args:
+        command: Command line to execute
+    """
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        tokens = []
+
+    if not tokens or tokens[0] != "promptvc" or _SHELL_SYNTAX_CHARS.intersection(command):
+        execute_shell_command(command)
+        return
+
+    from ..main import cli
+
+    ctx = click.get_current_context(silent=True)
+    obj = ctx.find_root().ensure_object(dict) if ctx else None
+
+    try:
+        exit_code = cli.main(args=tokens[1:], prog_name="promptvc", standalone_mode=False, obj=obj)
+    except click.ClickException as e:
+        e.show()
+        exit_code = e.exit_code
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        exit_code = 1
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        click.echo(f"✗ Execution failed: {e}", err=True)
+        return
+
+    if isinstance(exit_code, int) and exit_code != 0:
+        click.echo(f"Command exited with code {exit_code}", err=True)
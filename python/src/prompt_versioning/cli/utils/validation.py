@@ -6,10 +6,11 @@ Licensed under MIT License
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
-import yaml
+import click
 
 from ...core.repository import PromptRepository
 from .output import error
@@ -34,8 +35,13 @@ def parse_prompt_file(file_path: str) -> tuple[dict[str, Any], str]:
     content = path.read_text()
 
     if file_path.endswith((".yaml", ".yml")):
+        # Imported here so commands that never parse YAML skip loading PyYAML
+        import yaml
+
+        from ...core.serialization import load_yaml
+
         try:
-            data = yaml.safe_load(content)
+            data = load_yaml(content)
             return data, "yaml"
         except yaml.YAMLError as e:
             error(f"Invalid YAML: {e}")
@@ -63,6 +69,9 @@ def parse_json_string(json_str: str, field_name: str = "JSON") -> dict[str, Any]
 def ensure_repository(path: str = ".") -> PromptRepository:
     """Ensure a repository exists at the path.
 
+    Within a Click invocation the repository is opened once per path and
+    stored on the root context object, so nested or repeated calls reuse it.
+
     Returns:
         PromptRepository instance
 
@@ -71,7 +80,17 @@ def ensure_repository(path: str = ".") -> PromptRepository:
     """
     from ..core import get_repository
 
+    ctx = click.get_current_context(silent=True)
+    cache = ctx.find_root().ensure_object(dict) if ctx else None
+    key = ("repo", os.path.abspath(path))
+    if cache is not None and key in cache:
+        cached: PromptRepository = cache[key]
+        return cached
+
     repo = get_repository(path)
     if not repo or not repo.exists():
         error(f"No repository found at {path}. Run 'prompt init' first.")
+
+    if cache is not None:
+        cache[key] = repo
     return repo
@@ -11,10 +11,50 @@ Licensed under MIT License
 import hashlib
 import json
 from datetime import datetime
-from typing import Any, Optional
+from functools import cached_property
+from typing import Any, Optional, TypeVar, Union
 
 from pydantic import BaseModel, Field
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def hash_prompt_content(content: dict[str, Any]) -> str:
+    """
+    Compute the content hash for dumped prompt data.
+
+    The canonical form (stdlib json, sorted keys, default separators) must not
+    change: prompt hashes address stored prompts and must match across
+    installs with or without optional speedups such as orjson.
+
+    Args:
+        content: Prompt data as returned by model_dump(exclude_none=True)
+
+    Returns:
+        SHA-256 hash of the content (first 16 characters)
+    """
+    canonical = json.dumps(content, sort_keys=True)
+    return hashlib.sha256(canonical.encode(), usedforsecurity=False).hexdigest()[:16]
+
+
+def _parse_datetime(value: Union[str, datetime]) -> datetime:
+    """Parse an ISO 8601 timestamp as written by model_dump_json/isoformat."""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _construct_trusted(
+    cls: type[ModelT], data: dict[str, Any], datetime_field: Optional[str] = None
+) -> ModelT:
+    """
+    Build a model from data the repository wrote itself, skipping validation.
+
+    Only the timestamp needs converting; every other field is stored in its
+    final JSON form, so full Pydantic validation would be redundant work.
+    """
+    if datetime_field is not None and datetime_field in data:
+        data = {**data, datetime_field: _parse_datetime(data[datetime_field])}
+    return cls.model_construct(**data)
+
 
 class Prompt(BaseModel):
     """
@@ -39,6 +79,11 @@ class Prompt(BaseModel):
     # Allow arbitrary fields for custom prompt formats
     model_config = {"extra": "allow"}
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "Prompt":
+        """Rebuild a prompt from content written by PromptStorage without revalidating."""
+        return _construct_trusted(cls, data)
+
     def compute_hash(self) -> str:
         """
         Compute a deterministic hash of the prompt content.
@@ -46,9 +91,7 @@ class Prompt(BaseModel):
         Returns:
             SHA-256 hash of the prompt data (first 16 characters)
         """
-        # Sort keys for deterministic hashing
-        content = json.dumps(self.model_dump(exclude_none=True), sort_keys=True)
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        return hash_prompt_content(self.model_dump(exclude_none=True))
 
 
 class PromptCommit(BaseModel):
@@ -68,6 +111,11 @@ class PromptCommit(BaseModel):
     file_path: Optional[str] = Field(None, description="Path to the prompt file that was committed")
     tags: list[str] = Field(default_factory=list, description="Tags associated with this commit")
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "PromptCommit":
+        """Create a commit from stored JSON without re-validating it."""
+        return _construct_trusted(cls, data, "timestamp")
+
     def short_hash(self) -> str:
         """Return abbreviated commit hash (first 7 characters)."""
         return self.hash[:7]
@@ -101,6 +149,11 @@ class ExperimentTag(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict, description="Experiment metadata")
     created_at: datetime = Field(default_factory=datetime.now, description="Tag creation timestamp")
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "ExperimentTag":
+        """Create a tag from stored JSON without re-validating it."""
+        return _construct_trusted(cls, data, "created_at")
+
     def __str__(self) -> str:
         return f"Tag '{self.name}' -> {self.commit_hash[:7]}"
 
@@ -121,10 +174,20 @@ class AuditLogEntry(BaseModel):
     author: str = Field(..., description="User who performed the action")
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional context")
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "AuditLogEntry":
+        """Create an entry from a stored audit log line without re-validating it."""
+        return _construct_trusted(cls, data, "timestamp")
+
+    @cached_property
+    def timestamp_iso(self) -> str:
+        """ISO 8601 timestamp, formatted once and shared by every export format."""
+        return self.timestamp.isoformat()
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for export."""
         return {
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "action": self.action,
             "commit_hash": self.commit_hash,
             "prompt_hash": self.prompt_hash,
@@ -8,11 +8,23 @@ Licensed under MIT License
 import csv
 import io
 import json
-from typing import Any, Union
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any, Optional, Union
 
 from ..models import AuditLogEntry
 from ..storage import StorageBackend
 
+CSV_FIELDS = (
+    "timestamp",
+    "action",
+    "commit_hash",
+    "prompt_hash",
+    "message",
+    "author",
+    "metadata",
+)
+
 
 class AuditOperations:
     """Handles audit logging operations."""
@@ -20,17 +32,24 @@ class AuditOperations:
     def __init__(self, storage: StorageBackend):
         self.storage = storage
 
-    def generate_audit_log(self, format: str = "json") -> Union[str, list[dict[str, Any]]]:
+    def generate_audit_log(
+        self, format: str = "json", offset: int = 0, limit: Optional[int] = None
+    ) -> Union[str, list[dict[str, Any]]]:
         """
         Generate compliance audit log.
 
         Args:
-            format: Output format ('json', 'csv', or 'dict')
+            format: Output format ('json', 'jsonl', 'csv', or 'dict')
+            offset: Number of entries to skip from the start of the log
+            limit: Maximum number of entries to include (None for all)
 
         Returns:
             Audit log in requested format
         """
-        entries = self.storage.read_audit_log()
+        if format == "jsonl":
+            return b"".join(self.iter_audit_log(offset, limit)).decode()
+
+        entries = self._select_entries(offset, limit)
 
         if format == "dict":
             return [entry.to_dict() for entry in entries]
@@ -39,27 +58,47 @@ class AuditOperations:
         else:  # json
             return json.dumps([entry.to_dict() for entry in entries], indent=2)
 
-    def _format_csv(self, entries: list[AuditLogEntry]) -> str:
+    def iter_audit_log(self, offset: int = 0, limit: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Stream the audit log as JSON Lines.
+
+        Yields one compact, newline-terminated JSON document per entry so
+        large logs can be exported without materializing every entry.
+        """
+        for entry in self._select_entries(offset, limit):
+            yield json.dumps(entry.to_dict()).encode() + b"\n"
+
+    def _select_entries(self, offset: int, limit: Optional[int]) -> Iterable[AuditLogEntry]:
+        """Return the requested window of audit entries."""
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("offset and limit must be non-negative")
+
+        if not offset and limit is None:
+            return self.storage.read_audit_log()
+
+        # Stream the log so only the requested page is ever parsed into entries
+        stop = None if limit is None else offset + limit
+        return islice(self.storage.iter_audit_log(), offset, stop)
+
+    def _format_csv(self, entries: Iterable[AuditLogEntry]) -> str:
         """Format audit entries as CSV."""
         output = io.StringIO()
-        writer = csv.DictWriter(
-            output,
-            fieldnames=[
-                "timestamp",
-                "action",
-                "commit_hash",
-                "prompt_hash",
-                "message",
-                "author",
-                "metadata",
-            ],
-        )
-        writer.writeheader()
+        writer = csv.writer(output)
+        writer.writerow(CSV_FIELDS)
 
-        for entry in entries:
-            row = entry.to_dict()
-            # Convert metadata dict to string for CSV
-            row["metadata"] = json.dumps(row["metadata"])
-            writer.writerow(row)
+        # Plain rows avoid DictWriter's per-field lookups; metadata is
+        # JSON-encoded since CSV cells are flat strings
+        writer.writerows(
+            (
+                entry.timestamp_iso,
+                entry.action,
+                entry.commit_hash,
+                entry.prompt_hash,
+                entry.message,
+                entry.author,
+                json.dumps(entry.metadata) if entry.metadata else "{}",
+            )
+            for entry in entries
+        )
 
         return output.getvalue()
@@ -5,6 +5,7 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -65,6 +66,10 @@ class PromptRepository:
         """Check if repository exists and is valid."""
         return self.storage.exists()
 
+    def state_key(self) -> tuple[Optional[str], tuple[int, int], Optional[tuple[int, int]]]:
+        """Fingerprint that changes whenever HEAD moves, a commit is made or a tag is added."""
+        return self.storage.state_key()
+
     # ==================== Commit Operations ====================
 
     def commit(
@@ -73,9 +78,9 @@ class PromptRepository:
         """Create a new commit with the given prompt."""
         return self._commit_ops.create_commit(message, prompt_data, author, file_path)
 
-    def log(self, max_count: Optional[int] = None) -> list[PromptVersion]:
-        """Get commit history."""
-        return self._commit_ops.get_history(max_count)
+    def log(self, max_count: Optional[int] = None, skip: int = 0) -> list[PromptVersion]:
+        """Get commit history, newest first, optionally skipping the newest commits."""
+        return self._commit_ops.get_history(max_count, skip)
 
     def get_current_version(self) -> Optional[PromptVersion]:
         """Get the current HEAD version."""
@@ -109,6 +114,12 @@ class PromptRepository:
 
     # ==================== Audit Operations ====================
 
-    def audit_log(self, format: str = "json") -> Union[str, list[dict[str, Any]]]:
-        """Generate compliance audit log."""
-        return self._audit_ops.generate_audit_log(format)
+    def audit_log(
+        self, format: str = "json", offset: int = 0, limit: Optional[int] = None
+    ) -> Union[str, list[dict[str, Any]]]:
+        """Generate compliance audit log, optionally one page of entries."""
+        return self._audit_ops.generate_audit_log(format, offset, limit)
+
+    def iter_audit_log(self) -> Iterator[bytes]:
+        """Stream the audit log as JSON Lines (one encoded entry per item)."""
+        return self._audit_ops.iter_audit_log()
@@ -6,12 +6,18 @@ Licensed under MIT License
 """
 
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Optional, Union
 
 from ..models import Prompt, PromptCommit, PromptVersion
 from ..storage import StorageBackend
 
+# Histories shorter than this are loaded serially; a thread pool only pays
+# off once there are enough file reads to overlap
+PARALLEL_HISTORY_THRESHOLD = 32
+HISTORY_WORKERS = 16
+
 
 class CommitOperations:
     """Handles commit-related operations."""
@@ -52,9 +58,13 @@ class CommitOperations:
         # Get parent commit (current HEAD)
         parent_hash = self.storage.get_head()
 
-        # Generate commit hash (based on content + metadata)
-        commit_data = f"{prompt_hash}{message}{author}{datetime.now().isoformat()}"
-        commit_hash = hashlib.sha256(commit_data.encode()).hexdigest()[:16]
+        # Generate commit hash (based on content + metadata); the same timestamp
+        # is stored on the commit so the hash can be recomputed from it
+        now = datetime.now()
+        hasher = hashlib.sha256(usedforsecurity=False)
+        for part in (prompt_hash, message, author, now.isoformat()):
+            hasher.update(part.encode())
+        commit_hash = hasher.hexdigest()[:16]
 
         # Create commit object
         commit = PromptCommit(
@@ -62,53 +72,60 @@ class CommitOperations:
             parent_hash=parent_hash,
             message=message,
             author=author,
-            timestamp=datetime.now(),
+            timestamp=now,
             prompt_hash=prompt_hash,
             file_path=file_path,
         )
 
-        # Save commit and update HEAD
-        self.storage.save_commit(commit)
-        self.storage.set_head(commit_hash)
-
-        # Log to audit trail
-        self.storage.log_action(
-            action="commit",
-            message=message,
-            commit_hash=commit_hash,
-            prompt_hash=prompt_hash,
-            author=author,
-        )
+        # Save commit, log it to the audit trail and update HEAD
+        self.storage.record_commit(commit)
 
         return commit
 
-    def get_history(self, max_count: Optional[int] = None) -> list[PromptVersion]:
+    def get_history(self, max_count: Optional[int] = None, skip: int = 0) -> list[PromptVersion]:
         """
         Get commit history.
 
+        Only the requested commits are loaded from storage.
+
         Args:
             max_count: Maximum number of commits to return (None for all)
+            skip: Number of newest commits to skip before returning any
 
         Returns:
             List of PromptVersion objects (newest first)
         """
+        if skip < 0:
+            raise ValueError("skip must be non-negative")
+
         if not self.storage.exists():
             return []
 
         commit_hashes = self.storage.list_commits()
 
-        if max_count:
-            commit_hashes = commit_hashes[:max_count]
+        if max_count or skip:
+            commit_hashes = commit_hashes[skip : skip + max_count if max_count else None]
+
+        if len(commit_hashes) < PARALLEL_HISTORY_THRESHOLD:
+            results = [self._load_version(h) for h in commit_hashes]
+        else:
+            # map() preserves input order, so the result stays newest first
+            with ThreadPoolExecutor(max_workers=HISTORY_WORKERS) as executor:
+                results = list(executor.map(self._load_version, commit_hashes))
 
-        versions = []
-        for commit_hash in commit_hashes:
-            commit = self.storage.load_commit(commit_hash)
-            if commit:
-                prompt = self.storage.load_prompt(commit.prompt_hash)
-                if prompt:
-                    versions.append(PromptVersion(commit=commit, prompt=prompt))
+        return [version for version in results if version is not None]
 
-        return versions
+    def _load_version(self, commit_hash: str) -> Optional[PromptVersion]:
+        """Load a commit and its prompt, or None if either is missing."""
+        commit = self.storage.load_commit(commit_hash)
+        if not commit:
+            return None
+
+        prompt = self.storage.load_prompt(commit.prompt_hash)
+        if not prompt:
+            return None
+
+        return PromptVersion(commit=commit, prompt=prompt)
 
     def get_current_version(self) -> Optional[PromptVersion]:
         """
@@ -5,10 +5,14 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import re
 from typing import Optional
 
 from ..storage import StorageBackend
 
+# HEAD or HEAD~N
+_HEAD_REF = re.compile(r"HEAD(?:~(\d+))?\Z")
+
 
 class ReferenceResolver:
     """Resolves commit references (HEAD, short hashes, etc.)."""
@@ -32,21 +36,15 @@ class ReferenceResolver:
             Full commit hash or None if not found
         """
         # Handle HEAD references
-        if ref == "HEAD":
-            return self.storage.get_head()
-        elif ref.startswith("HEAD~"):
-            try:
-                steps_back = int(ref.split("~")[1])
-                commits = self.storage.list_commits()
-                if steps_back < len(commits):
-                    return commits[steps_back]
-            except (ValueError, IndexError):
-                return None
-
-        # Try exact match first
-        commit = self.storage.load_commit(ref)
-        if commit:
-            return ref
-
-        # Try prefix match
+        match = _HEAD_REF.match(ref)
+        if match:
+            if match.group(1) is None:
+                return self.storage.get_head()
+
+            steps_back = int(match.group(1))
+            commits = self.storage.list_commits()
+            return commits[steps_back] if steps_back < len(commits) else None
+
+        # Full hashes are their own unique prefix, so one in-memory index
+        # lookup covers both cases without loading the commit file
         return self.storage.find_commit_by_prefix(ref)
@@ -57,11 +57,8 @@ class TagOperations:
         # Save tag
         self.storage.save_tag(tag)
 
-        # Update commit to include tag
-        commit = self.storage.load_commit(commit_hash)
-        if commit and name not in commit.tags:
-            commit.tags.append(name)
-            self.storage.save_commit(commit)
+        # Record the tag against the commit
+        self.storage.tag_commit(commit_hash, name)
 
         # Log action
         self.storage.log_action(
@@ -92,10 +89,4 @@ class TagOperations:
         Returns:
             List of ExperimentTag objects
         """
-        tag_names = self.storage.list_tags()
-        tags = []
-        for name in tag_names:
-            tag = self.storage.load_tag(name)
-            if tag:
-                tags.append(tag)
-        return tags
+        return self.storage.load_all_tags()
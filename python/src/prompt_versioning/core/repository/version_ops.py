@@ -44,11 +44,18 @@ class VersionOperations:
 
         # Load commits and prompts
         commit1 = self.storage.load_commit(hash1)
-        commit2 = self.storage.load_commit(hash2)
+        commit2 = commit1 if hash2 == hash1 else self.storage.load_commit(hash2)
 
         if not commit1 or not commit2:
             raise ValueError("Failed to load commits")
 
+        # Storage is content-addressed, so the same prompt hash means no changes
+        if commit1.prompt_hash == commit2.prompt_hash:
+            prompt = self.storage.load_prompt(commit1.prompt_hash)
+            if not prompt:
+                raise ValueError("Failed to load prompt content")
+            return DiffResult.unchanged(prompt)
+
         prompt1 = self.storage.load_prompt(commit1.prompt_hash)
         prompt2 = self.storage.load_prompt(commit2.prompt_hash)
 
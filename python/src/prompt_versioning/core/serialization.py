@@ -0,0 +1,114 @@
+"""
+JSON and YAML serialization helpers.
+
+JSON uses orjson when it is installed (pip install prompt-versioning-cli[speedups])
+and falls back to the standard library otherwise. Both paths produce
+equivalent JSON documents; datetimes are written as ISO 8601 strings.
+
+YAML uses the libyaml C loader/dumper when PyYAML was built with it and the
+pure-Python safe loader/dumper otherwise. PyYAML is imported on first use so
+code paths that never touch YAML do not pay for loading it.
+
+Copyright (c) 2025 Prompt Versioning Contributors
+Licensed under MIT License
+"""
+
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import IO, Any, Optional, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on optional dependency
+    HAS_ORJSON = False
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types the stdlib encoder does not handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    return json.dumps(obj, indent=2 if indent else None, default=_default).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Deserialized object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1)
+def _yaml_loader_dumper() -> tuple[Any, Any]:
+    """Return the fastest available safe YAML (Loader, Dumper) pair."""
+    import yaml
+
+    try:
+        return yaml.CSafeLoader, yaml.CSafeDumper
+    except AttributeError:  # pragma: no cover - depends on how PyYAML was built
+        return yaml.SafeLoader, yaml.SafeDumper
+
+
+def load_yaml(stream: Union[str, bytes, IO[str]]) -> Any:
+    """
+    Safely parse a YAML document.
+
+    Args:
+        stream: YAML document as str/bytes or an open file
+
+    Returns:
+        Deserialized object (None for an empty document)
+    """
+    import yaml
+
+    loader, _ = _yaml_loader_dumper()
+    return yaml.load(stream, Loader=loader)
+
+
+def dump_yaml(data: Any, stream: Optional[IO[str]] = None, **kwargs: Any) -> Any:
+    """
+    Serialize an object to YAML using only safe tags.
+
+    Args:
+        data: Object to serialize
+        stream: Open file to write to; if omitted the document is returned
+        **kwargs: Extra options passed to yaml.dump (e.g. sort_keys)
+
+    Returns:
+        The YAML document as str when no stream is given, otherwise None
+    """
+    import yaml
+
+    _, dumper = _yaml_loader_dumper()
+    kwargs.setdefault("default_flow_style", False)
+    return yaml.dump(data, stream, Dumper=dumper, **kwargs)
@@ -5,12 +5,22 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-import json
+import gzip
+import os
+import re
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
 from ..models import AuditLogEntry
+from ..serialization import dumps, loads
+from .filesystem import atomic_write
+
+# Once the active log grows past this size it is moved into a compressed
+# segment (audit.<N>.jsonl.gz) and a fresh audit.jsonl is started
+ROTATE_SIZE = 8 * 1024 * 1024
 
 
 class AuditLog:
@@ -19,15 +29,101 @@ class AuditLog:
     def __init__(self, audit_file: Path):
         self.audit_file = audit_file
 
+        # Encoded lines waiting to be written while a batch is open
+        self._pending: Optional[list[bytes]] = None
+
     def append(self, entry: AuditLogEntry) -> None:
         """
         Append an entry to the audit log.
 
         Uses JSON Lines format (one JSON object per line) for efficient appending
-        and streaming reads.
+        and streaming reads. Inside batch() the line is buffered instead.
+        """
+        self._append_dict(entry.to_dict())
+
+    def _append_dict(self, payload: dict[str, Any]) -> None:
+        """Append an already-exported entry (the AuditLogEntry.to_dict() layout)."""
+        line = dumps(payload) + b"\n"
+        if self._pending is not None:
+            self._pending.append(line)
+        else:
+            self._write(line)
+
+    def flush(self) -> None:
+        """Write any buffered entries to disk."""
+        if self._pending:
+            data = b"".join(self._pending)
+            self._pending.clear()
+            self._write(data)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
         """
-        with open(self.audit_file, "a") as f:
-            f.write(json.dumps(entry.to_dict()) + "\n")
+        Buffer appended entries and write them in one call when the block exits.
+
+        Entries are still written if the block raises. Nested batches join the
+        outermost one.
+        """
+        if self._pending is not None:
+            yield
+            return
+
+        self._pending = []
+        try:
+            yield
+        finally:
+            try:
+                self.flush()
+            finally:
+                self._pending = None
+
+    def _write(self, data: bytes) -> None:
+        """Append raw JSON Lines data to the audit file."""
+        with open(self.audit_file, "ab") as f:
+            f.write(data)
+            size = f.tell()
+
+        if size > ROTATE_SIZE:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        """Move the active log into the next compressed segment."""
+        segments = self._segments()
+        number = max(segments, default=0) + 1
+        stem = self.audit_file.name[: -len(".jsonl")]
+        plain = self.audit_file.with_name(f"{stem}.{number}.jsonl")
+
+        # Rename first so concurrent appends go to a fresh file, then compress;
+        # a plain segment left by an interrupted rotation is still read
+        os.replace(self.audit_file, plain)
+        atomic_write(plain.with_name(plain.name + ".gz"), gzip.compress(plain.read_bytes(), 1))
+        plain.unlink()
+
+    def _segments(self) -> dict[int, Path]:
+        """Return rotated segments by number, preferring the compressed copy."""
+        stem = self.audit_file.name[: -len(".jsonl")]
+        pattern = re.compile(rf"{re.escape(stem)}\.(\d+)\.jsonl(\.gz)?\Z")
+
+        segments: dict[int, Path] = {}
+        with os.scandir(self.audit_file.parent) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if match and (match.group(2) or int(match.group(1)) not in segments):
+                    segments[int(match.group(1))] = Path(entry.path)
+        return segments
+
+    def _read_chunks(self) -> Iterator[bytes]:
+        """Yield the contents of each rotated segment (oldest first) and then the active log."""
+        segments = self._segments() if self.audit_file.parent.exists() else {}
+        for number in sorted(segments):
+            path = segments[number]
+            data = path.read_bytes()
+            yield gzip.decompress(data) if path.suffix == ".gz" else data
+
+        try:
+            yield self.audit_file.read_bytes()
+        except FileNotFoundError:
+            pass
 
     def log_action(
         self,
@@ -39,29 +135,48 @@ class AuditLog:
         metadata: Optional[dict[str, Any]] = None,
     ) -> None:
         """Log an action to the audit trail."""
-        entry = AuditLogEntry(
-            timestamp=datetime.now(),
-            action=action,
-            commit_hash=commit_hash,
-            prompt_hash=prompt_hash,
-            message=message,
-            author=author,
-            metadata=metadata or {},
+        # Build the exported form directly; a model instance would only be
+        # validated and dumped straight back to this dict
+        self._append_dict(
+            {
+                "timestamp": datetime.now().isoformat(),
+                "action": action,
+                "commit_hash": commit_hash,
+                "prompt_hash": prompt_hash,
+                "message": message,
+                "author": author,
+                "metadata": metadata or {},
+            }
         )
-        self.append(entry)
+
+    def iter_entries(self) -> Iterator[AuditLogEntry]:
+        """Yield audit log entries one at a time without loading the whole file."""
+        self.flush()
+        segments = self._segments() if self.audit_file.parent.exists() else {}
+        for number in sorted(segments):
+            path = segments[number]
+            with gzip.open(path, "rb") if path.suffix == ".gz" else open(path, "rb") as f:
+                yield from self._parse_lines(f)
+
+        try:
+            f = open(self.audit_file, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            yield from self._parse_lines(f)
+
+    @staticmethod
+    def _parse_lines(lines: Iterable[bytes]) -> Iterator[AuditLogEntry]:
+        """Parse non-blank JSON Lines into entries."""
+        for line in lines:
+            if line.strip():
+                yield AuditLogEntry.from_trusted(loads(line))
 
     def read_all(self) -> list[AuditLogEntry]:
         """Read the complete audit log."""
-        if not self.audit_file.exists():
-            return []
-
-        entries = []
-        with open(self.audit_file) as f:
-            for line in f:
-                if line.strip():
-                    data = json.loads(line)
-                    # Parse datetime
-                    data["timestamp"] = datetime.fromisoformat(data["timestamp"])
-                    entries.append(AuditLogEntry(**data))
-
-        return entries
+        self.flush()
+
+        # One read per file and a C-level split instead of line-at-a-time iteration
+        return list(
+            self._parse_lines(line for chunk in self._read_chunks() for line in chunk.splitlines())
+        )
@@ -5,6 +5,8 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Optional
 
@@ -25,12 +27,15 @@ class StorageBackend:
         ├── HEAD                 # Current commit hash
         ├── config.json          # Repository configuration
         ├── commits/             # Commit metadata
-        │   └── <hash>.json
+        │   ├── <hash>.json
+        │   └── _index.jsonl     # Commit hash/timestamp index for ordering history
         ├── prompts/             # Prompt content
         │   └── <hash>.yaml
         ├── tags/                # Experiment tags
-        │   └── <name>.json
-        └── audit.jsonl          # Audit log (JSON Lines format)
+        │   ├── <name>.json
+        │   └── _by_commit.jsonl # Tags added to each commit
+        ├── audit.jsonl          # Audit log (JSON Lines format)
+        └── audit.<N>.jsonl.gz   # Older audit log segments, rotated at 8 MiB
     """
 
     def __init__(self, repo_path: Path):
@@ -51,6 +56,7 @@ class StorageBackend:
     def initialize(self) -> None:
         """Initialize the .prompt-vc directory structure."""
         self._fs.initialize()
+        self._commits.invalidate()
         # Log initialization
         self._audit.log_action("init", "Initialized prompt repository", author="system")
 
@@ -74,9 +80,35 @@ class StorageBackend:
         """Save a commit to storage."""
         self._commits.save(commit)
 
+    def record_commit(self, commit: PromptCommit) -> None:
+        """
+        Persist a new commit, log it and move HEAD to it.
+
+        HEAD is written last, so an interrupted commit never leaves HEAD
+        pointing at a commit that is missing from storage or the audit log.
+        The prompt must already have been saved with save_prompt().
+        """
+        self._commits.save(commit)
+        self._audit.log_action(
+            "commit",
+            commit.message,
+            commit_hash=commit.hash,
+            prompt_hash=commit.prompt_hash,
+            author=commit.author,
+        )
+        self._fs.set_head(commit.hash)
+
     def load_commit(self, commit_hash: str) -> Optional[PromptCommit]:
-        """Load a commit by hash."""
-        return self._commits.load(commit_hash)
+        """Load a commit by hash, including tags recorded with tag_commit()."""
+        commit = self._commits.load(commit_hash)
+        if commit is None:
+            return None
+
+        added = [t for t in self._tags.tags_for_commit(commit_hash) if t not in commit.tags]
+        if added:
+            # Copy so the cached commit is left untouched
+            commit = commit.model_copy(update={"tags": [*commit.tags, *added]})
+        return commit
 
     def list_commits(self) -> list[str]:
         """List all commit hashes in chronological order (newest first)."""
@@ -106,10 +138,29 @@ class StorageBackend:
         """Load a tag by name."""
         return self._tags.load(tag_name)
 
+    def tag_commit(self, commit_hash: str, tag_name: str) -> None:
+        """Add a tag name to a commit without rewriting the commit file."""
+        self._tags.append_commit_tag(commit_hash, tag_name)
+
     def list_tags(self) -> list[str]:
         """List all tag names."""
         return self._tags.list_all()
 
+    def load_all_tags(self) -> list[ExperimentTag]:
+        """Load all experiment tags."""
+        return self._tags.load_all()
+
+    def state_key(self) -> tuple[Optional[str], tuple[int, int], Optional[tuple[int, int]]]:
+        """
+        Return a cheap fingerprint of the repository state.
+
+        It changes whenever HEAD moves, a commit is made or a tag is added, so
+        results derived from history, status or tags can be reused while it
+        stays equal. HEAD alone is not enough: committing and then checking
+        out the previous commit leaves HEAD where it started.
+        """
+        return self._fs.get_head(), self._commits.index_key(), self._tags.index_key()
+
     # ==================== Audit Operations ====================
 
     def log_action(
@@ -127,3 +178,24 @@ class StorageBackend:
     def read_audit_log(self) -> list[AuditLogEntry]:
         """Read the complete audit log."""
         return self._audit.read_all()
+
+    def iter_audit_log(self) -> Iterator[AuditLogEntry]:
+        """Iterate over audit log entries without loading them all."""
+        return self._audit.iter_entries()
+
+    def flush(self) -> None:
+        """Write any buffered audit entries to disk."""
+        self._audit.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group many operations so their audit entries are written at once.
+
+        Example:
+            with repo.storage.batch():
+                for message, data in prompts:
+                    repo.commit(message, data)
+        """
+        with self._audit.batch():
+            yield
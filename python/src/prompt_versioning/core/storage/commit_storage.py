@@ -5,11 +5,23 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-import json
+import os
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from ..models import PromptCommit
+from ..serialization import dumps, loads
+
+# Append-only sidecar of (hash, timestamp) pairs so history can be ordered
+# without loading every commit file
+INDEX_FILE = "_index.jsonl"
+
+# Maximum number of parsed commits kept in memory
+CACHE_SIZE = 1024
 
 
 class CommitStorage:
@@ -17,44 +29,169 @@ class CommitStorage:
 
     def __init__(self, commits_dir: Path):
         self.commits_dir = commits_dir
+        self.index_file = commits_dir / INDEX_FILE
+
+        # Sorted commit hashes for prefix lookup, rebuilt when the directory changes
+        self._hash_index: Optional[list[str]] = None
+        self._hash_index_mtime: Optional[int] = None
+
+        # Newest-first history, keyed on the directory and sidecar state it was built from
+        self._history: Optional[tuple[tuple[Optional[int], tuple[int, int]], list[str]]] = None
+
+        # Parsed commits keyed on hash, with the (mtime_ns, size) of the file they came from
+        self._cache: OrderedDict[str, tuple[tuple[int, int], PromptCommit]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def save(self, commit: PromptCommit) -> None:
         """Save a commit to storage."""
         commit_path = self.commits_dir / f"{commit.hash}.json"
-        commit_path.write_text(commit.model_dump_json(indent=2))
+        commit_path.write_text(commit.model_dump_json())
+        self._append_index({commit.hash: commit.timestamp})
+        self.invalidate()
+        # Cache a copy so later changes to the caller's commit do not leak into it
+        self._remember(commit_path, commit.model_copy(deep=True))
+
+    def invalidate(self) -> None:
+        """Drop cached lookup indexes so they are rebuilt from disk."""
+        self._hash_index = None
+        self._hash_index_mtime = None
+        self._history = None
 
     def load(self, commit_hash: str) -> Optional[PromptCommit]:
         """Load a commit by hash."""
         commit_path = self.commits_dir / f"{commit_hash}.json"
-        if not commit_path.exists():
+        try:
+            stat = os.stat(commit_path)
+        except FileNotFoundError:
             return None
 
-        data = json.loads(commit_path.read_text())
-        return PromptCommit(**data)
+        # Commits only change when tagged, so a matching stat means the cached copy is current
+        with self._cache_lock:
+            cached = self._cache.get(commit_hash)
+            if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+                self._cache.move_to_end(commit_hash)
+                return cached[1].model_copy(deep=True)
+
+        data = loads(commit_path.read_bytes())
+        commit = PromptCommit.from_trusted(data)
+        self._remember(commit_path, commit)
+        return commit.model_copy(deep=True)
+
+    def _remember(self, commit_path: Path, commit: PromptCommit) -> None:
+        """Cache a parsed commit, evicting the least recently used entry if full."""
+        stat = os.stat(commit_path)
+        with self._cache_lock:
+            self._cache[commit.hash] = ((stat.st_mtime_ns, stat.st_size), commit)
+            self._cache.move_to_end(commit.hash)
+            while len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
 
     def list_all(self) -> list[str]:
         """List all commit hashes in chronological order (newest first)."""
-        if not self.commits_dir.exists():
+        hashes = self._sorted_hashes()
+        if not hashes:
             return []
 
-        # Load all commits and sort by timestamp
-        commits = []
-        for commit_file in self.commits_dir.glob("*.json"):
-            commit_hash = commit_file.stem
-            commit = self.load(commit_hash)
-            if commit:
-                commits.append(commit)
+        key = (self._hash_index_mtime, self.index_key())
+        if self._history is not None and self._history[0] == key:
+            return list(self._history[1])
+
+        timestamps = self._read_index()
+
+        # Commits written before the sidecar existed are loaded once and indexed
+        missing = {}
+        for commit_hash in hashes:
+            if commit_hash not in timestamps:
+                commit = self.load(commit_hash)
+                if commit:
+                    missing[commit_hash] = commit.timestamp
+        if missing:
+            timestamps.update(missing)
+            # Backfilling is only an optimisation, so a read-only repository still lists
+            try:
+                self._append_index(missing)
+            except OSError:
+                pass
+            key = (self._hash_index_mtime, self.index_key())
 
         # Sort by timestamp (newest first)
-        commits.sort(key=lambda c: c.timestamp, reverse=True)
-        return [c.hash for c in commits]
+        history = sorted(
+            (h for h in hashes if h in timestamps), key=timestamps.__getitem__, reverse=True
+        )
+        self._history = (key, history)
+        return list(history)
+
+    def index_key(self) -> tuple[int, int]:
+        """Return the sidecar index's (mtime_ns, size), or zeros if it is missing.
+
+        Every commit appends to the index, so the key changes with each new commit.
+        """
+        try:
+            stat = os.stat(self.index_file)
+        except FileNotFoundError:
+            return (0, 0)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _read_index(self) -> dict[str, datetime]:
+        """Read the sidecar index as a hash -> timestamp mapping."""
+        try:
+            content = self.index_file.read_bytes()
+        except FileNotFoundError:
+            return {}
+
+        timestamps = {}
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            # A torn or corrupt line is skipped; its commit is reloaded and re-indexed
+            try:
+                record = loads(line)
+                timestamps[record["hash"]] = datetime.fromisoformat(record["timestamp"])
+            except (ValueError, TypeError, KeyError):
+                continue
+        return timestamps
+
+    def _append_index(self, timestamps: dict[str, datetime]) -> None:
+        """Append hash/timestamp records to the sidecar index in a single write."""
+        records = b"".join(
+            dumps({"hash": commit_hash, "timestamp": timestamp.isoformat()}) + b"\n"
+            for commit_hash, timestamp in timestamps.items()
+        )
+        with open(self.index_file, "ab") as f:
+            f.write(records)
 
     def find_by_prefix(self, hash_prefix: str) -> Optional[str]:
         """Find a commit hash by prefix (like Git's short hash lookup)."""
-        matches = []
-        for commit_file in self.commits_dir.glob("*.json"):
-            if commit_file.stem.startswith(hash_prefix):
-                matches.append(commit_file.stem)
+        rebuilt = self._hash_index is None
+        matches = self._prefix_matches(hash_prefix)
+
+        # A miss on a cached index may just mean another process committed
+        # within the directory's mtime granularity; rescan once to be sure
+        if not matches and not rebuilt:
+            self.invalidate()
+            matches = self._prefix_matches(hash_prefix)
 
         # Return None if no match or ambiguous
         return matches[0] if len(matches) == 1 else None
+
+    def _prefix_matches(self, hash_prefix: str) -> list[str]:
+        """Return up to two hashes starting with the prefix (enough to detect ambiguity)."""
+        hashes = self._sorted_hashes()
+        start = bisect_left(hashes, hash_prefix)
+        return [h for h in hashes[start : start + 2] if h.startswith(hash_prefix)]
+
+    def _sorted_hashes(self) -> list[str]:
+        """Return all commit hashes sorted, reusing the index while the directory is unchanged."""
+        try:
+            mtime = os.stat(self.commits_dir).st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        if self._hash_index is None or mtime != self._hash_index_mtime:
+            with os.scandir(self.commits_dir) as entries:
+                self._hash_index = sorted(
+                    entry.name[:-5] for entry in entries if entry.name.endswith(".json")
+                )
+            self._hash_index_mtime = mtime
+
+        return self._hash_index
@@ -5,11 +5,35 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from ..serialization import dumps
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """
+    Write a file atomically.
+
+    The data is written to a temporary sibling file which then replaces the
+    target with os.replace, so readers never see a partially written file.
+
+    Args:
+        path: Destination file
+        data: Complete file contents
+    """
+    # Unique per process and thread, so concurrent writers never share a temp file
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 class FileSystemManager:
     """Manages file system structure and basic operations."""
@@ -29,6 +53,8 @@ class FileSystemManager:
         self.config_file = self.prompt_vc_dir / "config.json"
         self.audit_file = self.prompt_vc_dir / "audit.jsonl"
 
+        self._exists = False
+
     def initialize(self) -> None:
         """
         Initialize the .prompt-vc directory structure.
@@ -53,23 +79,33 @@ class FileSystemManager:
             "version": "1.0.0",
             "created_at": datetime.now().isoformat(),
         }
-        self.config_file.write_text(json.dumps(config, indent=2))
+        self.config_file.write_bytes(dumps(config))
 
         # Create empty audit log
         self.audit_file.touch()
 
     def exists(self) -> bool:
-        """Check if repository exists."""
-        return self.prompt_vc_dir.exists() and self.head_file.exists()
+        """
+        Check if repository exists.
+
+        A positive answer is remembered: long-running callers such as the MCP
+        server check this before every operation, and a repository is not
+        expected to disappear underneath them.
+        """
+        if not self._exists:
+            # HEAD lives inside .prompt-vc, so one stat covers both
+            self._exists = self.head_file.exists()
+        return self._exists
 
     def get_head(self) -> Optional[str]:
         """Get the current HEAD commit hash."""
-        if not self.head_file.exists():
+        try:
+            content = self.head_file.read_bytes().decode().strip()
+        except FileNotFoundError:
             return None
 
-        content = self.head_file.read_text().strip()
         return content if content else None
 
     def set_head(self, commit_hash: str) -> None:
-        """Update HEAD to point to a commit."""
-        self.head_file.write_text(commit_hash)
+        """Update HEAD to point to a commit (atomically, so it is never left half-written)."""
+        atomic_write(self.head_file, commit_hash.encode())
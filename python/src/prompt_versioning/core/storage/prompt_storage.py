@@ -5,12 +5,16 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from ..models import Prompt, hash_prompt_content
+from ..serialization import dump_yaml, load_yaml
 
-from ..models import Prompt
+# Maximum number of parsed prompts kept in memory
+CACHE_SIZE = 1024
 
 
 class PromptStorage:
@@ -19,6 +23,11 @@ class PromptStorage:
     def __init__(self, prompts_dir: Path):
         self.prompts_dir = prompts_dir
 
+        # Prompt files are content-addressed and never rewritten, so parsed
+        # prompts stay valid for the life of the storage object
+        self._cache: OrderedDict[str, Prompt] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
     def save(self, prompt: Prompt) -> str:
         """
         Save prompt content to storage.
@@ -26,21 +35,36 @@ class PromptStorage:
         Returns:
             Hash of the saved prompt
         """
-        prompt_hash = prompt.compute_hash()
+        # Dump once and reuse the data for both the hash and the file
+        content = prompt.model_dump(exclude_none=True)
+        prompt_hash = hash_prompt_content(content)
         prompt_path = self.prompts_dir / f"{prompt_hash}.yaml"
 
         # Don't overwrite if already exists (content-addressable storage)
         if not prompt_path.exists():
-            content = prompt.model_dump(exclude_none=True)
-            prompt_path.write_text(yaml.dump(content, sort_keys=True))
+            prompt_path.write_text(dump_yaml(content, sort_keys=True))
 
         return prompt_hash
 
     def load(self, prompt_hash: str) -> Optional[Prompt]:
         """Load a prompt by hash."""
+        with self._cache_lock:
+            cached = self._cache.get(prompt_hash)
+            if cached is not None:
+                self._cache.move_to_end(prompt_hash)
+                # Hand out a deep copy so callers cannot change the cached prompt
+                return cached.model_copy(deep=True)
+
         prompt_path = self.prompts_dir / f"{prompt_hash}.yaml"
-        if not prompt_path.exists():
+        try:
+            # libyaml decodes the UTF-8 bytes itself
+            data = load_yaml(prompt_path.read_bytes())
+        except FileNotFoundError:
             return None
 
-        data = yaml.safe_load(prompt_path.read_text())
-        return Prompt(**data)
+        prompt = Prompt.from_trusted(data)
+        with self._cache_lock:
+            self._cache[prompt_hash] = prompt
+            while len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return prompt.model_copy(deep=True)
@@ -5,11 +5,16 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-import json
+import os
 from pathlib import Path
 from typing import Optional
 
 from ..models import ExperimentTag
+from ..serialization import dumps, loads
+
+# Append-only record of which tags were added to which commit, so tagging
+# does not have to rewrite the commit file
+COMMIT_INDEX_FILE = "_by_commit.jsonl"
 
 
 class TagStorage:
@@ -17,24 +22,87 @@ class TagStorage:
 
     def __init__(self, tags_dir: Path):
         self.tags_dir = tags_dir
+        self.commit_index_file = tags_dir / COMMIT_INDEX_FILE
+
+        # Commit hash -> tag names, keyed on the (mtime_ns, size) of the index it was read from
+        self._by_commit: Optional[tuple[tuple[int, int], dict[str, list[str]]]] = None
 
     def save(self, tag: ExperimentTag) -> None:
         """Save an experiment tag."""
         tag_path = self.tags_dir / f"{tag.name}.json"
-        tag_path.write_text(tag.model_dump_json(indent=2))
+        tag_path.write_text(tag.model_dump_json())
 
     def load(self, tag_name: str) -> Optional[ExperimentTag]:
         """Load a tag by name."""
         tag_path = self.tags_dir / f"{tag_name}.json"
-        if not tag_path.exists():
+        try:
+            data = loads(tag_path.read_bytes())
+        except FileNotFoundError:
+            return None
+
+        return ExperimentTag.from_trusted(data)
+
+    def append_commit_tag(self, commit_hash: str, tag_name: str) -> None:
+        """Record that a commit was tagged."""
+        with open(self.commit_index_file, "ab") as f:
+            f.write(dumps({"commit": commit_hash, "tag": tag_name}) + b"\n")
+
+    def tags_for_commit(self, commit_hash: str) -> list[str]:
+        """Return tag names recorded for a commit in the order they were added."""
+        return self._commit_tags().get(commit_hash, [])
+
+    def index_key(self) -> Optional[tuple[int, int]]:
+        """Return the commit tag index's (mtime_ns, size), which changes with every new tag."""
+        try:
+            stat = os.stat(self.commit_index_file)
+        except FileNotFoundError:
             return None
+        return (stat.st_mtime_ns, stat.st_size)
 
-        data = json.loads(tag_path.read_text())
-        return ExperimentTag(**data)
+    def _commit_tags(self) -> dict[str, list[str]]:
+        """Read the commit tag index, reusing the parsed copy while the file is unchanged."""
+        key = self.index_key()
+        if key is None:
+            return {}
+
+        if self._by_commit is not None and self._by_commit[0] == key:
+            return self._by_commit[1]
+
+        by_commit: dict[str, list[str]] = {}
+        for line in self.commit_index_file.read_bytes().splitlines():
+            if line.strip():
+                record = loads(line)
+                names = by_commit.setdefault(record["commit"], [])
+                if record["tag"] not in names:
+                    names.append(record["tag"])
+
+        self._by_commit = (key, by_commit)
+        return by_commit
 
     def list_all(self) -> list[str]:
         """List all tag names."""
-        if not self.tags_dir.exists():
-            return []
+        return [os.path.basename(path)[:-5] for path in self._tag_paths()]
+
+    def load_all(self) -> list[ExperimentTag]:
+        """Load every tag in one directory pass."""
+        tags = []
+        for path in self._tag_paths():
+            try:
+                data = loads(Path(path).read_bytes())
+            except FileNotFoundError:
+                continue  # Removed since the directory was scanned
+            tags.append(ExperimentTag.from_trusted(data))
+        return tags
 
-        return [f.stem for f in self.tags_dir.glob("*.json")]
+    def _tag_paths(self) -> list[str]:
+        """Return the paths of all tag files."""
+        try:
+            with os.scandir(self.tags_dir) as entries:
+                # Match glob("*.json"), which skips hidden files
+                return [
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith(".json") and not entry.name.startswith(".")
+                ]
+        except FileNotFoundError:
+            return []
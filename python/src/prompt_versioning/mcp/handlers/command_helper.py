@@ -8,6 +8,7 @@ Licensed under MIT License
 import re
 import subprocess
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import Any, Optional
 
 
@@ -32,6 +33,73 @@ class CommandInfo:
     flags: list[CommandFlag] = field(default_factory=list)
     subcommands: list[str] = field(default_factory=list)
 
+    @cached_property
+    def flags_by_name(self) -> dict[str, CommandFlag]:
+        """Flags keyed by dash-separated name; the first flag wins on clashes."""
+        lookup: dict[str, CommandFlag] = {}
+        for flag in self.flags:
+            lookup.setdefault(flag.name.replace("_", "-"), flag)
+        return lookup
+
+
+# Option lines from click's --help output, with or without a short form, e.g.
+#   -m, --message TEXT  Commit message  [required]
+#   --help              Show this message and exit.
+_OPTION_LINE = re.compile(
+    r"^\s*(?:(?P<short>-\w),\s+)?(?P<long>--[\w-]+)\s+(?P<type>\w+)?\s+(?P<description>.+?)"
+    r"(?:\s+(?P<required>\[required\]))?$"
+)
+
+
+def _render_cli_help(subcommand: Optional[str]) -> str:
+    """Render promptvc's own --help text in-process from the Click command tree."""
+    import click
+
+    from ...cli.main import cli
+
+    with click.Context(cli, info_name="promptvc") as ctx:
+        if not subcommand:
+            return cli.get_help(ctx) + "\n"
+
+        command = cli.get_command(ctx, subcommand)
+        if command is None:
+            raise subprocess.CalledProcessError(2, ["promptvc", subcommand, "--help"])
+
+        with click.Context(command, info_name=subcommand, parent=ctx) as sub_ctx:
+            return command.get_help(sub_ctx) + "\n"
+
+
+@lru_cache(maxsize=64)
+def _run_help(base_command: str, subcommand: Optional[str]) -> str:
+    """Run `<base_command> [subcommand] --help` and return its output (cached per command)."""
+    # promptvc is this package, so skip spawning a second interpreter for it
+    if base_command == "promptvc":
+        return _render_cli_help(subcommand)
+
+    cmd = [base_command]
+    if subcommand:
+        cmd.append(subcommand)
+    cmd.append("--help")
+
+    result = subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        timeout=5,
+    )
+
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+
+    return result.stdout
+
+
+@lru_cache(maxsize=64)
+def _command_info(base_command: str, subcommand: Optional[str]) -> "CommandInfo":
+    """Fetch and parse help for a command once per process."""
+    helper = CommandHelper(base_command)
+    return helper.parse_help_output(helper.get_help(subcommand))
+
 
 class CommandHelper:
     """Helper for introspecting and building CLI commands."""
@@ -49,6 +117,10 @@ class CommandHelper:
         """
         Get help text for a command or subcommand.
 
+        The output is cached, so only the first call per subcommand renders
+        it. Help for promptvc itself is rendered in-process from the Click
+        commands; other base commands spawn a process. Failures are not cached.
+
         Args:
             subcommand: Optional subcommand to get help for
 
@@ -58,24 +130,22 @@ class CommandHelper:
         Raises:
             subprocess.CalledProcessError: If command fails
         """
-        cmd = [self.base_command]
-        if subcommand:
-            cmd.append(subcommand)
-        cmd.append("--help")
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
+        return _run_help(self.base_command, subcommand)
 
-        if result.returncode != 0:
-            raise subprocess.CalledProcessError(
-                result.returncode, cmd, result.stdout, result.stderr
-            )
+    def get_command_info(self, subcommand: Optional[str] = None) -> CommandInfo:
+        """
+        Get parsed help information for a command or subcommand.
 
-        return result.stdout
+        Args:
+            subcommand: Optional subcommand to get information for
+
+        Returns:
+            Parsed command information (cached; treat as read-only)
+
+        Raises:
+            subprocess.CalledProcessError: If command fails
+        """
+        return _command_info(self.base_command, subcommand)
 
     def parse_help_output(self, help_text: str) -> CommandInfo:
         """
@@ -93,44 +163,40 @@ class CommandHelper:
         command = self.base_command
         description = ""
 
-        # Parse description (first line before Usage)
-        for line in lines:
-            if line.strip() and not line.startswith("Usage:"):
-                description = line.strip()
-                break
-
-        # Parse flags/options
         flags = []
+        subcommands = []
         in_options = False
+        in_commands = False
 
-        for _i, line in enumerate(lines):
-            if line.strip().startswith("Options:"):
-                in_options = True
+        # Single pass: description is the first non-Usage line, then
+        # options and subcommands are collected by section
+        for line in lines:
+            stripped = line.strip()
+            if not stripped:
                 continue
 
-            if line.strip().startswith("Commands:"):
+            if not description and not line.startswith("Usage:"):
+                description = stripped
+
+            if stripped.startswith("Commands:"):
                 in_options = False
+                in_commands = True
                 continue
 
-            if in_options and line.strip():
-                flag = self._parse_option_line(line)
-                if flag:
-                    flags.append(flag)
-
-        # Parse subcommands
-        subcommands = []
-        in_commands = False
+            if in_commands:
+                # Format: "  command    Description"
+                name = stripped.split(None, 1)[0]
+                if not name.startswith("-"):
+                    subcommands.append(name)
 
-        for line in lines:
-            if line.strip().startswith("Commands:"):
-                in_commands = True
+            if stripped.startswith("Options:"):
+                in_options = True
                 continue
 
-            if in_commands and line.strip():
-                # Format: "  command    Description"
-                parts = line.strip().split(None, 1)
-                if parts and not parts[0].startswith("-"):
-                    subcommands.append(parts[0])
+            if in_options:
+                flag = self._parse_option_line(stripped)
+                if flag:
+                    flags.append(flag)
 
         return CommandInfo(
             command=command,
@@ -160,56 +226,22 @@ class CommandHelper:
         if not line or not line.startswith("-"):
             return None
 
-        # Extract flag forms and description
-        # Pattern: short_form, long_form TYPE description [required]
-        match = re.match(
-            r"^\s*(-\w),\s+(--[\w-]+)\s+(\w+)?\s+(.+?)(?:\s+\[required\])?$",
-            line,
-        )
-
+        # Pattern: [short_form, ]long_form TYPE description [required]
+        match = _OPTION_LINE.match(line)
         if not match:
-            # Try pattern without short form: --long_form TYPE description
-            match = re.match(
-                r"^\s*(--[\w-]+)\s+(\w+)?\s+(.+?)(?:\s+\[required\])?$",
-                line,
-            )
-            if match:
-                long_form = match.group(1)
-                value_type = match.group(2)
-                description = match.group(3).strip()
-                required = "[required]" in line
-
-                # Derive name from long form
-                name = long_form.removeprefix("--").replace("-", "_")
-
-                return CommandFlag(
-                    name=name,
-                    short_form="",
-                    long_form=long_form,
-                    description=description,
-                    required=required,
-                    has_value=bool(value_type),
-                )
-        else:
-            short_form = match.group(1)
-            long_form = match.group(2)
-            value_type = match.group(3)
-            description = match.group(4).strip()
-            required = "[required]" in line
-
-            # Derive name from long form
-            name = long_form.removeprefix("--").replace("-", "_")
+            return None
 
-            return CommandFlag(
-                name=name,
-                short_form=short_form,
-                long_form=long_form,
-                description=description,
-                required=required,
-                has_value=bool(value_type),
-            )
+        long_form = match.group("long")
 
-        return None
+        return CommandFlag(
+            # Derive name from long form
+            name=long_form.removeprefix("--").replace("-", "_"),
+            short_form=match.group("short") or "",
+            long_form=long_form,
+            description=match.group("description").strip(),
+            required=match.group("required") is not None,
+            has_value=bool(match.group("type")),
+        )
 
     def build_command(
         self,
@@ -233,20 +265,15 @@ class CommandHelper:
         # If no command info provided, try to get it
         if command_info is None:
             try:
-                help_text = self.get_help(subcommand)
-                command_info = self.parse_help_output(help_text)
+                command_info = self.get_command_info(subcommand)
             except Exception:
                 # If we can't get help, just build command with args as-is
                 command_info = CommandInfo(command=self.base_command, description="")
 
         # Build flag arguments
         for key, value in args.items():
-            # Find matching flag in command info
-            flag = None
-            for f in command_info.flags:
-                if f.name == key or f.name.replace("_", "-") == key.replace("_", "-"):
-                    flag = f
-                    break
+            # Find matching flag in command info (underscores and dashes are interchangeable)
+            flag = command_info.flags_by_name.get(key.replace("_", "-"))
 
             if flag:
                 # Use long form if available
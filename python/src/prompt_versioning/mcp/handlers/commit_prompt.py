@@ -5,8 +5,18 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import asyncio
+from pathlib import Path
 from typing import Any, Optional
 
+from ...core.serialization import load_yaml
+
+
+def _load_prompt_file(file_path: Path) -> Any:
+    """Read a prompt YAML file (run off the event loop)."""
+    with open(file_path) as f:
+        return load_yaml(f)
+
 
 async def handle_commit_prompt(repo: Optional[Any], args: dict[str, Any]) -> dict[str, Any]:
     """Commit a prompt."""
@@ -20,14 +30,9 @@ async def handle_commit_prompt(repo: Optional[Any], args: dict[str, Any]) -> dic
 
     # Support file parameter - load YAML file if provided
     if file_path and not prompt_data:
-        from pathlib import Path
-
-        import yaml
-
         try:
             file_full_path = Path(repo.repo_path) / file_path
-            with open(file_full_path) as f:
-                prompt_data = yaml.safe_load(f)
+            prompt_data = await asyncio.to_thread(_load_prompt_file, file_full_path)
         except FileNotFoundError:
             return {"success": False, "error": f"File not found: {file_path}"}
         except Exception as e:
@@ -5,15 +5,38 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import asyncio
+import os
 import re
-from pathlib import Path
 from typing import Any, Optional
 
-import yaml
+from ...core.serialization import dump_yaml, load_yaml
 
 # Default prompts directory
 DEFAULT_PROMPTS_DIR = "prompts"
 
+# Words considered for automatic file names, and common words skipped
+_WORD_RE = re.compile(r"\b[a-z]+\b")
+_STOP_WORDS = frozenset(
+    {
+        "you",
+        "are",
+        "a",
+        "an",
+        "the",
+        "is",
+        "to",
+        "for",
+        "and",
+        "or",
+        "your",
+        "with",
+        "in",
+        "on",
+        "at",
+    }
+)
+
 
 def _generate_meaningful_name(
     system_prompt: Optional[str] = None, user_template: Optional[str] = None
@@ -31,28 +54,14 @@ def _generate_meaningful_name(
     # Try to extract meaningful words from system prompt first
     text = system_prompt or user_template or "prompt"
 
-    # Extract key words (lowercase, alphanumeric, convert spaces/underscores to hyphens)
-    words = re.findall(r"\b[a-z]+\b", text.lower())
-
-    # Filter out common words and take first few meaningful ones
-    stop_words = {
-        "you",
-        "are",
-        "a",
-        "an",
-        "the",
-        "is",
-        "to",
-        "for",
-        "and",
-        "or",
-        "your",
-        "with",
-        "in",
-        "on",
-        "at",
-    }
-    meaningful_words = [w for w in words if w not in stop_words and len(w) > 2][:3]
+    # Take the first few meaningful words, stopping as soon as there are enough
+    meaningful_words = []
+    for match in _WORD_RE.finditer(text.lower()):
+        word = match.group()
+        if len(word) > 2 and word not in _STOP_WORDS:
+            meaningful_words.append(word)
+            if len(meaningful_words) == 3:
+                break
 
     if meaningful_words:
         return "-".join(meaningful_words)
@@ -60,6 +69,26 @@ def _generate_meaningful_name(
     return "prompt"
 
 
+def _load_prompt_file(file_path: str) -> dict[str, Any]:
+    """Read an existing prompt file (run off the event loop)."""
+    with open(file_path) as f:
+        return load_yaml(f) or {}
+
+
+def _write_prompt_file(file_path: str, prompt_data: dict[str, Any]) -> str:
+    """
+    Write a prompt file, creating its directory (run off the event loop).
+
+    Returns:
+        The YAML text that was written
+    """
+    contents: str = dump_yaml(prompt_data, sort_keys=False)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "w") as f:
+        f.write(contents)
+    return contents
+
+
 async def handle_create_prompt(
     repo: Optional[Any],
     args: dict[str, Any],
@@ -104,25 +133,24 @@ async def handle_create_prompt(
         if not file_path:
             file_path = f"{DEFAULT_PROMPTS_DIR}/{name}.yaml"
 
-        # Resolve relative to repo_path if provided
+        # Resolve relative to repo_path if provided; plain os.path strings
+        # avoid allocating a new Path object for every step
         if repo_path:
-            file_path = Path(repo_path) / file_path
-        else:
-            file_path = Path(file_path)
+            file_path = os.path.join(repo_path, file_path)
+        file_path = os.path.normpath(file_path)
 
-        # If the path doesn't include a directory and doesn't start with ./
-        # automatically place it in the prompts directory
-        if not file_path.parent.name and file_path.parent == Path("."):
-            file_path = Path(DEFAULT_PROMPTS_DIR) / file_path
+        # If the path doesn't include a directory, automatically place it in
+        # the prompts directory
+        if not os.path.dirname(file_path):
+            file_path = os.path.join(DEFAULT_PROMPTS_DIR, file_path)
 
         # Check if file exists and handle append mode
         existing_data: dict[str, Any] = {}
         append = args.get("append", False)
 
-        if file_path.exists():
+        if os.path.exists(file_path):
             if append:
-                with open(file_path) as f:
-                    existing_data = yaml.safe_load(f) or {}
+                existing_data = await asyncio.to_thread(_load_prompt_file, file_path)
             elif not args.get("overwrite", False):
                 return {
                     "success": False,
@@ -160,25 +188,13 @@ async def handle_create_prompt(
                 "error": "Prompt must have at least 'system' or 'user_template' field",
             }
 
-        # Create directory if it doesn't exist
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write to file
-        with open(file_path, "w") as f:
-            yaml.dump(prompt_data, f, default_flow_style=False, sort_keys=False)
-
-        # Read back for confirmation
-        with open(file_path) as f:
-            file_contents = f.read()
-
-        # Read back for confirmation
-        with open(file_path) as f:
-            file_contents = f.read()
+        # Write the file; the serialized text doubles as the confirmation contents
+        file_contents = await asyncio.to_thread(_write_prompt_file, file_path, prompt_data)
 
         return {
             "success": True,
             "message": f"Prompt file {'updated' if append else 'created'}: {file_path}",
-            "path": str(file_path.resolve()),
+            "path": os.path.realpath(file_path),
             "contents": file_contents,
             "data": prompt_data,
             "display": f"✅ Created prompt file: {file_path}\n\nContents:\n{file_contents}",
@@ -5,11 +5,59 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-import subprocess
-from typing import Any
+import asyncio
+import io
+import json
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any, Optional
 
 from .command_helper import CommandHelper
 
+# Stateless, so one instance serves every request
+_helper = CommandHelper("promptvc")
+
+COMMAND_TIMEOUT = 30
+
+
+async def _run(
+    cmd_parts: list[str], stdin: Optional[bytes] = None, timeout: Optional[float] = None
+) -> tuple[int, str, str]:
+    """
+    Run a command without blocking the event loop.
+
+    Args:
+        cmd_parts: Command and arguments
+        stdin: Optional data to send on standard input
+        timeout: Seconds to wait (default: COMMAND_TIMEOUT)
+
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+
+    Raises:
+        asyncio.TimeoutError: If the command runs longer than the timeout
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd_parts,
+        stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            proc.communicate(stdin), timeout=timeout or COMMAND_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+    return (
+        proc.returncode if proc.returncode is not None else -1,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
 
 async def handle_execute_command(
     _request: Any,
@@ -51,21 +99,22 @@ async def handle_execute_command(
             "display": "❌ Error: No command specified",
         }
 
-    helper = CommandHelper("promptvc")
     command_info = None
 
-    # Optionally check help first
+    # Optionally check help first (parsed help is cached per subcommand)
     if check_help:
         try:
-            help_text = helper.get_help(command)
-            command_info = helper.parse_help_output(help_text)
+            # The first lookup per subcommand spawns --help; keep it off the event loop
+            command_info = await asyncio.to_thread(_helper.get_command_info, command)
         except Exception:
             # Help check failed, but continue with execution
             pass
 
-    # Build command
+    # Build command (without command_info this spawns --help, so keep it off the event loop)
     try:
-        cmd_parts = helper.build_command(command, parameters, command_info)
+        cmd_parts = await asyncio.to_thread(
+            _helper.build_command, command, parameters, command_info
+        )
     except Exception as e:
         return {
             "success": False,
@@ -79,14 +128,9 @@ async def handle_execute_command(
 
     # Execute command
     try:
-        result = subprocess.run(
-            cmd_parts,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        returncode, stdout, stderr = await _run(cmd_parts)
 
-        success = result.returncode == 0
+        success = returncode == 0
         cmd_str = " ".join(cmd_parts)
 
         # Build display output
@@ -104,22 +148,22 @@ async def handle_execute_command(
 
         if success:
             display_parts.append("✅ Command executed successfully")
-            if result.stdout:
+            if stdout:
                 display_parts.append("\nOutput:")
-                display_parts.append(result.stdout)
+                display_parts.append(stdout)
         else:
-            display_parts.append(f"❌ Command failed (exit code: {result.returncode})")
-            if result.stderr:
+            display_parts.append(f"❌ Command failed (exit code: {returncode})")
+            if stderr:
                 display_parts.append("\nError output:")
-                display_parts.append(result.stderr)
+                display_parts.append(stderr)
 
         display = "\n".join(display_parts)
 
         response = {
             "success": success,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "returncode": result.returncode,
+            "stdout": stdout,
+            "stderr": stderr,
+            "returncode": returncode,
             "command": cmd_str,
             "display": display,
         }
@@ -143,15 +187,15 @@ async def handle_execute_command(
 
         return response
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return {
             "success": False,
-            "error": "Command timed out after 30 seconds",
+            "error": f"Command timed out after {COMMAND_TIMEOUT} seconds",
             "stdout": "",
             "stderr": "",
             "returncode": -1,
             "command": " ".join(cmd_parts),
-            "display": "❌ Error: Command timed out after 30 seconds",
+            "display": f"❌ Error: Command timed out after {COMMAND_TIMEOUT} seconds",
         }
     except Exception as e:
         return {
@@ -163,3 +207,149 @@ async def handle_execute_command(
             "command": " ".join(cmd_parts),
             "display": f"❌ Error executing command: {str(e)}",
         }
+
+
+async def handle_execute_batch(
+    _request: Any,
+    arguments: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Execute several promptvc commands in a single interpreter.
+
+    Starting Python dominates the cost of a short promptvc command, so the
+    commands are sent to one worker process that runs them in order instead
+    of spawning promptvc once per command.
+
+    Args:
+        _request: MCP request object (unused)
+        arguments: Batch arguments containing:
+            - inputs: List of {"command": ..., "parameters": {...}} (required)
+
+    Returns:
+        Dictionary with execution results:
+            - success: Whether every command succeeded
+            - results: Per-command success, stdout, stderr, returncode and command
+            - display: Formatted output for display
+            - error: Error message (if the batch could not run)
+    """
+    inputs = arguments.get("inputs") or []
+    if not inputs or not all(isinstance(item, dict) and item.get("command") for item in inputs):
+        return {
+            "success": False,
+            "error": "No commands specified",
+            "results": [],
+            "display": "❌ Error: Every batch input needs a command",
+        }
+
+    try:
+        # Building may spawn --help for each subcommand, so keep it off the event loop
+        commands = await asyncio.to_thread(_build_commands, inputs)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to build command: {str(e)}",
+            "results": [],
+            "display": f"❌ Error building command: {str(e)}",
+        }
+
+    timeout = COMMAND_TIMEOUT * len(commands)
+    try:
+        returncode, stdout, stderr = await _run(
+            [sys.executable, "-m", __name__],
+            stdin=json.dumps([cmd[1:] for cmd in commands]).encode(),
+            timeout=timeout,
+        )
+        if returncode != 0:
+            raise RuntimeError(stderr.strip() or f"batch worker exited with code {returncode}")
+        outcomes = json.loads(stdout)
+        if len(outcomes) != len(commands):
+            raise RuntimeError(
+                f"batch worker returned {len(outcomes)} results for {len(commands)} commands"
+            )
+    except asyncio.TimeoutError:
+        return {
+            "success": False,
+            "error": f"Batch timed out after {timeout} seconds",
+            "results": [],
+            "display": f"❌ Error: Batch timed out after {timeout} seconds",
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to execute batch: {str(e)}",
+            "results": [],
+            "display": f"❌ Error executing batch: {str(e)}",
+        }
+
+    results = []
+    display_parts = []
+    for cmd, (code, out, err) in zip(commands, outcomes):
+        cmd_str = " ".join(cmd)
+        results.append(
+            {
+                "success": code == 0,
+                "stdout": out,
+                "stderr": err,
+                "returncode": code,
+                "command": cmd_str,
+            }
+        )
+        status = "✅" if code == 0 else f"❌ (exit code: {code})"
+        display_parts.append(f"{status} {cmd_str}")
+        if out or err:
+            display_parts.append(out or err)
+
+    return {
+        "success": all(r["success"] for r in results),
+        "results": results,
+        "display": "\n".join(display_parts),
+    }
+
+
+def _build_commands(inputs: list[dict[str, Any]]) -> list[list[str]]:
+    """Build the argument list for each batch input."""
+    return [_helper.build_command(item["command"], item.get("parameters", {})) for item in inputs]
+
+
+def _run_batch(commands: list[list[str]]) -> list[tuple[int, str, str]]:
+    """Run promptvc argument lists in this process, capturing each one's output."""
+    import click
+
+    from ...cli.main import cli
+
+    outcomes = []
+    for args in commands:
+        # Text streams over byte buffers, since commands such as audit echo bytes,
+        # which click writes to the stream's .buffer
+        out_bytes, err_bytes = io.BytesIO(), io.BytesIO()
+        out = io.TextIOWrapper(out_bytes, encoding="utf-8", write_through=True)
+        err = io.TextIOWrapper(err_bytes, encoding="utf-8", write_through=True)
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                code = cli.main(args=args, prog_name="promptvc", standalone_mode=False)
+            except click.ClickException as e:
+                e.show()
+                code = e.exit_code
+            except click.Abort:
+                click.echo("Aborted!", err=True)
+                code = 1
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                click.echo(f"✗ Execution failed: {e}", err=True)
+                code = 1
+        out.flush()
+        err.flush()
+        outcomes.append(
+            (
+                code if isinstance(code, int) else 0,
+                out_bytes.getvalue().decode("utf-8", errors="replace"),
+                err_bytes.getvalue().decode("utf-8", errors="replace"),
+            )
+        )
+    return outcomes
+
+
+if __name__ == "__main__":
+    # Batch worker: JSON list of argument lists on stdin, JSON results on stdout
+    json.dump(_run_batch(json.load(sys.stdin)), sys.stdout)
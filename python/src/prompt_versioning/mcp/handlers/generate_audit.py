@@ -14,10 +14,16 @@ async def handle_generate_audit(repo: Optional[Any], args: dict[str, Any]) -> di
         return {"success": False, "error": "Repository not initialized"}
 
     format_type = args.get("format", "json")
+    offset = args.get("offset", 0)
+    limit = args.get("limit")
 
     try:
-        audit_data = repo.audit_log(format=format_type)
+        audit_data = repo.audit_log(format=format_type, offset=offset, limit=limit)
 
-        return {"success": True, "format": format_type, "data": audit_data}
+        result = {"success": True, "format": format_type, "data": audit_data}
+        if limit is not None:
+            # Cursor for the next page; a page with no entries marks the end
+            result["next_offset"] = offset + limit
+        return result
     except Exception as e:
         return {"success": False, "error": str(e)}
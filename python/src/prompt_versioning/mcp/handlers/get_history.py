@@ -8,6 +8,17 @@ Licensed under MIT License
 from typing import Any, Optional
 
 
+def _display_line(entry: dict[str, Any]) -> str:
+    """Format one history entry for display."""
+    # The ISO timestamp sliced to seconds matches strftime("%Y-%m-%d %H:%M:%S")
+    # without formatting the datetime again
+    tags_str = f" [{', '.join(entry['tags'])}]" if entry["tags"] else ""
+    return (
+        f"• {entry['short_hash']} - {entry['message']}{tags_str}\n"
+        f"  {entry['author']} | {entry['timestamp'][:19].replace('T', ' ')}"
+    )
+
+
 async def handle_get_history(repo: Optional[Any], args: dict[str, Any]) -> dict[str, Any]:
     """Get commit history."""
     if not repo or not repo.exists():
@@ -18,31 +29,25 @@ async def handle_get_history(repo: Optional[Any], args: dict[str, Any]) -> dict[
         }
 
     max_count = args.get("max_count")
+    skip = args.get("skip", 0)
 
     try:
-        versions = repo.log(max_count)
+        versions = repo.log(max_count, skip)
+
+        history = [
+            {
+                "hash": commit.hash,
+                "short_hash": commit.short_hash(),
+                "message": commit.message,
+                "author": commit.author,
+                "timestamp": commit.timestamp.isoformat(),
+                "tags": commit.tags,
+            }
+            for commit in (version.commit for version in versions)
+        ]
 
-        history = []
         display_lines = ["📜 Commit History\n"]
-
-        for version in versions:
-            history.append(
-                {
-                    "hash": version.commit.hash,
-                    "short_hash": version.commit.short_hash(),
-                    "message": version.commit.message,
-                    "author": version.commit.author,
-                    "timestamp": version.commit.timestamp.isoformat(),
-                    "tags": version.commit.tags,
-                }
-            )
-
-            # Format display
-            tags_str = f" [{', '.join(version.commit.tags)}]" if version.commit.tags else ""
-            display_lines.append(
-                f"• {version.commit.short_hash()} - {version.commit.message}{tags_str}\n"
-                f"  {version.commit.author} | {version.commit.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
-            )
+        display_lines.extend(map(_display_line, history))
 
         display = "\n\n".join(display_lines) if history else "No commits yet."
 
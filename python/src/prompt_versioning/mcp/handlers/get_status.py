@@ -30,28 +30,33 @@ async def handle_get_status(repo: Optional[Any], args: dict[str, Any]) -> dict[s
                 "display": "✓ Repository initialized\n❌ No commits yet. Use 'promptvc commit' to create your first commit.",
             }
 
+        commit = current.commit
+        short_hash = commit.short_hash()
+        timestamp = commit.timestamp.isoformat()
+
         # Format tags
-        tags_str = f"\nTags: {', '.join(current.commit.tags)}" if current.commit.tags else ""
+        tags_str = f"\nTags: {', '.join(commit.tags)}" if commit.tags else ""
 
-        # Format display output
+        # Format display output; the ISO timestamp's first 19 characters are
+        # the same as strftime("%Y-%m-%d %H:%M:%S")
         display = f"""✓ Repository Status
 
-Commit:     {current.commit.short_hash()}
-Message:    {current.commit.message}
-Author:     {current.commit.author}
-Date:       {current.commit.timestamp.strftime('%Y-%m-%d %H:%M:%S')}{tags_str}"""
+Commit:     {short_hash}
+Message:    {commit.message}
+Author:     {commit.author}
+Date:       {timestamp[:19].replace('T', ' ')}{tags_str}"""
 
         return {
             "success": True,
             "initialized": True,
             "has_commits": True,
             "current_commit": {
-                "hash": current.commit.hash,
-                "short_hash": current.commit.short_hash(),
-                "message": current.commit.message,
-                "author": current.commit.author,
-                "timestamp": current.commit.timestamp.isoformat(),
-                "tags": current.commit.tags,
+                "hash": commit.hash,
+                "short_hash": short_hash,
+                "message": commit.message,
+                "author": commit.author,
+                "timestamp": timestamp,
+                "tags": commit.tags,
             },
             "display": display,
         }
@@ -6,13 +6,22 @@ Licensed under MIT License
 """
 
 import subprocess
+import threading
+from collections.abc import Iterable
 from typing import Optional
 
+from .command_helper import CommandHelper
+
+_helper = CommandHelper("promptvc")
+
 
 def check_command_help(command: str) -> Optional[dict]:
     """
     Check command --help before execution.
 
+    The help text is cached per command, so only the first check for a
+    command renders `promptvc <command> --help`.
+
     Args:
         command: The subcommand to check (e.g., 'commit', 'init', 'log')
 
@@ -20,31 +29,9 @@ def check_command_help(command: str) -> Optional[dict]:
         Dictionary with help information or None if failed
     """
     try:
-        result = subprocess.run(
-            ["promptvc", command, "--help"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-
-        if result.returncode == 0:
-            # Extract just the options section for preview
-            help_output = result.stdout
-            options_preview = []
-
-            if "Options:" in help_output:
-                options_section = help_output.split("Options:")[1]
-                # Get first few lines of options
-                for line in options_section.split("\n")[:8]:
-                    if line.strip() and not line.startswith("Usage:"):
-                        options_preview.append(line)
-
-            return {
-                "command": f"promptvc {command}",
-                "help_output": help_output,
-                "options_preview": options_preview,
-                "checked": True,
-            }
+        help_output = _helper.get_help(command)
+    except subprocess.CalledProcessError:
+        return None
     except Exception as e:
         return {
             "command": f"promptvc {command}",
@@ -52,7 +39,42 @@ def check_command_help(command: str) -> Optional[dict]:
             "checked": False,
         }
 
-    return None
+    # Extract just the options section for preview
+    options_preview = []
+
+    if "Options:" in help_output:
+        options_section = help_output.split("Options:")[1]
+        # Get first few lines of options
+        for line in options_section.split("\n")[:8]:
+            if line.strip() and not line.startswith("Usage:"):
+                options_preview.append(line)
+
+    return {
+        "command": f"promptvc {command}",
+        "help_output": help_output,
+        "options_preview": options_preview,
+        "checked": True,
+    }
+
+
+def warm_help_cache(commands: Iterable[str]) -> threading.Thread:
+    """
+    Fetch help for commands in a background thread.
+
+    Args:
+        commands: Subcommands whose help should be cached ahead of use
+
+    Returns:
+        The started (daemon) thread
+    """
+
+    def warm() -> None:
+        for command in commands:
+            check_command_help(command)
+
+    thread = threading.Thread(target=warm, name="promptvc-help-warmup", daemon=True)
+    thread.start()
+    return thread
 
 
 def format_help_display(help_info: dict, success_message: str = "") -> str:
@@ -5,8 +5,11 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import os
 from typing import Any, Optional
 
+from ...core import PromptRepository
+
 
 async def handle_init_repository(
     repo: Optional[Any],
@@ -15,10 +18,6 @@ async def handle_init_repository(
     server: Optional[Any] = None,
 ) -> dict[str, Any]:
     """Initialize repository."""
-    from pathlib import Path
-
-    from ...core import PromptRepository
-
     # Use provided path or repo_path from server, fallback to current directory
     path = args.get("path") or repo_path or "."
 
@@ -32,11 +31,12 @@ async def handle_init_repository(
             except Exception:
                 pass
 
+        abs_path = os.path.abspath(path)
         return {
             "success": True,
-            "message": f"Repository initialized at {Path(path).resolve()}",
-            "path": str(Path(path).resolve()),
-            "display": f"✅ Repository initialized at {Path(path).resolve()}",
+            "message": f"Repository initialized at {abs_path}",
+            "path": abs_path,
+            "display": f"✅ Repository initialized at {abs_path}",
         }
     except FileExistsError:
         return {"success": False, "error": "Repository already exists"}
@@ -8,6 +8,16 @@ Licensed under MIT License
 from typing import Any, Optional
 
 
+def _display_line(entry: dict[str, Any]) -> str:
+    """Format one tag entry for display."""
+    # created_at is already in ISO form, so the seconds prefix is the display time
+    metadata_str = f" | {entry['metadata']}" if entry["metadata"] else ""
+    return (
+        f"• {entry['name']} → {entry['commit_hash'][:8]}\n"
+        f"  Created: {entry['created_at'][:19].replace('T', ' ')}{metadata_str}"
+    )
+
+
 async def handle_list_tags(repo: Optional[Any], args: dict[str, Any]) -> dict[str, Any]:
     """List all tags."""
     if not repo or not repo.exists():
@@ -20,25 +30,18 @@ async def handle_list_tags(repo: Optional[Any], args: dict[str, Any]) -> dict[st
     try:
         tags = repo.list_tags()
 
-        tag_list = []
-        display_lines = ["🏷️  Experiment Tags\n"]
+        tag_list = [
+            {
+                "name": tag.name,
+                "commit_hash": tag.commit_hash,
+                "created_at": tag.created_at.isoformat(),
+                "metadata": tag.metadata,
+            }
+            for tag in tags
+        ]
 
-        for tag in tags:
-            tag_list.append(
-                {
-                    "name": tag.name,
-                    "commit_hash": tag.commit_hash,
-                    "created_at": tag.created_at.isoformat(),
-                    "metadata": tag.metadata,
-                }
-            )
-
-            # Format display
-            metadata_str = f" | {tag.metadata}" if tag.metadata else ""
-            display_lines.append(
-                f"• {tag.name} → {tag.commit_hash[:8]}\n"
-                f"  Created: {tag.created_at.strftime('%Y-%m-%d %H:%M:%S')}{metadata_str}"
-            )
+        display_lines = ["🏷️  Experiment Tags\n"]
+        display_lines.extend(map(_display_line, tag_list))
 
         display = (
             "\n\n".join(display_lines)
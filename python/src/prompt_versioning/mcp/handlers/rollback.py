@@ -5,12 +5,17 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+from collections.abc import Awaitable
 from typing import Any, Optional
 
 from .checkout_version import handle_checkout_version
 
 
-async def handle_rollback(repo: Optional[Any], args: dict[str, Any]) -> dict[str, Any]:
-    """Rollback to a previous version."""
-    version = args.get("version")
-    return await handle_checkout_version(repo, {"version": version})
+def handle_rollback(repo: Optional[Any], args: dict[str, Any]) -> Awaitable[dict[str, Any]]:
+    """
+    Rollback to a previous version.
+
+    Returns the checkout handler's coroutine directly rather than awaiting it
+    in a wrapper coroutine; callers await it like any other handler.
+    """
+    return handle_checkout_version(repo, {"version": args.get("version")})
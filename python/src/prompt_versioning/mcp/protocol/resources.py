@@ -6,12 +6,18 @@ Licensed under MIT License
 """
 
 from dataclasses import asdict
+from functools import lru_cache
 
 from .models import MCPResource
 
+# Commits included in the promptvc://history resource; use the
+# promptvc_get_history tool (max_count/skip) to page further back
+HISTORY_RESOURCE_LIMIT = 50
 
+
+@lru_cache(maxsize=1)
 def get_resource_definitions() -> list[dict]:
-    """Get all MCP resource definitions."""
+    """Get all MCP resource definitions (built once; treat as read-only)."""
     resources = [
         MCPResource(
             uri="promptvc://status",
@@ -22,7 +28,7 @@ def get_resource_definitions() -> list[dict]:
         MCPResource(
             uri="promptvc://history",
             name="Commit History",
-            description="Full commit history",
+            description=f"Latest {HISTORY_RESOURCE_LIMIT} commits",
             mimeType="application/json",
         ),
         MCPResource(
@@ -9,12 +9,16 @@ import asyncio
 import json
 import logging
 import os
+import stat
 import sys
+from collections import OrderedDict
 from dataclasses import asdict
+from itertools import groupby
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Union
 
 from ...core import PromptRepository
+from ...core.serialization import dumps, loads
 from ..handlers import (
     handle_checkout_version,
     handle_commit_prompt,
@@ -28,9 +32,9 @@ from ..handlers import (
     handle_rollback,
     handle_tag_experiment,
 )
-from ..handlers.help_checker import check_command_help, format_help_display
+from ..handlers.help_checker import check_command_help, format_help_display, warm_help_cache
 from .models import MCPError, MCPRequest, MCPResponse
-from .resources import get_resource_definitions
+from .resources import HISTORY_RESOURCE_LIMIT, get_resource_definitions
 from .tools import get_tool_definitions
 
 # Setup logging
@@ -62,6 +66,51 @@ class PromptVCMCPServer:
     # Custom error codes
     AUTH_ERROR = -32001
 
+    # Map tool names to CLI commands for help checking
+    TOOL_COMMANDS = {
+        "promptvc_init_repository": "init",
+        "promptvc_commit": "commit",
+        "promptvc_create_prompt": "create-prompt",
+        "promptvc_get_history": "log",
+        "promptvc_diff": "diff",
+        "promptvc_checkout": "checkout",
+        "promptvc_tag": "tag",
+        "promptvc_list_tags": "tags",
+        "promptvc_get_status": "status",
+        "promptvc_generate_audit": "audit",
+        "promptvc_rollback": "rollback",
+    }
+
+    # Number of read-only tool results kept until the repository changes
+    RESULT_CACHE_SIZE = 10
+
+    # Longest request line accepted on stdin (prompts can be large)
+    MAX_MESSAGE_SIZE = 32 * 1024 * 1024
+
+    # Most stdin requests answered together when several are already waiting
+    MAX_BATCH_SIZE = 16
+
+    # Requests that do not change the repository and may run concurrently
+    READ_ONLY_METHODS = frozenset(
+        {"initialize", "ping", "tools/list", "resources/list", "resources/read"}
+    )
+    READ_ONLY_TOOLS = frozenset(
+        {
+            "promptvc_get_history",
+            "promptvc_list_tags",
+            "promptvc_get_status",
+            "promptvc_diff",
+            "promptvc_generate_audit",
+        }
+    )
+
+    # Resource URIs and the read-only tool calls that produce them
+    RESOURCE_TOOLS: dict[str, tuple[str, dict[str, Any]]] = {
+        "promptvc://status": ("promptvc_get_status", {}),
+        "promptvc://history": ("promptvc_get_history", {"max_count": HISTORY_RESOURCE_LIMIT}),
+        "promptvc://tags": ("promptvc_list_tags", {}),
+    }
+
     def __init__(self, repo_path: str = ".", auth_token: Optional[str] = None):
         """
         Initialize MCP server.
@@ -73,6 +122,8 @@ class PromptVCMCPServer:
         self.repo_path = Path(repo_path)
         self.auth_token = auth_token or os.getenv("PROMPTVC_MCP_TOKEN")
         self.repo: Optional[PromptRepository] = None
+        self._result_cache: OrderedDict[tuple[str, str], tuple[Any, dict[str, Any]]] = OrderedDict()
+        self._resource_text: dict[str, tuple[Any, str]] = {}
 
         # Handler registry
         self.handlers: dict[str, Callable] = {
@@ -95,12 +146,18 @@ class PromptVCMCPServer:
             "promptvc_create_prompt": lambda args: handle_create_prompt(
                 self.repo, args, str(self.repo_path), self
             ),
-            "promptvc_get_history": lambda args: handle_get_history(self.repo, args),
+            "promptvc_get_history": lambda args: self._cached_query(
+                "promptvc_get_history", handle_get_history, args
+            ),
             "promptvc_diff": lambda args: handle_diff_versions(self.repo, args),
             "promptvc_checkout": lambda args: handle_checkout_version(self.repo, args),
             "promptvc_tag": lambda args: handle_tag_experiment(self.repo, args),
-            "promptvc_list_tags": lambda args: handle_list_tags(self.repo, args),
-            "promptvc_get_status": lambda args: handle_get_status(self.repo, args),
+            "promptvc_list_tags": lambda args: self._cached_query(
+                "promptvc_list_tags", handle_list_tags, args
+            ),
+            "promptvc_get_status": lambda args: self._cached_query(
+                "promptvc_get_status", handle_get_status, args
+            ),
             "promptvc_generate_audit": lambda args: handle_generate_audit(self.repo, args),
             "promptvc_rollback": lambda args: handle_rollback(self.repo, args),
         }
@@ -113,6 +170,38 @@ class PromptVCMCPServer:
         except Exception:
             self.repo = None
 
+    async def _cached_query(
+        self, tool_name: str, handler: Callable, args: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Run a read-only tool handler, reusing its result while the repository is unchanged.
+
+        Results are keyed on the tool and its arguments and validated against
+        the repository state key (HEAD, commit index and tag index), so commits, checkouts
+        and tags made through the CLI are picked up as well.
+        """
+        if not self.repo:
+            result: dict[str, Any] = await handler(self.repo, args)
+            return result
+
+        key = (tool_name, json.dumps(args, sort_keys=True))
+        state = self.repo.state_key()
+
+        cached = self._result_cache.get(key)
+        if cached is not None and cached[0] == state:
+            self._result_cache.move_to_end(key)
+            # Callers add fields such as help_info, so hand out a copy
+            return dict(cached[1])
+
+        result = await handler(self.repo, args)
+        if result.get("success"):
+            self._result_cache[key] = (state, result)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+            return dict(result)
+        return result
+
     # ==================== MCP Protocol Handlers ====================
 
     async def handle_initialize(self, params: dict[str, Any]) -> dict[str, Any]:
@@ -135,25 +224,10 @@ class PromptVCMCPServer:
         if tool_name not in self.tool_handlers:
             raise MCPError(self.INVALID_PARAMS, f"Tool not found: {tool_name}")
 
-        # Map tool names to CLI commands for help checking
-        tool_to_command = {
-            "promptvc_init_repository": "init",
-            "promptvc_commit": "commit",
-            "promptvc_create_prompt": "create-prompt",
-            "promptvc_get_history": "log",
-            "promptvc_diff": "diff",
-            "promptvc_checkout": "checkout",
-            "promptvc_tag": "tag",
-            "promptvc_list_tags": "tags",
-            "promptvc_get_status": "status",
-            "promptvc_generate_audit": "audit",
-            "promptvc_rollback": "rollback",
-        }
-
         # Check --help before executing
         help_info = None
-        if tool_name in tool_to_command:
-            command = tool_to_command[tool_name]
+        if tool_name in self.TOOL_COMMANDS:
+            command = self.TOOL_COMMANDS[tool_name]
             help_info = check_command_help(command)
 
         # Execute the handler
@@ -194,20 +268,22 @@ class PromptVCMCPServer:
         """Read a resource."""
         uri = params.get("uri", "")
 
-        if uri == "promptvc://status":
-            result = await self.tool_handlers["promptvc_get_status"]({})
-        elif uri == "promptvc://history":
-            result = await self.tool_handlers["promptvc_get_history"]({})
-        elif uri == "promptvc://tags":
-            result = await self.tool_handlers["promptvc_list_tags"]({})
-        else:
+        if uri not in self.RESOURCE_TOOLS:
             raise MCPError(self.INVALID_PARAMS, f"Unknown resource URI: {uri}")
+        tool_name, tool_args = self.RESOURCE_TOOLS[uri]
 
-        return {
-            "contents": [
-                {"uri": uri, "mimeType": "application/json", "text": json.dumps(result, indent=2)}
-            ]
-        }
+        # Reuse the serialized document while the repository is unchanged
+        state = self.repo.state_key() if self.repo else None
+        cached = self._resource_text.get(uri)
+        if state is not None and cached is not None and cached[0] == state:
+            text = cached[1]
+        else:
+            result = await self.tool_handlers[tool_name](tool_args)
+            text = dumps(result, indent=True).decode()
+            if state is not None and result.get("success"):
+                self._resource_text[uri] = (state, text)
+
+        return {"contents": [{"uri": uri, "mimeType": "application/json", "text": text}]}
 
     async def handle_ping(self, params: dict[str, Any]) -> dict[str, Any]:
         """Health check."""
@@ -290,7 +366,7 @@ class PromptVCMCPServer:
             JSON string containing the response
         """
         try:
-            request_data = json.loads(request_json)
+            request_data = loads(request_json)
         except json.JSONDecodeError as e:
             error_response = {
                 "jsonrpc": "2.0",
@@ -302,7 +378,11 @@ class PromptVCMCPServer:
         # Run async process_request in sync context
         response = asyncio.run(self.process_request(request_data))
 
-        # Convert response to dict
+        return self._encode_response(response).decode()
+
+    @staticmethod
+    def _encode_response(response: MCPResponse) -> bytes:
+        """Serialize a response, leaving out whichever of result/error is unset."""
         response_dict = {"jsonrpc": response.jsonrpc, "id": response.id}
 
         if response.result is not None:
@@ -310,43 +390,168 @@ class PromptVCMCPServer:
         if response.error is not None:
             response_dict["error"] = response.error
 
-        return json.dumps(response_dict)
+        return dumps(response_dict)
 
-    async def run_stdio(self) -> None:
-        """Run server in stdio mode."""
-        logger.info("MCP server starting in stdio mode")
+    @staticmethod
+    def _send(message: bytes) -> None:
+        """Write one JSON-RPC message to stdout as a UTF-8 line."""
+        # Write bytes so non-ASCII text does not depend on the console encoding
+        sys.stdout.buffer.write(message + b"\n")
+        sys.stdout.buffer.flush()
+
+    async def _stdin_reader(self) -> Optional[asyncio.StreamReader]:
+        """
+        Attach an asyncio stream reader to stdin when it is a pipe or socket.
+
+        Returns None for terminals, regular files, replaced streams and on
+        Windows; those are read with blocking readline calls in the default
+        executor instead. Terminals are excluded because the pipe transport
+        makes the descriptor non-blocking, which would also affect stdout.
+        """
+        if sys.platform == "win32":
+            return None
 
-        while True:
-            try:
-                line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+        try:
+            mode = os.fstat(sys.stdin.fileno()).st_mode
+        except (AttributeError, OSError, ValueError):
+            return None
+        if not (stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)):
+            return None
+
+        reader = asyncio.StreamReader(limit=self.MAX_MESSAGE_SIZE)
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        except (NotImplementedError, OSError, ValueError):
+            return None
+        return reader
+
+    async def _read_lines(self, queue: "asyncio.Queue[Any]") -> None:
+        """Feed request lines from stdin into queue, then None once stdin closes."""
+        loop = asyncio.get_running_loop()
+        reader = await self._stdin_reader()
+
+        try:
+            while True:
+                line: Union[bytes, str]
+                try:
+                    if reader is not None:
+                        line = await reader.readline()
+                    else:
+                        line = await loop.run_in_executor(None, sys.stdin.readline)
+                except ValueError as e:
+                    # Line longer than MAX_MESSAGE_SIZE; report it and keep reading
+                    await queue.put(e)
+                    continue
+                except OSError:
+                    # stdin itself has failed, so nothing more can be read
+                    logger.exception("Failed to read from stdin")
+                    break
+                except Exception as e:
+                    # Answer the failed line with an error and keep serving later ones
+                    logger.exception("Failed to read request line")
+                    await queue.put(e)
+                    continue
 
                 if not line:
                     break
+                await queue.put(line)
+        except Exception:
+            # Still end run_stdio's loop before reporting the failure
+            await queue.put(None)
+            raise
+        await queue.put(None)
 
-                request_data = json.loads(line.strip())
-                response = await self.process_request(request_data)
+    def _parse_line(self, line: Union[bytes, str, Exception]) -> Any:
+        """Decode one request line, or build the error response for it."""
+        if isinstance(line, Exception):
+            return MCPResponse(error={"code": self.INTERNAL_ERROR, "message": str(line)})
 
-                # Convert response to dict
-                response_dict = {"jsonrpc": response.jsonrpc, "id": response.id}
+        try:
+            # JSON parsing tolerates the trailing newline
+            return loads(line)
+        except ValueError as e:
+            # Also covers invalid UTF-8, which the stdlib parser raises as UnicodeDecodeError
+            return MCPResponse(error={"code": self.PARSE_ERROR, "message": f"Parse error: {e}"})
+        except Exception as e:
+            logger.exception("Failed to parse request line")
+            return MCPResponse(error={"code": self.INTERNAL_ERROR, "message": str(e)})
 
-                if response.result is not None:
-                    response_dict["result"] = response.result
-                if response.error is not None:
-                    response_dict["error"] = response.error
+    def _is_read_only(self, request: Any) -> bool:
+        """Whether a parsed request leaves the repository unchanged."""
+        if not isinstance(request, dict):
+            return True
 
-                print(json.dumps(response_dict), flush=True)
+        method = request.get("method")
+        if method == "tools/call":
+            params = request.get("params")
+            return isinstance(params, dict) and params.get("name") in self.READ_ONLY_TOOLS
+        return method in self.READ_ONLY_METHODS
 
-            except json.JSONDecodeError as e:
-                error_response = MCPResponse(
-                    error={"code": self.PARSE_ERROR, "message": f"Parse error: {e}"}
-                )
-                print(json.dumps(asdict(error_response)), flush=True)
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                logger.exception("Server error")
-                error_response = MCPResponse(error={"code": self.INTERNAL_ERROR, "message": str(e)})
-                print(json.dumps(asdict(error_response)), flush=True)
+    async def _respond(self, request: Any) -> bytes:
+        """Process one parsed request and return the encoded response."""
+        # Any failure is answered for this request alone, so the session keeps running
+        try:
+            if isinstance(request, MCPResponse):
+                return dumps(asdict(request))
+            return self._encode_response(await self.process_request(request))
+        except Exception as e:
+            logger.exception("Server error")
+            error_response = MCPResponse(error={"code": self.INTERNAL_ERROR, "message": str(e)})
+            return dumps(asdict(error_response))
+
+    async def _respond_batch(self, lines: list[Any]) -> list[bytes]:
+        """
+        Answer a batch of request lines, keeping responses in request order.
+
+        Consecutive read-only requests run concurrently with asyncio.gather.
+        Requests that may change the repository run one at a time, so later
+        requests in the batch see their effects.
+        """
+        requests = [self._parse_line(line) for line in lines]
+
+        responses: list[bytes] = []
+        for read_only, group in groupby(requests, key=self._is_read_only):
+            if read_only:
+                responses.extend(await asyncio.gather(*map(self._respond, group)))
+            else:
+                for request in group:
+                    responses.append(await self._respond(request))
+        return responses
+
+    async def run_stdio(self) -> None:
+        """Run server in stdio mode."""
+        logger.info("MCP server starting in stdio mode")
+
+        # Fetch command help while waiting for the first request
+        warm_help_cache(self.TOOL_COMMANDS.values())
+
+        # Bounded so a fast client cannot buffer unlimited requests ahead of the responses
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=self.MAX_BATCH_SIZE * 2)
+        reader_task = asyncio.ensure_future(self._read_lines(queue))
+
+        try:
+            done = False
+            while not done:
+                line = await queue.get()
+                if line is None:
+                    break
+
+                # Answer everything that is already waiting as one batch
+                batch = [line]
+                while len(batch) < self.MAX_BATCH_SIZE and not queue.empty():
+                    line = queue.get_nowait()
+                    if line is None:
+                        done = True
+                        break
+                    batch.append(line)
+
+                for message in await self._respond_batch(batch):
+                    self._send(message)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            reader_task.cancel()
 
         logger.info("MCP server shutting down")
 
@@ -6,12 +6,14 @@ Licensed under MIT License
 """
 
 from dataclasses import asdict
+from functools import lru_cache
 
 from .models import MCPTool
 
 
+@lru_cache(maxsize=1)
 def get_tool_definitions() -> list[dict]:
-    """Get all MCP tool definitions."""
+    """Get all MCP tool definitions (built once; treat as read-only)."""
     tools = [
         MCPTool(
             name="promptvc_init_repository",
@@ -125,7 +127,11 @@ def get_tool_definitions() -> list[dict]:
                     "max_count": {
                         "type": "integer",
                         "description": "Maximum number of commits to return",
-                    }
+                    },
+                    "skip": {
+                        "type": "integer",
+                        "description": "Number of newest commits to skip (default: 0)",
+                    },
                 },
             },
         ),
@@ -191,7 +197,15 @@ def get_tool_definitions() -> list[dict]:
                         "type": "string",
                         "enum": ["json", "csv"],
                         "description": "Output format (default: json)",
-                    }
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Number of entries to skip (default: 0)",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of entries to return (default: all)",
+                    },
                 },
             },
         ),
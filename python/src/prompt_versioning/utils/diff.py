@@ -67,6 +67,20 @@ class DiffResult:
         self.changes: list[FieldChange] = []
         self._compute_changes()
 
+    @classmethod
+    def unchanged(cls, prompt: Prompt) -> "DiffResult":
+        """
+        Create a result for comparing a prompt with itself, without diffing.
+
+        Args:
+            prompt: The prompt on both sides of the comparison
+        """
+        result = cls.__new__(cls)
+        result.prompt1 = prompt
+        result.prompt2 = prompt
+        result.changes = []
+        return result
+
     def _compute_changes(self) -> None:
         """Compute field-by-field changes between prompts."""
         data1 = self.prompt1.model_dump(exclude_none=True)
@@ -13,6 +13,7 @@ Licensed under MIT License
 """
 
 import json
+import os
 from datetime import datetime
 from unittest.mock import Mock
 
@@ -130,6 +131,21 @@ class TestCommandExtraction:
         assert args["oneline"]
         assert args["max-count"] == "10"
 
+    def test_parse_command_quoted_value_with_spaces(self, agent):
+        """Test quoted values containing spaces stay intact."""
+        cmd = "promptvc commit -m 'improved clarity and tone' -f prompt.yaml"
+        args = agent._parse_command(cmd)
+
+        assert args["m"] == "improved clarity and tone"
+        assert args["f"] == "prompt.yaml"
+
+    def test_parse_command_unbalanced_quotes(self, agent):
+        """Test unbalanced quotes fall back to whitespace splitting."""
+        args = agent._parse_command("promptvc commit -m 'oops")
+
+        assert args["action"] == "commit"
+        assert "m" in args
+
 
 class TestAgentInteraction:
     """Test agent interaction and response processing."""
@@ -163,6 +179,14 @@ class TestAgentInteraction:
         response = agent.process_message("switch to version abc123")
         assert response.needs_confirmation
 
+    def test_process_message_streaming(self, agent):
+        """Test streamed chunks are forwarded and assembled into the response."""
+        chunks = []
+        response = agent.process_message("initialize the project", on_token=chunks.append)
+
+        assert "".join(chunks) == response.message
+        assert response.command == "promptvc init"
+
     def test_process_message_error_handling(self, agent):
         """Test error handling in message processing."""
         # Make backend raise an error
@@ -173,6 +197,29 @@ class TestAgentInteraction:
         assert "API Error" in response.error
 
 
+class TestAsyncInteraction:
+    """Test async message processing."""
+
+    @pytest.mark.asyncio
+    async def test_aprocess_message_basic(self, agent):
+        """Test processing a message through the async path."""
+        response = await agent.aprocess_message("initialize the project")
+
+        assert isinstance(response, AgentResponse)
+        assert response.command == "promptvc init"
+        assert response.needs_confirmation
+        assert len(agent.conversation_history) == 2
+
+    @pytest.mark.asyncio
+    async def test_aprocess_message_error_handling(self, agent):
+        """Test error handling in async message processing."""
+        agent.backend.generate = Mock(side_effect=Exception("API Error"))
+
+        response = await agent.aprocess_message("show commits")
+        assert response.error is not None
+        assert "API Error" in response.error
+
+
 class TestConversationManagement:
     """Test conversation saving and loading."""
 
@@ -232,9 +279,40 @@ class TestSystemPrompt:
         """Test that system prompt includes repo context."""
         system_prompt = agent._build_system_prompt()
 
-        assert str(agent.repo_path.resolve()) in system_prompt
+        assert os.path.abspath(agent.repo_path) in system_prompt
         assert "promptvc" in system_prompt.lower()
 
+    def test_system_prompt_cached_until_head_changes(self, temp_repo, mock_backend):
+        """Test that system prompt is reused until HEAD moves."""
+        from prompt_versioning.core import PromptRepository
+
+        repo = PromptRepository.init(temp_repo)
+        agent = PromptVCAgent(backend=mock_backend, repo_path=str(temp_repo))
+
+        first = agent._build_system_prompt()
+        assert "no commits yet" in first
+        assert agent._build_system_prompt() is first
+
+        commit = repo.commit("Initial", {"system": "You are helpful."})
+        updated = agent._build_system_prompt()
+        assert commit.short_hash() in updated
+
+    def test_system_prompt_matches_format(self, agent):
+        """Test the pre-split template renders like str.format."""
+        expected = agent.SYSTEM_PROMPT.format(
+            cwd=os.path.abspath(agent.repo_path), repo_status=agent._get_repo_status()
+        )
+        assert agent._build_system_prompt() == expected
+
+    def test_system_prompt_custom_template(self, temp_repo, mock_backend):
+        """Test subclasses with other template fields fall back to str.format."""
+
+        class CustomAgent(PromptVCAgent):
+            SYSTEM_PROMPT = "Status {repo_status} in {cwd} {{literal}}"
+
+        agent = CustomAgent(backend=mock_backend, repo_path=str(temp_repo))
+        assert agent._build_system_prompt().endswith("{literal}")
+
     def test_repo_status_not_initialized(self, agent):
         """Test repo status when not initialized."""
         status = agent._get_repo_status()
@@ -5,7 +5,7 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -38,6 +38,24 @@ class TestAnthropicBackend:
         if not backend.api_key:
             assert not backend.is_available()
 
+    def test_anthropic_generate_marks_system_prompt_cacheable(self):
+        """Test system prompt is sent as a cacheable block."""
+        backend = AnthropicBackend(api_key="test_key")
+        client = Mock()
+        client.messages.create.return_value.content = [Mock(text="Hi")]
+        backend._client = client
+
+        result = backend.generate(
+            [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "Hello"}]
+        )
+
+        kwargs = client.messages.create.call_args.kwargs
+        assert result == "Hi"
+        assert kwargs["system"] == [
+            {"type": "text", "text": "Be brief.", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert kwargs["messages"] == [{"role": "user", "content": "Hello"}]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
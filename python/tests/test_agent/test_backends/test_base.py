@@ -44,6 +44,25 @@ class TestMockBackend:
         backend = MockLLMBackend()
         assert backend.is_available()
 
+    @pytest.mark.asyncio
+    async def test_default_agenerate_uses_generate(self):
+        """Test default async generation delegates to generate."""
+        backend = MockLLMBackend(responses=["Async response"])
+
+        assert await backend.agenerate([]) == "Async response"
+
+    def test_generate_many_preserves_order(self):
+        """Test batch generation returns one reply per batch, in order."""
+
+        class EchoBackend(MockLLMBackend):
+            def generate(self, messages, temperature=0.7, max_tokens=500):
+                return messages[-1]["content"]
+
+        backend = EchoBackend()
+        batches = [[{"role": "user", "content": f"q{i}"}] for i in range(5)]
+
+        assert backend.generate_many(batches, max_concurrency=2) == [f"q{i}" for i in range(5)]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
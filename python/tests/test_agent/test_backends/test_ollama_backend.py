@@ -5,6 +5,10 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
 import pytest
 
 from prompt_versioning.agent.backends import OllamaBackend
@@ -35,6 +39,54 @@ class TestOllamaBackend:
         # Should check if Ollama is running locally
         assert isinstance(backend.is_available(), bool)
 
+    def test_ollama_is_available_cached(self):
+        """Test availability probe result is reused within the TTL."""
+        backend = OllamaBackend()
+        with patch.object(backend, "_probe_server", return_value=True) as probe:
+            assert backend.is_available()
+            assert backend.is_available()
+
+        probe.assert_called_once()
+
+    def test_ollama_format_messages(self):
+        """Test chat messages are flattened into a single prompt."""
+        backend = OllamaBackend()
+        prompt = backend._format_messages(
+            [
+                {"role": "system", "content": "Be brief."},
+                {"role": "user", "content": "Hi"},
+                {"role": "tool", "content": "ok"},
+            ]
+        )
+
+        assert prompt == "System: Be brief.\n\nUser: Hi\n\nTool: ok\n\nAssistant:"
+
+    def test_ollama_generate_reuses_session(self):
+        """Test generate calls go through one shared session."""
+        backend = OllamaBackend()
+        session = Mock()
+        session.post.return_value.json.return_value = {"response": "Hello"}
+        backend._sessions.session = session
+
+        assert backend.generate([{"role": "user", "content": "Hi"}]) == "Hello"
+        assert backend.generate([{"role": "user", "content": "Hi"}]) == "Hello"
+        assert session.post.call_count == 2
+        assert backend._get_session() is session
+
+    def test_ollama_session_per_thread(self):
+        """Test worker threads each get their own session."""
+        backend = OllamaBackend()
+        requests = Mock()
+        requests.Session.side_effect = lambda: Mock()
+
+        with patch.dict(sys.modules, {"requests": requests}):
+            main = backend._get_session()
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                worker = pool.submit(backend._get_session).result()
+
+            assert backend._get_session() is main
+        assert worker is not main
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -5,7 +5,9 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
-from unittest.mock import patch
+import asyncio
+import sys
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -38,6 +40,31 @@ class TestOpenAIBackend:
         if not backend.api_key:
             assert not backend.is_available()
 
+    def test_openai_generate_many_twice(self):
+        """Test each generate_many call gets an async client for its own event loop."""
+        openai = Mock()
+
+        def make_client(api_key):
+            client = Mock()
+            loop = asyncio.get_running_loop()
+
+            async def create(**kwargs):
+                assert asyncio.get_running_loop() is loop
+                return Mock(choices=[Mock(message=Mock(content="ok"))])
+
+            client.chat.completions.create = create
+            return client
+
+        openai.AsyncOpenAI.side_effect = make_client
+        backend = OpenAIBackend(api_key="test_key")
+        batches = [[{"role": "user", "content": "Hi"}]] * 2
+
+        with patch.dict(sys.modules, {"openai": openai}):
+            assert backend.generate_many(batches) == ["ok", "ok"]
+            assert backend.generate_many(batches) == ["ok", "ok"]
+
+        assert openai.AsyncOpenAI.call_count == 2
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,77 @@
+"""
+Tests for the agent response cache.
+
+Copyright (c) 2025 Prompt Versioning Contributors
+Licensed under MIT License
+"""
+
+import pytest
+
+from prompt_versioning.agent import PromptVCAgent, ResponseCache
+
+from .test_backends.test_base import MockLLMBackend
+
+
+class TestResponseCache:
+    """Test ResponseCache behavior."""
+
+    def test_put_and_get(self):
+        """Test storing and retrieving a reply."""
+        cache = ResponseCache()
+        cache.put(("system", "", "show log"), "reply")
+
+        assert cache.get(("system", "", "show log")) == "reply"
+        assert cache.get(("system", "", "other")) is None
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted first."""
+        cache = ResponseCache(max_entries=2)
+        cache.put(("a",), "1")
+        cache.put(("b",), "2")
+        cache.get(("a",))
+        cache.put(("c",), "3")
+
+        assert len(cache) == 2
+        assert cache.get(("a",)) == "1"
+        assert cache.get(("b",)) is None
+
+    def test_ttl_expiry(self):
+        """Test expired entries are not returned."""
+        cache = ResponseCache(ttl=0)
+        cache.put(("a",), "1")
+
+        assert cache.get(("a",)) is None
+        assert len(cache) == 0
+
+
+class TestAgentResponseCaching:
+    """Test agent integration with the response cache."""
+
+    def test_repeated_question_hits_cache(self, tmp_path):
+        """Test the same question after the same reply skips the backend."""
+        backend = MockLLMBackend(responses=["Here is the log.", "Here is the log."])
+        agent = PromptVCAgent(
+            backend=backend, repo_path=str(tmp_path), response_cache=ResponseCache()
+        )
+
+        agent.process_message("show log")
+        agent.process_message("show log")
+        assert backend.call_count == 2  # previous reply differs on the second turn
+
+        response = agent.process_message("show log")
+        assert backend.call_count == 2
+        assert response.message == "Here is the log."
+        assert len(agent.conversation_history) == 6
+
+    def test_no_cache_by_default(self, tmp_path):
+        """Test caching is opt-in."""
+        backend = MockLLMBackend(responses=["A", "B"])
+        agent = PromptVCAgent(backend=backend, repo_path=str(tmp_path))
+
+        agent.process_message("hello")
+        agent.process_message("hello")
+        assert backend.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
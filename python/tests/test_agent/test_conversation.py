@@ -84,6 +84,25 @@ class TestConversationHistory:
         agent.process_message("test")
         assert len(agent.conversation_history) == 22  # 20 + 2 new
 
+    def test_appended_messages_sent_as_context(self, agent):
+        """Test messages appended to the history directly reach the LLM."""
+        agent.conversation_history.append(ConversationMessage(role="user", content="Earlier"))
+
+        messages = agent._build_messages("Now")
+
+        assert [m["content"] for m in messages[1:]] == ["Earlier", "Now"]
+
+    def test_history_bounded_without_archive(self, temp_repo, mock_backend):
+        """Test that history stays bounded when archiving is disabled."""
+        agent = PromptVCAgent(backend=mock_backend, repo_path=str(temp_repo), archive_history=False)
+
+        for i in range(8):
+            agent.process_message(f"Message {i}")
+
+        assert len(agent.conversation_history) == PromptVCAgent.HISTORY_WINDOW
+        assert agent.conversation_history[-2].content == "Message 7"
+        assert agent.conversation_history[-2:][0].content == "Message 7"
+
 
 class TestConversationPersistence:
     """Test conversation saving and loading."""
@@ -105,6 +124,22 @@ class TestConversationPersistence:
         assert data[0]["role"] == "user"
         assert data[0]["content"] == "hello"
 
+    def test_save_conversation_async(self, agent, temp_repo):
+        """Test background save writes a snapshot of the history."""
+        agent.process_message("hello")
+
+        filepath = temp_repo / "conversation.json"
+        future = agent.save_conversation_async(filepath)
+        agent.process_message("show status")  # not part of the snapshot
+        future.result()
+        agent.close()
+
+        with open(filepath) as f:
+            data = json.load(f)
+
+        assert len(data) == 2
+        assert data[0]["content"] == "hello"
+
     def test_load_conversation(self, temp_repo, mock_backend):
         """Test loading conversation from file."""
         # Create conversation file
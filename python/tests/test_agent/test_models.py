@@ -68,6 +68,16 @@ class TestConversationMessage:
         assert message.content == "Test"
         assert message.timestamp == timestamp
 
+    def test_conversation_message_llm_dict(self):
+        """Test LLM dict is built once and kept out of asdict."""
+        from dataclasses import asdict
+
+        message = ConversationMessage(role="user", content="Hello")
+
+        assert message.llm_dict == {"role": "user", "content": "Hello"}
+        assert message.llm_dict is message.llm_dict
+        assert "llm_dict" not in asdict(message)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
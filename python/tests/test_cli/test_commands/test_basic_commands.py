@@ -10,14 +10,19 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import json
 import shutil
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
 import pytest
+import yaml
 from click.testing import CliRunner
 
 from prompt_versioning.cli import cli
+from prompt_versioning.core import serialization
 
 
 @pytest.fixture
@@ -80,6 +85,21 @@ class TestLogCommand:
 
         assert result.exit_code == 0
 
+    def test_log_oneline_lists_commits_newest_first(self, runner, temp_dir):
+        """Test --oneline prints one line per commit."""
+        runner.invoke(cli, ["init", "--path", str(temp_dir)])
+        prompt_file = temp_dir / "prompt.yaml"
+        for message, system in [("first", "A"), ("second", "B")]:
+            prompt_file.write_text(f"system: {system}\n")
+            runner.invoke(cli, ["commit", "-m", message, str(prompt_file), "--path", str(temp_dir)])
+
+        result = runner.invoke(cli, ["log", "--oneline", "--path", str(temp_dir)])
+
+        lines = result.output.splitlines()
+        assert result.exit_code == 0
+        assert len(lines) == 2
+        assert lines[0].split(" ", 1)[1].startswith("second")
+
 
 class TestStatusCommand:
     """Test the status command."""
@@ -93,6 +113,214 @@ class TestStatusCommand:
         assert result.exit_code == 0
         assert "no commits" in result.output.lower()
 
+    def test_status_shows_current_commit(self, runner, temp_dir):
+        """Test status lists the HEAD commit details."""
+        runner.invoke(cli, ["init", "--path", str(temp_dir)])
+        prompt_file = temp_dir / "prompt.yaml"
+        prompt_file.write_text("system: A\n")
+        runner.invoke(cli, ["commit", "-m", "first", str(prompt_file), "--path", str(temp_dir)])
+
+        result = runner.invoke(cli, ["status", "--path", str(temp_dir)])
+
+        lines = result.output.splitlines()
+        assert lines[0] == "Current version:"
+        assert "  Message: first" in lines
+        assert lines[-1].startswith("  File:")
+
+
+class TestTagsCommand:
+    """Test the tags command."""
+
+    def test_tags_newest_first_with_limit(self, runner, temp_dir):
+        """Test tags are listed newest first and --max-count limits them."""
+        runner.invoke(cli, ["init", "--path", str(temp_dir)])
+        prompt_file = temp_dir / "prompt.yaml"
+        prompt_file.write_text("system: A\n")
+        runner.invoke(cli, ["commit", "-m", "first", str(prompt_file), "--path", str(temp_dir)])
+        for name in ["old", "new"]:
+            runner.invoke(cli, ["tag", name, "--path", str(temp_dir)])
+
+        result = runner.invoke(cli, ["tags", "-n", "1", "--path", str(temp_dir)])
+
+        assert result.exit_code == 0
+        assert result.output.startswith("new ->")
+        assert "old" not in result.output
+
+    @pytest.mark.parametrize("count", ["0", "-1"])
+    def test_tags_rejects_non_positive_limit(self, runner, temp_dir, count):
+        """Test --max-count below 1 is a usage error."""
+        runner.invoke(cli, ["init", "--path", str(temp_dir)])
+
+        result = runner.invoke(cli, ["tags", "-n", count, "--path", str(temp_dir)])
+
+        assert result.exit_code == 2
+
+
+class TestJsonOutput:
+    """Test JSON printed by commands does not depend on optional speedups."""
+
+    def test_non_ascii_output_same_without_orjson(self, runner, temp_dir, monkeypatch):
+        """Test tags and audit print the same bytes with and without orjson."""
+        runner.invoke(cli, ["init", "--path", str(temp_dir)])
+        prompt_file = temp_dir / "prompt.yaml"
+        prompt_file.write_text("system: A\n")
+        runner.invoke(cli, ["commit", "-m", "café", str(prompt_file), "--path", str(temp_dir)])
+        runner.invoke(
+            cli,
+            ["tag", "v1", "--metadata", '{"note": "naïve", "score": 0.1}', "--path", str(temp_dir)],
+        )
+
+        def outputs():
+            return [
+                runner.invoke(cli, args + ["--path", str(temp_dir)]).stdout_bytes
+                for args in (["tags"], ["audit"], ["audit", "--format", "jsonl"])
+            ]
+
+        with_default = outputs()
+        monkeypatch.setattr(serialization, "HAS_ORJSON", False)
+
+        assert outputs() == with_default
+        assert b"na\\u00efve" in with_default[0]
+        assert b"caf\\u00e9" in with_default[1]
+
+
+class TestAuditCommand:
+    """Test the audit command."""
+
+    def test_audit_exports_to_file(self, runner, temp_dir):
+        """Test audit log is written as JSON to the output file."""
+        runner.invoke(cli, ["init", "--path", str(temp_dir)])
+        output = temp_dir / "audit.json"
+
+        result = runner.invoke(cli, ["audit", "--path", str(temp_dir), "-o", str(output)])
+
+        assert result.exit_code == 0
+        assert isinstance(json.loads(output.read_text()), list)
+
+    def test_audit_jsonl_streams_one_entry_per_line(self, runner, temp_dir):
+        """Test --format jsonl writes one JSON document per line."""
+        runner.invoke(cli, ["init", "--path", str(temp_dir)])
+
+        result = runner.invoke(cli, ["audit", "--format", "jsonl", "--path", str(temp_dir)])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output.splitlines()[0])["action"] == "init"
+
+    def test_audit_json_written_to_stdout(self, runner, temp_dir):
+        """Test the default JSON export is written to stdout as a JSON array."""
+        runner.invoke(cli, ["init", "--path", str(temp_dir)])
+
+        result = runner.invoke(cli, ["audit", "--path", str(temp_dir)])
+
+        assert result.exit_code == 0
+        assert result.stdout_bytes.endswith(b"]\n")
+        assert [entry["action"] for entry in json.loads(result.output)] == ["init"]
+
+    def test_audit_csv_written_to_stdout(self, runner, temp_dir):
+        """Test the CSV export starts with the header row."""
+        runner.invoke(cli, ["init", "--path", str(temp_dir)])
+
+        result = runner.invoke(cli, ["audit", "--format", "csv", "--path", str(temp_dir)])
+
+        assert result.exit_code == 0
+        assert result.output.splitlines()[0].startswith("timestamp,action,")
+
+
+class TestCreatePromptCommand:
+    """Test the create-prompt command."""
+
+    def test_create_prompt_previews_written_file(self, runner, temp_dir):
+        """Test the preview matches the written file contents."""
+        prompt_file = temp_dir / "prompts" / "bot.yaml"
+
+        result = runner.invoke(
+            cli, ["create-prompt", str(prompt_file), "--system", "You are helpful"]
+        )
+
+        assert result.exit_code == 0
+        assert yaml.safe_load(prompt_file.read_text()) == {"system": "You are helpful"}
+        assert prompt_file.read_text() in result.output
+
+
+class TestMcpSetupCommand:
+    """Test the mcp-setup command."""
+
+    def test_mcp_setup_writes_config(self, runner, temp_dir):
+        """Test the generated config is valid JSON pointing at the repository."""
+        output = temp_dir / "mcp.json"
+
+        result = runner.invoke(
+            cli, ["mcp-setup", "--ide", "vscode", "--path", str(temp_dir), "-o", str(output)]
+        )
+
+        config = json.loads(output.read_text())
+        assert result.exit_code == 0
+        assert str(temp_dir.resolve()) in config["mcpServers"]["promptvc"]["args"]
+
+    def test_mcp_setup_detects_existing_repository(self, runner, temp_dir):
+        """Test an initialized repository is found and --init does not re-create it."""
+        runner.invoke(cli, ["init", "--path", str(temp_dir)])
+
+        result = runner.invoke(
+            cli,
+            [
+                "mcp-setup",
+                "--ide",
+                "vscode",
+                "--path",
+                str(temp_dir),
+                "--init",
+                "-o",
+                str(temp_dir / "c.json"),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "not found" not in result.output
+
+    @pytest.mark.parametrize("ide", ["vscode", "claude", "zed"])
+    def test_rendered_config_escapes_path(self, ide):
+        """Test paths with quotes and backslashes still produce valid JSON."""
+        from prompt_versioning.cli.commands.mcp_setup import _render_config
+
+        repo_path = Path('C:\\prompts\\"quoted" dir')
+
+        config = json.loads(_render_config(ide, repo_path))
+
+        assert json.dumps(str(repo_path)) in json.dumps(config)
+
+    def test_default_config_path_uses_home_env(self, monkeypatch, temp_dir):
+        """Test the default Zed location is derived from $HOME."""
+        from prompt_versioning.cli.commands.mcp_setup import _default_config_path
+
+        monkeypatch.setenv("HOME", str(temp_dir))
+        _default_config_path.cache_clear()
+
+        assert _default_config_path("zed") == temp_dir / ".config/zed/settings.json"
+        _default_config_path.cache_clear()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestCommandExports:
+    """Test the lazily imported command exports."""
+
+    def test_exports_are_commands_after_cli_dispatch(self):
+        """Test dispatching every command leaves the package exporting commands."""
+        # A fresh interpreter, since other tests import command submodules directly
+        script = """
+import click
+from click.testing import CliRunner
+from prompt_versioning.cli import cli, commands
+
+for name in cli.list_commands(click.Context(cli)):
+    CliRunner().invoke(cli, [name, "--help"])
+print([name for name in commands.__all__ if not isinstance(getattr(commands, name), click.Command)])
+"""
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
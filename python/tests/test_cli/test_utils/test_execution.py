@@ -0,0 +1,71 @@
+"""
+Tests for CLI command execution utilities.
+
+Copyright (c) 2025 Prompt Versioning Contributors
+Licensed under MIT License
+"""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from prompt_versioning.cli.utils import execute_command, execute_shell_command
+
+
+class TestExecuteCommand:
+    """Test execute_command dispatch."""
+
+    def test_promptvc_command_runs_in_process(self, tmp_path, capsys):
+        """Test promptvc commands run without spawning a shell."""
+        with patch("prompt_versioning.cli.utils.execution.subprocess.run") as mock_run:
+            execute_command(f"promptvc init --path '{tmp_path}'")
+
+        mock_run.assert_not_called()
+        assert (tmp_path / ".prompt-vc").exists()
+        assert "Initialized" in capsys.readouterr().out
+
+    def test_failing_command_reports_exit_code(self, tmp_path, capsys):
+        """Test a failing command reports its exit code instead of exiting."""
+        execute_command(f"promptvc status --path '{tmp_path}'")
+
+        assert "exited with code 1" in capsys.readouterr().err
+
+    def test_other_commands_use_shell(self, capsys):
+        """Test non-promptvc commands and pipelines fall back to the shell."""
+        execute_command("echo hello | tr a-z A-Z")
+
+        assert "HELLO" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("command", ["promptvc init --path ~/prompts", "promptvc diff *"])
+    def test_promptvc_command_with_expansion_uses_shell(self, command):
+        """Test home and glob expansion still reach the shell."""
+        with patch("prompt_versioning.cli.utils.execution.execute_shell_command") as mock_shell:
+            execute_command(command)
+
+        mock_shell.assert_called_once_with(command)
+
+
+class TestExecuteShellCommand:
+    """Test execute_shell_command."""
+
+    def test_simple_command_skips_shell(self, capsys):
+        """Test a plain command is run from its argv without /bin/sh."""
+        with patch(
+            "prompt_versioning.cli.utils.execution.subprocess.run", wraps=subprocess.run
+        ) as mock_run:
+            execute_shell_command("echo 'hello world'")
+
+        assert mock_run.call_args.args[0] == ["echo", "hello world"]
+        assert "shell" not in mock_run.call_args.kwargs
+        assert "hello world" in capsys.readouterr().out
+
+    def test_shell_builtin_falls_back_to_shell(self, capsys):
+        """Test commands without an executable still run through the shell."""
+        execute_shell_command("type echo")
+
+        assert "echo" in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
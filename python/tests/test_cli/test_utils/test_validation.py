@@ -0,0 +1,63 @@
+"""
+Tests for CLI validation utilities.
+
+Copyright (c) 2025 Prompt Versioning Contributors
+Licensed under MIT License
+"""
+
+import click
+import pytest
+
+from prompt_versioning.cli.utils import ensure_repository, parse_prompt_file
+from prompt_versioning.core import PromptRepository
+
+
+class TestEnsureRepository:
+    """Test ensure_repository."""
+
+    def test_reuses_repository_within_context(self, tmp_path):
+        """Test the same repository instance is returned within one invocation."""
+        PromptRepository.init(str(tmp_path))
+
+        with click.Context(click.Command("test")):
+            first = ensure_repository(str(tmp_path))
+            second = ensure_repository(str(tmp_path))
+
+        assert first is second
+
+    def test_new_repository_outside_context(self, tmp_path):
+        """Test no caching happens outside a Click invocation."""
+        PromptRepository.init(str(tmp_path))
+
+        assert ensure_repository(str(tmp_path)) is not ensure_repository(str(tmp_path))
+
+    def test_missing_repository_exits(self, tmp_path):
+        """Test a missing repository exits with an error."""
+        with pytest.raises(SystemExit):
+            ensure_repository(str(tmp_path))
+
+
+class TestParsePromptFile:
+    """Test parse_prompt_file."""
+
+    def test_parses_yaml(self, tmp_path):
+        """Test YAML prompt files are parsed."""
+        prompt_file = tmp_path / "prompt.yaml"
+        prompt_file.write_text("system: You are helpful\ntemperature: 0.5\n")
+
+        data, file_format = parse_prompt_file(str(prompt_file))
+
+        assert data == {"system": "You are helpful", "temperature": 0.5}
+        assert file_format == "yaml"
+
+    def test_invalid_yaml_exits(self, tmp_path):
+        """Test malformed YAML exits with an error."""
+        prompt_file = tmp_path / "prompt.yaml"
+        prompt_file.write_text("system: [unclosed\n")
+
+        with pytest.raises(SystemExit):
+            parse_prompt_file(str(prompt_file))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
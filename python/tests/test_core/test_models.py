@@ -5,9 +5,18 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import json
+from datetime import datetime
+
 import pytest
 
-from prompt_versioning.core.models import ExperimentTag, Prompt, PromptCommit, PromptVersion
+from prompt_versioning.core.models import (
+    AuditLogEntry,
+    ExperimentTag,
+    Prompt,
+    PromptCommit,
+    PromptVersion,
+)
 
 
 class TestPromptModel:
@@ -29,6 +38,22 @@ class TestPromptModel:
         assert data["system"] == "Test"
         assert isinstance(data, dict)
 
+    def test_compute_hash_is_stable(self):
+        """Test the prompt hash format does not change (it addresses stored prompts)."""
+        prompt = Prompt(system="You are helpful", temperature=0.7)
+
+        assert prompt.compute_hash() == "6849ae38d22bc76f"
+
+    def test_from_trusted_round_trip(self):
+        """Test a prompt rebuilt from its stored content keeps its hash and extra fields."""
+        prompt = Prompt(system="You are helpful", temperature=0.7, persona="tutor")
+
+        restored = Prompt.from_trusted(prompt.model_dump(exclude_none=True))
+
+        assert restored == prompt
+        assert restored.persona == "tutor"
+        assert restored.compute_hash() == prompt.compute_hash()
+
 
 class TestPromptCommit:
     """Test PromptCommit data model."""
@@ -44,6 +69,15 @@ class TestPromptCommit:
         assert commit.author == "test_user"
         assert commit.prompt_hash == "def456"
 
+    def test_from_trusted_round_trip(self):
+        """Test a commit rebuilt from its stored JSON equals the original."""
+        commit = PromptCommit(hash="abc123", message="Initial", prompt_hash="def456", tags=["v1"])
+
+        restored = PromptCommit.from_trusted(json.loads(commit.model_dump_json()))
+
+        assert restored == commit
+        assert isinstance(restored.timestamp, datetime)
+
 
 class TestExperimentTag:
     """Test ExperimentTag data model."""
@@ -56,6 +90,24 @@ class TestExperimentTag:
         assert tag.commit_hash == "abc123"
         assert tag.metadata["version"] == "1.0"
 
+    def test_from_trusted_round_trip(self):
+        """Test a tag rebuilt from its stored JSON equals the original."""
+        tag = ExperimentTag(name="v1.0", commit_hash="abc123", metadata={"score": 0.9})
+
+        assert ExperimentTag.from_trusted(json.loads(tag.model_dump_json())) == tag
+
+
+class TestAuditLogEntry:
+    """Test AuditLogEntry data model."""
+
+    def test_to_dict_uses_iso_timestamp(self):
+        """Test exported timestamps are ISO 8601 strings."""
+        timestamp = datetime(2025, 1, 2, 3, 4, 5)
+        entry = AuditLogEntry(timestamp=timestamp, action="commit", message="m", author="a")
+
+        assert entry.to_dict()["timestamp"] == timestamp.isoformat()
+        assert entry.timestamp_iso == "2025-01-02T03:04:05"
+
 
 class TestPromptVersion:
     """Test PromptVersion data model."""
@@ -7,6 +7,8 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import hashlib
+import json
 import shutil
 import tempfile
 from pathlib import Path
@@ -14,6 +16,8 @@ from pathlib import Path
 import pytest
 
 from prompt_versioning.core import PromptRepository
+from prompt_versioning.core.repository import commit_ops
+from prompt_versioning.core.repository.ref_resolver import ReferenceResolver
 
 
 class TestPromptRepository:
@@ -60,6 +64,15 @@ class TestPromptRepository:
         assert commit.author == "test_user"
         assert commit.parent_hash is None  # First commit has no parent
 
+    def test_commit_hash_matches_timestamp(self, temp_repo):
+        """Test the commit hash is derived from the stored timestamp."""
+        repo = PromptRepository.init(temp_repo)
+
+        commit = repo.commit("Initial prompt", {"system": "Hi"}, author="test_user")
+
+        commit_data = f"{commit.prompt_hash}Initial prompttest_user{commit.timestamp.isoformat()}"
+        assert commit.hash == hashlib.sha256(commit_data.encode()).hexdigest()[:16]
+
     def test_commit_sequence(self, temp_repo):
         """Test creating multiple commits in sequence."""
         repo = PromptRepository.init(temp_repo)
@@ -90,6 +103,18 @@ class TestPromptRepository:
         assert versions[1].commit.message == "Second"
         assert versions[2].commit.message == "First"
 
+    def test_log_parallel_load_keeps_order(self, temp_repo, monkeypatch):
+        """Test histories loaded on the thread pool stay newest first."""
+        monkeypatch.setattr(commit_ops, "PARALLEL_HISTORY_THRESHOLD", 2)
+        repo = PromptRepository.init(temp_repo)
+
+        for i in range(5):
+            repo.commit(f"Commit {i}", {"system": f"V{i}"})
+
+        messages = [v.commit.message for v in repo.log()]
+
+        assert messages == [f"Commit {i}" for i in reversed(range(5))]
+
     def test_log_with_max_count(self, temp_repo):
         """Test limiting log output."""
         repo = PromptRepository.init(temp_repo)
@@ -101,6 +126,20 @@ class TestPromptRepository:
 
         assert len(versions) == 3
 
+    def test_log_with_skip(self, temp_repo):
+        """Test skipping the newest commits pages back through history."""
+        repo = PromptRepository.init(temp_repo)
+
+        for i in range(5):
+            repo.commit(f"Commit {i}", {"system": f"V{i}"})
+
+        page = repo.log(max_count=2, skip=2)
+
+        assert [v.commit.message for v in page] == ["Commit 2", "Commit 1"]
+        assert [v.commit.message for v in repo.log(skip=4)] == ["Commit 0"]
+        with pytest.raises(ValueError):
+            repo.log(skip=-1)
+
     def test_diff(self, temp_repo):
         """Test diffing two commits."""
         repo = PromptRepository.init(temp_repo)
@@ -126,6 +165,18 @@ class TestPromptRepository:
         assert diff.has_changes()
         assert len(diff.changes) == 2  # system and temperature changed
 
+    def test_diff_same_content_short_circuits(self, temp_repo):
+        """Test diffing a commit with itself or an identical prompt reports no changes."""
+        repo = PromptRepository.init(temp_repo)
+
+        first = repo.commit("First", {"system": "V1"})
+        second = repo.commit("Same content", {"system": "V1"})
+
+        for diff in (repo.diff(first.hash, first.hash), repo.diff(first.hash, second.hash)):
+            assert not diff.has_changes()
+            assert diff.prompt1.system == diff.prompt2.system == "V1"
+            assert diff.format() == "No changes detected."
+
     def test_diff_with_short_hash(self, temp_repo):
         """Test diff with abbreviated commit hashes."""
         repo = PromptRepository.init(temp_repo)
@@ -164,6 +215,20 @@ class TestPromptRepository:
         assert tag.commit_hash == commit.hash
         assert tag.metadata["accuracy"] == 0.85
 
+    def test_tags_shown_on_commit(self, temp_repo):
+        """Test tags appear on the commit without rewriting its file."""
+        repo = PromptRepository.init(temp_repo)
+        commit = repo.commit("Test", {"system": "V1"})
+        commit_file = temp_repo / ".prompt-vc" / "commits" / f"{commit.hash}.json"
+        stored = commit_file.read_bytes()
+
+        repo.tag("baseline")
+        repo.tag("production")
+        repo.tag("baseline", commit_ref=commit.hash)
+
+        assert repo.get_current_version().commit.tags == ["baseline", "production"]
+        assert commit_file.read_bytes() == stored
+
     def test_tag_retrieval(self, temp_repo):
         """Test retrieving tags."""
         repo = PromptRepository.init(temp_repo)
@@ -222,6 +287,22 @@ class TestPromptRepository:
         diff = repo.diff("HEAD~2", "HEAD")
         assert diff.has_changes()
 
+    def test_resolve_references(self, temp_repo):
+        """Test HEAD, HEAD~N, full and short hash resolution."""
+        repo = PromptRepository.init(temp_repo)
+        resolver = ReferenceResolver(repo.storage)
+
+        first = repo.commit("First", {"system": "V1"})
+        second = repo.commit("Second", {"system": "V2"})
+
+        assert resolver.resolve("HEAD") == second.hash
+        assert resolver.resolve("HEAD~1") == first.hash
+        assert resolver.resolve("HEAD~2") is None
+        assert resolver.resolve("HEAD~x") is None
+        assert resolver.resolve(first.hash) == first.hash
+        assert resolver.resolve(first.hash[:7]) == first.hash
+        assert resolver.resolve("nonexistent") is None
+
     def test_audit_log(self, temp_repo):
         """Test audit log generation."""
         repo = PromptRepository.init(temp_repo)
@@ -252,6 +333,32 @@ class TestPromptRepository:
         assert "timestamp,action,commit_hash" in csv_output
         assert "commit" in csv_output
 
+    def test_audit_log_jsonl_format(self, temp_repo):
+        """Test JSON Lines audit log has one entry per line."""
+        repo = PromptRepository.init(temp_repo)
+
+        repo.commit("Test", {"system": "V1"})
+
+        lines = repo.audit_log(format="jsonl").splitlines()
+
+        assert [json.loads(line)["action"] for line in lines] == ["init", "commit"]
+        assert b"".join(repo.iter_audit_log()).decode().splitlines() == lines
+
+    def test_audit_log_paging(self, temp_repo):
+        """Test offset/limit select a window of audit entries."""
+        repo = PromptRepository.init(temp_repo)
+
+        repo.commit("First", {"system": "V1"})
+        repo.commit("Second", {"system": "V2"})
+
+        page = repo.audit_log(format="dict", offset=1, limit=1)
+        assert [entry["message"] for entry in page] == ["First"]
+        assert [entry["message"] for entry in repo.audit_log(format="dict", offset=2)] == ["Second"]
+        assert repo.audit_log(format="dict", offset=3, limit=5) == []
+
+        with pytest.raises(ValueError):
+            repo.audit_log(format="dict", limit=-1)
+
     def test_empty_repository_log(self, temp_repo):
         """Test log on empty repository."""
         repo = PromptRepository.init(temp_repo)
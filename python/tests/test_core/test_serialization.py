@@ -0,0 +1,65 @@
+"""
+Tests for JSON serialization helpers.
+
+Copyright (c) 2025 Prompt Versioning Contributors
+Licensed under MIT License
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+import yaml
+
+from prompt_versioning.core import serialization
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def use_orjson(request, monkeypatch):
+    """Run each test against both the orjson and stdlib code paths."""
+    if request.param and not serialization.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(serialization, "HAS_ORJSON", request.param)
+    return request.param
+
+
+class TestSerialization:
+    """Test dumps/loads round-tripping."""
+
+    def test_round_trip(self, use_orjson):
+        """Test data survives a dumps/loads round trip."""
+        data = {"name": "test", "values": [1, 2.5, None, True], "nested": {"a": "b"}}
+
+        assert serialization.loads(serialization.dumps(data)) == data
+
+    def test_datetime_iso_format(self, use_orjson):
+        """Test datetimes are written as ISO 8601 strings."""
+        timestamp = datetime(2025, 1, 2, 3, 4, 5, 678901)
+
+        encoded = serialization.dumps({"timestamp": timestamp})
+
+        assert json.loads(encoded)["timestamp"] == timestamp.isoformat()
+
+    def test_indent(self, use_orjson):
+        """Test indented output matches stdlib two-space indentation."""
+        data = {"a": [1, 2]}
+
+        assert serialization.dumps(data, indent=True).decode() == json.dumps(data, indent=2)
+
+
+class TestYAMLSerialization:
+    """Test load_yaml/dump_yaml."""
+
+    def test_round_trip_preserves_key_order(self):
+        """Test data survives a round trip and sort_keys=False keeps order."""
+        data = {"system": "You are helpful", "temperature": 0.7, "stop_sequences": ["END"]}
+
+        dumped = serialization.dump_yaml(data, sort_keys=False)
+
+        assert serialization.load_yaml(dumped) == data
+        assert dumped.startswith("system:")
+
+    def test_load_rejects_unsafe_tags(self):
+        """Test the loader refuses arbitrary Python object tags."""
+        with pytest.raises(yaml.YAMLError):
+            serialization.load_yaml("!!python/object/apply:os.system ['true']")
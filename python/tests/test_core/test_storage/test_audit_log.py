@@ -0,0 +1,100 @@
+"""
+Tests for audit log storage.
+
+Copyright (c) 2025 Prompt Versioning Contributors
+Licensed under MIT License
+"""
+
+import json
+
+import pytest
+
+from prompt_versioning.core.storage import audit_log as audit_log_module
+from prompt_versioning.core.storage.audit_log import AuditLog
+
+
+@pytest.fixture
+def audit_log(tmp_path):
+    """Create an audit log in a temporary directory."""
+    return AuditLog(tmp_path / "audit.jsonl")
+
+
+class TestAuditLog:
+    """Test audit log writes and reads."""
+
+    def test_log_action_matches_entry_export(self, audit_log):
+        """Test logged actions are stored in the AuditLogEntry.to_dict() layout."""
+        audit_log.log_action("tag", "Created tag", commit_hash="abc", metadata={"k": 1})
+
+        (entry,) = audit_log.read_all()
+        stored = json.loads(audit_log.audit_file.read_text())
+
+        assert stored == entry.to_dict()
+        assert list(stored) == list(entry.to_dict())
+        assert entry.metadata == {"k": 1}
+
+
+class TestAuditLogBatch:
+    """Test batched audit writes."""
+
+    def test_entries_written_immediately_by_default(self, audit_log):
+        """Test each action is on disk as soon as it is logged."""
+        audit_log.log_action("commit", "first")
+
+        assert audit_log.audit_file.read_text().count("\n") == 1
+
+    def test_batch_writes_on_exit(self, audit_log):
+        """Test batched entries are buffered until the block exits."""
+        with audit_log.batch():
+            audit_log.log_action("commit", "first")
+            audit_log.log_action("tag", "second")
+            assert not audit_log.audit_file.exists()
+
+        assert [e.action for e in audit_log.read_all()] == ["commit", "tag"]
+
+    def test_batch_flushes_on_error(self, audit_log):
+        """Test buffered entries are kept when the block raises."""
+        with pytest.raises(RuntimeError):
+            with audit_log.batch():
+                audit_log.log_action("commit", "first")
+                raise RuntimeError("boom")
+
+        assert len(audit_log.read_all()) == 1
+
+    def test_read_inside_batch_sees_pending_entries(self, audit_log):
+        """Test reads flush pending entries first."""
+        with audit_log.batch():
+            audit_log.log_action("commit", "first")
+
+            assert len(audit_log.read_all()) == 1
+
+
+class TestAuditLogRotation:
+    """Test rotation of the active log into compressed segments."""
+
+    def test_rotated_entries_are_still_read(self, audit_log, monkeypatch):
+        """Test entries are read in order across segments and the active log."""
+        monkeypatch.setattr(audit_log_module, "ROTATE_SIZE", 200)
+
+        for i in range(10):
+            audit_log.log_action("commit", f"commit {i}")
+
+        segments = sorted(p.name for p in audit_log.audit_file.parent.glob("audit.*.jsonl.gz"))
+        assert segments
+        assert not list(audit_log.audit_file.parent.glob("audit.*.jsonl"))
+
+        expected = [f"commit {i}" for i in range(10)]
+        assert [e.message for e in audit_log.read_all()] == expected
+        assert [e.message for e in audit_log.iter_entries()] == expected
+
+    def test_interrupted_rotation_is_read(self, audit_log):
+        """Test an uncompressed segment left by an interrupted rotation is read first."""
+        audit_log.log_action("commit", "old")
+        audit_log.audit_file.rename(audit_log.audit_file.with_name("audit.1.jsonl"))
+        audit_log.log_action("commit", "new")
+
+        assert [e.message for e in audit_log.read_all()] == ["old", "new"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,144 @@
+"""
+Tests for commit storage.
+
+Copyright (c) 2025 Prompt Versioning Contributors
+Licensed under MIT License
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from prompt_versioning.core.models import PromptCommit
+from prompt_versioning.core.storage import commit_storage
+from prompt_versioning.core.storage.commit_storage import CommitStorage
+
+
+def make_commit(commit_hash: str) -> PromptCommit:
+    """Create a minimal commit with the given hash."""
+    return PromptCommit(hash=commit_hash, message="test", prompt_hash="p" * 16)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Create commit storage in a temporary directory."""
+    return CommitStorage(tmp_path)
+
+
+class TestFindByPrefix:
+    """Test short hash lookup."""
+
+    def test_unique_prefix(self, storage):
+        """Test a unique prefix resolves to the full hash."""
+        storage.save(make_commit("abcd000000000000"))
+        storage.save(make_commit("abce000000000000"))
+
+        assert storage.find_by_prefix("abcd") == "abcd000000000000"
+
+    def test_ambiguous_or_missing_prefix(self, storage):
+        """Test ambiguous and unknown prefixes return None."""
+        storage.save(make_commit("abcd000000000000"))
+        storage.save(make_commit("abce000000000000"))
+
+        assert storage.find_by_prefix("abc") is None
+        assert storage.find_by_prefix("ffff") is None
+
+    def test_sees_commits_from_other_instances(self, storage, tmp_path):
+        """Test the cached index picks up commits written by another process."""
+        storage.save(make_commit("abcd000000000000"))
+        assert storage.find_by_prefix("abcd") == "abcd000000000000"
+
+        CommitStorage(tmp_path).save(make_commit("1234000000000000"))
+
+        assert storage.find_by_prefix("1234") == "1234000000000000"
+
+
+class TestListAll:
+    """Test history ordering."""
+
+    def test_newest_first(self, storage):
+        """Test commits are listed newest first."""
+        for i, commit_hash in enumerate(["aaaa", "bbbb", "cccc"]):
+            commit = make_commit(commit_hash * 4)
+            commit.timestamp = datetime(2025, 1, 1 + i)
+            storage.save(commit)
+
+        assert storage.list_all() == ["cccc" * 4, "bbbb" * 4, "aaaa" * 4]
+
+    def test_indexes_commits_without_sidecar(self, storage, tmp_path):
+        """Test commits from before the sidecar index existed are still listed."""
+        old = make_commit("aaaa" * 4)
+        old.timestamp = datetime(2024, 1, 1)
+        (tmp_path / f"{old.hash}.json").write_text(old.model_dump_json())
+        new = make_commit("bbbb" * 4)
+        storage.save(new)
+
+        assert storage.list_all() == [new.hash, old.hash]
+        assert old.hash in storage.index_file.read_text()
+
+    def test_skips_index_entries_for_deleted_commits(self, storage, tmp_path):
+        """Test index entries without a commit file are ignored."""
+        storage.save(make_commit("aaaa" * 4))
+        storage.save(make_commit("bbbb" * 4))
+        (tmp_path / f"{'aaaa' * 4}.json").unlink()
+
+        assert storage.list_all() == ["bbbb" * 4]
+
+    def test_skips_torn_index_lines(self, storage):
+        """Test a partially written index line does not break listing."""
+        storage.save(make_commit("aaaa" * 4))
+        with open(storage.index_file, "ab") as f:
+            f.write(b'{"hash": "bbbb')
+
+        assert storage.list_all() == ["aaaa" * 4]
+
+    def test_lists_when_backfill_cannot_write(self, storage, tmp_path, monkeypatch):
+        """Test a read-only repository still lists commits missing from the index."""
+        old = make_commit("aaaa" * 4)
+        (tmp_path / f"{old.hash}.json").write_text(old.model_dump_json())
+
+        def read_only(timestamps):
+            raise PermissionError("read-only file system")
+
+        monkeypatch.setattr(storage, "_append_index", read_only)
+
+        assert storage.list_all() == [old.hash]
+
+
+class TestLoadCache:
+    """Test in-memory caching of parsed commits."""
+
+    def test_repeated_load_reuses_parsed_commit(self, storage):
+        """Test an unchanged commit file is parsed only once."""
+        storage.save(make_commit("abcd000000000000"))
+
+        with patch.object(commit_storage, "loads", wraps=commit_storage.loads) as loads:
+            first = storage.load("abcd000000000000")
+            second = storage.load("abcd000000000000")
+
+        assert loads.call_count == 0
+        assert first == second
+
+    def test_loaded_commit_changes_do_not_reach_cache(self, storage):
+        """Test callers get their own copy of a cached commit."""
+        storage.save(make_commit("abcd000000000000"))
+
+        storage.load("abcd000000000000").tags.append("production")
+
+        assert storage.load("abcd000000000000").tags == []
+
+    def test_rewritten_commit_is_reloaded(self, storage, tmp_path):
+        """Test a commit changed by another process is read again."""
+        storage.save(make_commit("abcd000000000000"))
+        storage.load("abcd000000000000")
+
+        tagged = make_commit("abcd000000000000")
+        tagged.tags.append("production")
+        CommitStorage(tmp_path).save(tagged)
+
+        assert storage.load("abcd000000000000").tags == ["production"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,85 @@
+"""
+Tests for file system storage helpers.
+
+Copyright (c) 2025 Prompt Versioning Contributors
+Licensed under MIT License
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from prompt_versioning.core.storage.filesystem import FileSystemManager, atomic_write
+
+
+class TestAtomicWrite:
+    """Test atomic_write."""
+
+    def test_replaces_existing_file(self, tmp_path):
+        """Test the target is replaced and no temporary file remains."""
+        target = tmp_path / "config.json"
+        target.write_text("old")
+
+        atomic_write(target, b"new")
+
+        assert target.read_bytes() == b"new"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failed_replace_keeps_original(self, tmp_path):
+        """Test an interrupted write leaves the original file untouched."""
+        target = tmp_path / "config.json"
+        target.write_text("old")
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                atomic_write(target, b"new")
+
+        assert target.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_concurrent_writers_use_separate_temp_files(self, tmp_path):
+        """Test threads writing the same file never share a temporary file."""
+        target = tmp_path / "HEAD"
+        payloads = [bytes([i]) * 4096 for i in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda data: [atomic_write(target, data) for _ in range(20)], payloads))
+
+        assert target.read_bytes() in payloads
+        assert list(tmp_path.iterdir()) == [target]
+
+
+class TestHead:
+    """Test HEAD reads and writes."""
+
+    def test_set_and_get_head(self, tmp_path):
+        """Test HEAD round-trips and is missing before init."""
+        fs = FileSystemManager(tmp_path)
+        assert fs.get_head() is None
+
+        fs.initialize()
+        assert fs.get_head() is None
+
+        fs.set_head("abcd000000000000")
+        assert fs.get_head() == "abcd000000000000"
+        assert not list(fs.prompt_vc_dir.glob(".HEAD.*"))
+
+
+class TestExists:
+    """Test repository existence checks."""
+
+    def test_positive_result_is_remembered(self, tmp_path):
+        """Test a missing repo is rechecked, while an existing one is not stat'ed again."""
+        fs = FileSystemManager(tmp_path)
+        assert not fs.exists()
+
+        fs.initialize()
+        assert fs.exists()
+
+        with patch("pathlib.Path.exists", side_effect=AssertionError("stat")):
+            assert fs.exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
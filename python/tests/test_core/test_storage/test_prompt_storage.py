@@ -0,0 +1,39 @@
+"""
+Tests for prompt storage.
+
+Copyright (c) 2025 Prompt Versioning Contributors
+Licensed under MIT License
+"""
+
+import pytest
+
+from prompt_versioning.core.models import Prompt
+from prompt_versioning.core.storage.prompt_storage import PromptStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Create prompt storage in a temporary directory."""
+    return PromptStorage(tmp_path)
+
+
+class TestLoadCache:
+    """Test in-memory caching of parsed prompts."""
+
+    def test_loaded_prompt_changes_do_not_reach_cache(self, storage):
+        """Test nested fields of a loaded prompt are not shared with the cache."""
+        prompt_hash = storage.save(
+            Prompt(system="Hi", stop_sequences=["END"], variables={"name": "World"})
+        )
+
+        loaded = storage.load(prompt_hash)
+        loaded.stop_sequences.append("STOP")
+        loaded.variables["name"] = "Changed"
+
+        cached = storage.load(prompt_hash)
+        assert cached.stop_sequences == ["END"]
+        assert cached.variables == {"name": "World"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -5,8 +5,16 @@ Copyright (c) 2025 Prompt Versioning Contributors
 Licensed under MIT License
 """
 
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+from unittest.mock import patch
+
 import pytest
 
+from prompt_versioning.mcp.handlers import command_helper, execute_command, help_checker
 from prompt_versioning.mcp.handlers.command_helper import CommandFlag, CommandHelper, CommandInfo
 from prompt_versioning.mcp.handlers.execute_command import handle_execute_command
 
@@ -135,6 +143,21 @@ Commands:
         cmd = helper.build_command("log", args, command_info)
         assert "--verbose" not in cmd
 
+    def test_build_command_matches_dashed_keys(self):
+        """Test parameter keys match flags with either underscores or dashes."""
+        helper = CommandHelper("promptvc")
+        command_info = helper.parse_help_output(
+            "Usage: promptvc log [OPTIONS]\n\nOptions:\n  -n, --max-count INTEGER  Limit\n"
+        )
+
+        assert helper.build_command("log", {"max-count": 3}, command_info) == [
+            "promptvc",
+            "log",
+            "--max-count",
+            "3",
+        ]
+        assert helper.build_command("log", {"max_count": 3}, command_info)[2] == "--max-count"
+
     def test_build_command_without_command_info(self):
         """Test building command without pre-parsed command info."""
         helper = CommandHelper("promptvc")
@@ -147,6 +170,55 @@ Commands:
         assert cmd[0] == "promptvc"
         assert cmd[1] == "commit"
 
+    def test_help_is_cached_per_subcommand(self):
+        """Test --help is only spawned once per subcommand."""
+        help_text = "Usage: promptvc commit [OPTIONS]\n\nOptions:\n  -m, --message TEXT  Msg\n"
+        command_helper._run_help.cache_clear()
+        command_helper._command_info.cache_clear()
+
+        with patch("subprocess.run") as run:
+            run.return_value = subprocess.CompletedProcess([], 0, stdout=help_text, stderr="")
+            helper = CommandHelper("promptvc-test")
+
+            first = helper.get_command_info("commit")
+            second = CommandHelper("promptvc-test").get_command_info("commit")
+
+        assert first is second
+        assert [f.name for f in first.flags] == ["message"]
+        assert run.call_count == 1
+
+    def test_promptvc_help_rendered_in_process(self):
+        """Test promptvc help comes from the Click commands without a subprocess."""
+        command_helper._run_help.cache_clear()
+
+        with patch("subprocess.run") as run:
+            help_text = CommandHelper("promptvc").get_help("commit")
+
+            with pytest.raises(subprocess.CalledProcessError):
+                CommandHelper("promptvc").get_help("no-such-command")
+
+        assert help_text.startswith("Usage: promptvc commit [OPTIONS]")
+        assert "--message" in help_text
+        run.assert_not_called()
+
+    def test_check_command_help_is_cached(self, monkeypatch):
+        """Test help checks reuse the cached help text but return fresh dicts."""
+        help_text = "Usage: promptvc log [OPTIONS]\n\nOptions:\n  -n, --max-count INTEGER\n"
+        command_helper._run_help.cache_clear()
+        monkeypatch.setattr(help_checker, "_helper", CommandHelper("promptvc-test"))
+
+        with patch("subprocess.run") as run:
+            run.return_value = subprocess.CompletedProcess([], 0, stdout=help_text, stderr="")
+
+            first = help_checker.check_command_help("log")
+            help_checker.warm_help_cache(["log"]).join()
+            second = help_checker.check_command_help("log")
+
+        assert first == second
+        assert first is not second
+        assert first["options_preview"] == ["  -n, --max-count INTEGER"]
+        assert run.call_count == 1
+
 
 class TestExecuteCommandHandler:
     """Tests for execute command handler."""
@@ -216,6 +288,125 @@ class TestExecuteCommandHandler:
 
         assert "Executing:" in display or "executing" in display.lower()
 
+    @pytest.mark.asyncio
+    async def test_run_captures_output(self):
+        """Test commands run on the event loop capture decoded output."""
+        returncode, stdout, stderr = await execute_command._run(
+            [sys.executable, "-c", "import sys; print('out'); sys.exit(3)"]
+        )
+
+        assert (returncode, stdout.strip(), stderr) == (3, "out", "")
+
+    @pytest.mark.asyncio
+    async def test_run_kills_command_on_timeout(self, monkeypatch):
+        """Test a command exceeding the timeout is killed."""
+        monkeypatch.setattr(execute_command, "COMMAND_TIMEOUT", 0.1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await execute_command._run([sys.executable, "-c", "import time; time.sleep(10)"])
+
+    @pytest.mark.asyncio
+    async def test_command_built_off_event_loop(self, monkeypatch):
+        """Test building the command (which may spawn --help) runs in a worker thread."""
+        threads = []
+
+        def build_command(command, parameters, command_info=None):
+            threads.append(threading.get_ident())
+            return ["promptvc", command]
+
+        async def run(cmd_parts, stdin=None, timeout=None):
+            return 0, "", ""
+
+        monkeypatch.setattr(execute_command._helper, "build_command", build_command)
+        monkeypatch.setattr(execute_command, "_run", run)
+
+        result = await handle_execute_command(None, {"command": "status"})
+
+        assert result["success"] is True
+        assert threads and threads[0] != threading.get_ident()
+
+
+class TestExecuteBatchHandler:
+    """Tests for batched command execution."""
+
+    @pytest.mark.asyncio
+    async def test_batch_requires_commands(self):
+        """Test a batch without commands is rejected."""
+        result = await execute_command.handle_execute_batch(None, {"inputs": [{}]})
+
+        assert result["success"] is False
+        assert result["results"] == []
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_commands_in_order(self, tmp_path, monkeypatch):
+        """Test each command's output and exit code are reported separately."""
+        monkeypatch.chdir(tmp_path)
+
+        result = await execute_command.handle_execute_batch(
+            None, {"inputs": [{"command": "init"}, {"command": "status"}, {"command": "bogus"}]}
+        )
+
+        init, status, bogus = result["results"]
+        assert init["success"] and "Initialized" in init["stdout"]
+        assert status["success"] and "No commits yet" in status["stdout"]
+        assert bogus["returncode"] == 2 and "No such command" in bogus["stderr"]
+        assert result["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_batch_captures_binary_output(self, tmp_path, monkeypatch):
+        """Test commands that echo bytes, such as audit, are captured too."""
+        monkeypatch.chdir(tmp_path)
+
+        result = await execute_command.handle_execute_batch(
+            None,
+            {
+                "inputs": [
+                    {"command": "init"},
+                    {"command": "audit", "parameters": {"format": "json"}},
+                    {"command": "audit", "parameters": {"format": "csv"}},
+                ]
+            },
+        )
+
+        _, audit_json, audit_csv = result["results"]
+        assert result["success"] is True
+        assert json.loads(audit_json["stdout"])[0]["action"] == "init"
+        assert audit_csv["stdout"].startswith("timestamp,action,")
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_in_middle_keeps_later_results(self, tmp_path, monkeypatch):
+        """Test a failing command does not drop or shift the results after it."""
+        monkeypatch.chdir(tmp_path)
+
+        result = await execute_command.handle_execute_batch(
+            None, {"inputs": [{"command": "init"}, {"command": "bogus"}, {"command": "status"}]}
+        )
+
+        assert [r["command"] for r in result["results"]] == [
+            "promptvc init",
+            "promptvc bogus",
+            "promptvc status",
+        ]
+        assert [r["success"] for r in result["results"]] == [True, False, True]
+        assert result["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_missing_results(self, monkeypatch):
+        """Test a worker returning fewer results than commands is an error."""
+
+        async def run(cmd_parts, stdin=None, timeout=None):
+            return 0, '[[0, "", ""]]', ""
+
+        monkeypatch.setattr(execute_command, "_run", run)
+
+        result = await execute_command.handle_execute_batch(
+            None, {"inputs": [{"command": "status"}, {"command": "log"}]}
+        )
+
+        assert result["success"] is False
+        assert result["results"] == []
+        assert "1 results for 2 commands" in result["error"]
+
 
 class TestCommandHelperIntegration:
     """Integration tests for command helper."""